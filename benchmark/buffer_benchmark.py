@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Compare inserting records one statement at a time with writing them through
+a write buffer, on a SQLite database file.
+
+Usage: ``python benchmark/buffer_benchmark.py [count]``
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from pydbc.buffer import WriteBuffer
+from pydbc.dml import Insert
+from pydbc.dialect import SQLiteDialect
+from pydbc import Executor, ValueTypes
+
+COLUMNS = (("id", ValueTypes.INTEGER), ("name", ValueTypes.STRING),
+           ("payload", ValueTypes.BINARY))
+
+
+def create_executor(path):
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS event "
+        "(id INTEGER, name TEXT, payload BLOB)")
+    connection.commit()
+    return Executor(connection, SQLiteDialect())
+
+
+def events(count):
+    for i in range(count):
+        yield (i, "event%d" % i, "\x00" * 64)
+
+
+def insert_each(executor, count):
+    for values in events(count):
+        insert = Insert()
+        insert.set_table("event")
+        for column_name, column_type in COLUMNS:
+            insert.add_column(column_name, column_type)
+        insert.add_row(values)
+        executor.execute(insert).close()
+        executor.get_connection().commit()
+
+
+def insert_buffered(executor, count, executemany):
+    with WriteBuffer(executor, executemany=executemany,
+                     commit=True) as writer:
+        for values in events(count):
+            writer.insert("event", COLUMNS, values)
+
+
+def run(count=5000):
+    cases = (
+        ("statement per event", lambda e: insert_each(e, count)),
+        ("buffer executemany", lambda e: insert_buffered(e, count, True)),
+        ("buffer multi-row", lambda e: insert_buffered(e, count, False)),
+    )
+    temp_dir = tempfile.mkdtemp()
+    try:
+        print "%-22s %10s %12s" % ("case", "time(s)", "rows/s")
+        for index, (name, case) in enumerate(cases):
+            executor = create_executor(
+                os.path.join(temp_dir, "bench%d.db" % index))
+            start = time.time()
+            case(executor)
+            elapsed = time.time() - start
+            executor.get_connection().close()
+            print "%-22s %10.3f %12.0f" % (name, elapsed, count / elapsed)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]])
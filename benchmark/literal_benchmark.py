@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Compare rendering large lists of values as SQL literals one by one with the
+single pass of :meth:`pydbc.dialect.LiteralRenderer.render_list`.
+
+Usage: ``python benchmark/literal_benchmark.py [count] [repeat]``
+"""
+
+import sys
+import timeit
+
+from pydbc.dialect import LiteralRenderer
+from pydbc import ValueTypes
+
+
+def run(count=100000, repeat=10):
+    cases = (
+        ("integers", ValueTypes.INTEGER, range(count)),
+        ("strings", ValueTypes.STRING,
+         ["name%d" % i for i in range(count)]),
+        ("quoted strings", ValueTypes.STRING,
+         ["it's %d" % i for i in range(count)]),
+    )
+    renderers = (
+        ("standard", LiteralRenderer()),
+        ("backslash", LiteralRenderer(backslash_escapes=True)),
+    )
+    print "%-16s %-10s %12s %12s %8s" % (
+        "values", "renderer", "each(ms)", "list(ms)", "speedup")
+    for name, value_type, values in cases:
+        for renderer_name, renderer in renderers:
+            def render_each():
+                return ", ".join([renderer.render(value, value_type)
+                                  for value in values])
+
+            def render_list():
+                return renderer.render_list(values, value_type)
+
+            assert render_each() == render_list()
+            each_time = min(timeit.repeat(render_each, number=1,
+                                          repeat=repeat))
+            list_time = min(timeit.repeat(render_list, number=1,
+                                          repeat=repeat))
+            print "%-16s %-10s %12.2f %12.2f %7.1fx" % (
+                name, renderer_name, each_time * 1000, list_time * 1000,
+                each_time / list_time)
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]])
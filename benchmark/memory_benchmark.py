@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Measure the peak and retained memory of building huge statements, and of
+rendering them by ``to_sql``, compiling them with bind parameters, or writing
+them to a file in pieces by ``write_sql``, and compare the results with a
+stored baseline. Each case runs in a fresh interpreter.
+
+Memory is traced by ``tracemalloc`` where available. Other interpreters,
+like CPython 2.7, fall back to the resident set size of the process, which
+also counts memory of the allocator not returned to the system. Baselines
+are kept by method.
+
+Usage: ``python benchmark/memory_benchmark.py [--update-baseline]``
+"""
+
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+
+from pydbc.dml import Insert, JoinedTables, Where, Select
+from pydbc.dialect import Dialect
+from pydbc.render import SQLWriter
+from pydbc import ValueTypes, CompareTypes
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "memory_baseline.json")
+# Ratio to the baseline reported as a regression
+TOLERANCE = 1.1
+PHASES = ("build", "to_sql", "compile", "write_sql")
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def create_select(where):
+    tables = JoinedTables()
+    tables.add_table("orders")
+    select = Select()
+    select.set_tables(tables)
+    select.add_column("id")
+    select.set_where(where)
+    return select
+
+
+def build_in_list(count=100000):
+    where = Where()
+    where.add_column("id", range(count), column_type=ValueTypes.INTEGER,
+                     compare_type=CompareTypes.IN)
+    return create_select(where)
+
+
+def build_predicates(count=50000):
+    where = Where()
+    for i in range(count):
+        where.add_column("total", i, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.GREATER_THAN)
+    return create_select(where)
+
+
+def build_insert(count=20000):
+    insert = Insert()
+    insert.set_table("event")
+    insert.add_column("id", ValueTypes.INTEGER)
+    insert.add_column("name")
+    insert.add_column("payload")
+    for i in range(count):
+        insert.add_row([i, "event%d" % i, "x" * 100])
+    return insert
+
+
+CASES = (
+    ("in list 100k", build_in_list),
+    ("where 50k", build_predicates),
+    ("insert 20k rows", build_insert),
+)
+
+
+def get_method():
+    return "tracemalloc" if tracemalloc is not None else "rss"
+
+
+def get_memory():
+    """
+    Get the current and peak memory in bytes.
+    """
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()
+    with open("/proc/self/statm") as statm:
+        current = int(statm.read().split()[1]) * resource.getpagesize()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return current, peak
+
+
+def measure(case, phase):
+    """
+    Measure a phase of a case in this interpreter, returning the peak and
+    retained memory in bytes. Phases after `build` include building.
+    """
+    build = dict(CASES)[case]
+    dialect = Dialect()
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+    start = get_memory()[0]
+    statement = build()
+    if phase == "to_sql":
+        result = statement.to_sql(dialect)
+    elif phase == "compile":
+        result = dialect.compile(statement)
+    elif phase == "write_sql":
+        with open(os.devnull, "wb") as null_file:
+            with SQLWriter(null_file) as writer:
+                statement.write_sql(writer, dialect)
+    gc.collect()
+    current, peak = get_memory()
+    return max(peak - start, 0), max(current - start, 0)
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_FILE) as baseline_file:
+            return json.load(baseline_file)
+    except IOError:
+        return {}
+
+
+def run(update_baseline=False):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [root] + [path for path in [env.get("PYTHONPATH")] if path])
+    method = get_method()
+    baselines = load_baseline()
+    baseline = baselines.get(method, {})
+    results = {}
+    regressions = 0
+    print "method: %s" % method
+    print "%-16s %-8s %10s %10s %10s %10s" % (
+        "case", "phase", "peak(KB)", "kept(KB)", "peak/base", "kept/base")
+    for case, build in CASES:
+        for phase in PHASES:
+            output = subprocess.check_output(
+                [sys.executable, os.path.abspath(__file__), "--measure",
+                 case, phase], env=env)
+            peak, retained = [int(value) for value in output.split()]
+            key = "%s/%s" % (case, phase)
+            results[key] = [peak, retained]
+            ratios = ["%10s" % "-"] * 2
+            mark = ""
+            if key in baseline:
+                values = [peak, retained]
+                for i, base in enumerate(baseline[key]):
+                    ratio = float(values[i]) / base if base else 1.0
+                    ratios[i] = "%10.2f" % ratio
+                    if ratio > TOLERANCE:
+                        mark = "  REGRESSION"
+                if mark:
+                    regressions += 1
+            print "%-16s %-8s %10d %10d %s %s%s" % (
+                case, phase, peak / 1024, retained / 1024, ratios[0],
+                ratios[1], mark)
+    if update_baseline:
+        baselines[method] = results
+        with open(BASELINE_FILE, "w") as baseline_file:
+            json.dump(baselines, baseline_file, indent=2, sort_keys=True,
+                      separators=(",", ": "))
+            baseline_file.write("\n")
+        print "baseline of %s updated" % method
+    return regressions
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        print "%d %d" % measure(sys.argv[2], sys.argv[3])
+    else:
+        sys.exit(1 if run("--update-baseline" in sys.argv[1:]) else 0)
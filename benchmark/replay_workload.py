@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Replay a workload recorded by WorkloadRecorder against a SQLite database
+file, and print the throughput, latency percentiles and errors by statement
+fingerprint.
+
+Usage: ``python benchmark/replay_workload.py workload database [speed]
+[concurrency]``
+"""
+
+import sqlite3
+import sys
+
+from pydbc.dialect import SQLiteDialect
+from pydbc.workload import WorkloadReplayer
+
+
+def run(workload, database, speed=1.0, concurrency=1):
+    replayer = WorkloadReplayer(
+        lambda: sqlite3.connect(database, timeout=60), SQLiteDialect(),
+        speed=speed, concurrency=concurrency)
+    report = replayer.replay(workload)
+    print "%d statements, %d errors in %.3f s, %.1f statements/s" % (
+        report["statements"], report["errors"], report["seconds"],
+        report["statements_per_second"])
+    print "%-16s %8s %8s %10s %10s %10s %10s  %s" % (
+        "fingerprint", "count", "errors", "p50(ms)", "p95(ms)", "p99(ms)",
+        "max(ms)", "sql")
+    items = sorted(report["fingerprints"].items(),
+                   key=lambda item: -item[1]["count"])
+    for fingerprint, item in items:
+        print "%-16s %8d %8d %10.3f %10.3f %10.3f %10.3f  %s" % (
+            fingerprint, item["count"], item["errors"], item["p50"] * 1000,
+            item["p95"] * 1000, item["p99"] * 1000, item["max"] * 1000,
+            item["sql"][:60])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print "Usage: replay_workload.py workload database [speed] " \
+            "[concurrency]"
+        sys.exit(1)
+    run(sys.argv[1], sys.argv[2], *[float(arg) for arg in sys.argv[3:4]] +
+        [int(arg) for arg in sys.argv[4:5]])
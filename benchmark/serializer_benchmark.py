@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Compare the size and speed of :class:`pydbc.serializer.Serializer` with
+pickle for shipping statements between processes.
+
+Usage: ``python benchmark/serializer_benchmark.py [repeat]``
+"""
+
+import sys
+import timeit
+import cPickle as pickle
+
+from pydbc.dml import Column, JoinedConditions, JoinedTables, Where, Select
+from pydbc.serializer import Serializer
+from pydbc import ValueTypes, CompareTypes, AggregateFunctions, JoinTypes
+
+
+def create_select(predicates):
+    """
+    Create a joined statement with the given number of predicates.
+    """
+    tables = JoinedTables()
+    tables.add_table("orders", "o")
+    condition = JoinedConditions()
+    column_1 = Column("customer_id")
+    column_1.table = "o"
+    column_2 = Column("id")
+    column_2.table = "c"
+    condition.add_condition(column_1, column_2)
+    tables.add_table("customers", "c", join=JoinTypes.LEFT_JOIN,
+                     condition=condition)
+    select = Select()
+    select.set_tables(tables)
+    for name in ("id", "status", "created", "total"):
+        select.add_column(name, "o")
+    select.add_column("amount", "o", AggregateFunctions.SUM, "amount")
+    where = Where()
+    for i in range(predicates):
+        where.add_column("total", i, "o", ValueTypes.INTEGER,
+                         CompareTypes.GREATER_THAN)
+        where.add_column("status", "open", "o")
+    select.set_where(where)
+    return select
+
+
+def run(repeat=1000):
+    print "%-12s %10s %10s %10s %10s" % (
+        "predicates", "codec", "bytes", "dumps(us)", "loads(us)")
+    for predicates in (1, 10, 100):
+        select = create_select(predicates)
+        codecs = (
+            ("pickle", lambda s: pickle.dumps(s, pickle.HIGHEST_PROTOCOL),
+             pickle.loads),
+            ("pydbc", Serializer.dumps, Serializer.loads),
+        )
+        for name, dumps, loads in codecs:
+            data = dumps(select)
+            dump_time = min(timeit.repeat(
+                lambda: dumps(select), number=repeat, repeat=3))
+            load_time = min(timeit.repeat(
+                lambda: loads(data), number=repeat, repeat=3))
+            print "%-12d %10s %10d %10.1f %10.1f" % (
+                predicates, name, len(data), dump_time * 1e6 / repeat,
+                load_time * 1e6 / repeat)
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]])
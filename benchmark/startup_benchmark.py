@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+"""
+Measure the import time and the modules loaded by common ways of starting to
+use PyDBC. Each case runs in a fresh interpreter.
+
+Usage: ``python benchmark/startup_benchmark.py [repeat]``
+"""
+
+import os
+import subprocess
+import sys
+
+CASES = (
+    ("import pydbc", "import pydbc"),
+    ("dialect by name",
+     "import pydbc; pydbc.DialectRegistry.create('generic')"),
+    ("import dml", "from pydbc.dml import Select"),
+    ("package attributes", "from pydbc import Dialect, SQLTypes, dml"),
+)
+
+SCRIPT = """
+import sys, time
+before = set(sys.modules)
+start = time.time()
+%s
+elapsed = time.time() - start
+loaded = [name for name in set(sys.modules) - before
+          if sys.modules[name] is not None]
+print elapsed, len(loaded), len([n for n in loaded if n.startswith("pydbc")])
+"""
+
+
+def run(repeat=20):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [root] + [path for path in [env.get("PYTHONPATH")] if path])
+    print "%-20s %10s %10s %10s" % ("case", "time(ms)", "modules", "pydbc")
+    for name, code in CASES:
+        results = []
+        for i in range(repeat):
+            output = subprocess.check_output(
+                [sys.executable, "-S", "-c", SCRIPT % code], env=env)
+            results.append([float(value) for value in output.split()])
+        elapsed = min([result[0] for result in results])
+        print "%-20s %10.3f %10d %10d" % (
+            name, elapsed * 1000, results[0][1], results[0][2])
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]])
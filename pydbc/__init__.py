@@ -14,15 +14,84 @@
 
 __author__ = "huhamhire <me@huhamhire.com>"
 
-__all__ = ["dml", "Dialect", "SQLUtils",
-           "SQLTypes", "CompareTypes", "RelationTypes", "AggregateFunctions",
-           "JoinTypes", "ValueTypes"]
-
-import dml
-
-from .dialect import Dialect
-from .sqlutils import SQLUtils
-from .constants import (
-    SQLTypes, CompareTypes, RelationTypes, AggregateFunctions, JoinTypes,
-    ValueTypes
-)
+__all__ = ["ddl", "dml", "Dialect", "DialectRegistry", "Executor",
+           "KeyLoader", "LOBStream", "Reflector", "StatementBatch",
+           "WriteBuffer", "SQLUtils", "SQLTypes", "CompareTypes",
+           "RelationTypes", "AggregateFunctions", "JoinTypes", "ValueTypes"]
+
+import importlib
+import sys
+from types import ModuleType
+
+# Attributes of the package are imported on first access, so that tools only
+# using a part of the package do not pay for importing all of the modules.
+_lazy_attributes = {
+    "batch": (".batch", None),
+    "buffer": (".buffer", None),
+    "columnar": (".columnar", None),
+    "constants": (".constants", None),
+    "ddl": (".ddl", None),
+    "dialect": (".dialect", None),
+    "dml": (".dml", None),
+    "executor": (".executor", None),
+    "export": (".export", None),
+    "fileutils": (".fileutils", None),
+    "lob": (".lob", None),
+    "loader": (".loader", None),
+    "metrics": (".metrics", None),
+    "optimizer": (".optimizer", None),
+    "parser": (".parser", None),
+    "reflection": (".reflection", None),
+    "render": (".render", None),
+    "row": (".row", None),
+    "serializer": (".serializer", None),
+    "single_flight": (".single_flight", None),
+    "slow_query": (".slow_query", None),
+    "sqlutils": (".sqlutils", None),
+    "statement_cache": (".statement_cache", None),
+    "workload": (".workload", None),
+    "Dialect": (".dialect", "Dialect"),
+    "Executor": (".executor", "Executor"),
+    "KeyLoader": (".loader", "KeyLoader"),
+    "LOBStream": (".lob", "LOBStream"),
+    "Reflector": (".reflection", "Reflector"),
+    "StatementBatch": (".batch", "StatementBatch"),
+    "WriteBuffer": (".buffer", "WriteBuffer"),
+    "DialectRegistry": (".dialect", "DialectRegistry"),
+    "SQLUtils": (".sqlutils", "SQLUtils"),
+    "SQLTypes": (".constants", "SQLTypes"),
+    "CompareTypes": (".constants", "CompareTypes"),
+    "RelationTypes": (".constants", "RelationTypes"),
+    "AggregateFunctions": (".constants", "AggregateFunctions"),
+    "JoinTypes": (".constants", "JoinTypes"),
+    "ValueTypes": (".constants", "ValueTypes"),
+}
+
+
+class _LazyModule(ModuleType):
+    """
+    Package module importing its attributes on first access, as listed by
+    the `_lazy_attributes` of the package.
+    """
+
+    def __getattr__(self, name):
+        try:
+            module_name, attribute = self.__dict__["_lazy_attributes"][name]
+        except KeyError:
+            raise AttributeError("'module' object has no attribute '%s'" %
+                                 name)
+        module = importlib.import_module(module_name, self.__name__)
+        value = module if attribute is None else getattr(module, attribute)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) |
+                      set(self.__dict__["_lazy_attributes"]))
+
+
+_module = _LazyModule(__name__)
+_module.__dict__.update(globals())
+# Keep the original module alive, as its globals are used by _LazyModule
+_module.__dict__["_origin"] = sys.modules[__name__]
+sys.modules[__name__] = _module
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Statement Batches
+=================
+StatementBatch
+--------------
+.. autoclass:: pydbc.batch.StatementBatch
+    :members:
+"""
+
+from .dialect import BindingDialect
+from .dml import Select
+from .sqlutils import SQLUtils
+
+
+class StatementBatch(object):
+    """
+    Execute several independent statements with as few round trips to the
+    database as possible::
+
+        batch = StatementBatch(executor)
+        batch.add(select_users)
+        batch.add(select_orders)
+        users, orders = batch.execute()
+
+    If the driver of the dialect returns multiple result sets, the statements
+    are sent in one call separated by `;`. Otherwise compatible `SELECT`
+    statements are combined by `UNION ALL` with a discriminator column, and
+    the records are split back per statement. Selects could be combined if:
+
+    * they list their columns explicitly, without `*`,
+    * they are not sorted by `ORDER BY`, since a union does not keep the
+      order of its parts,
+    * their result columns have distinct names, since each select is wrapped
+      as a derived table, and most databases other than SQLite reject
+      derived tables with duplicate column names,
+    * their columns have the same types, which is assumed for selects of the
+      same columns from the same tables, unless the dialect allows different
+      types in a union.
+
+    Other statements are executed one by one. The statements should be
+    independent of each other, since the order of execution is not kept.
+
+    :ivar Executor _executor: Executor of the statements.
+    :ivar list _statements: Statements to be executed.
+    """
+    _batch_column = "_batch"
+    _batch_table = "_batch_t"
+
+    def __init__(self, executor):
+        """
+        Initialize a `StatementBatch` object.
+
+        :param executor: Executor of the statements.
+        :type executor: Executor
+        """
+        self._executor = executor
+        self._statements = []
+
+    def add(self, statement):
+        """
+        Add a statement to the batch.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :return: Index of the result of the statement.
+        :rtype: int
+        """
+        self._statements.append(statement)
+        return len(self._statements) - 1
+
+    def get_statements(self):
+        """
+        Get the statements in the batch.
+
+        :return: List of statements.
+        :rtype: list
+        """
+        return self._statements
+
+    def execute(self):
+        """
+        Execute the statements in the batch, and clear the batch.
+
+        :return: Results in the order of the statements. Each result is a list
+            of records, or `None` for statements without result.
+        :rtype: list
+        """
+        statements = self._statements
+        self._statements = []
+        if not statements:
+            return []
+        if self._executor.get_dialect().multi_statements:
+            return self._execute_multiple(statements)
+        results = [None] * len(statements)
+        groups = {}
+        for index, statement in enumerate(statements):
+            key = self._get_union_key(statement)
+            if key is None:
+                results[index] = self._execute_single(statement)
+            else:
+                groups.setdefault(key, []).append(index)
+        for indexes in groups.values():
+            if len(indexes) == 1:
+                results[indexes[0]] = self._execute_single(
+                    statements[indexes[0]])
+                continue
+            for part, sql_list, params in self._split_group(statements,
+                                                            indexes):
+                if len(part) == 1:
+                    results[part[0]] = self._execute_single(
+                        statements[part[0]])
+                else:
+                    self._execute_union(statements, part, sql_list, params,
+                                        results)
+        return results
+
+    def _execute_single(self, statement):
+        cursor = self._executor.execute(statement)
+        try:
+            if cursor.description is None:
+                return None
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _execute_multiple(self, statements):
+        dialect = self._executor.get_dialect()
+        binding = BindingDialect(dialect)
+        sql = "; ".join([statement.to_sql(binding)
+                         for statement in statements])
+        cursor = self._executor.execute_sql(sql, binding.get_params())
+        try:
+            results = []
+            for index in range(len(statements)):
+                if index > 0:
+                    cursor.nextset()
+                if cursor.description is None:
+                    results.append(None)
+                else:
+                    results.append(cursor.fetchall())
+            return results
+        finally:
+            cursor.close()
+
+    def _get_union_key(self, statement):
+        """
+        Get the key of selects which could be combined with the statement.
+
+        :return: Key of the group, or `None` if the statement could not be
+            combined.
+        :rtype: object
+        """
+        if not isinstance(statement, Select) or statement.get_raw_sql():
+            return None
+        if statement.get_order_by() is not None:
+            return None
+        columns = statement.get_columns()
+        if not columns:
+            return None
+        shape = []
+        column_names = set()
+        for column in columns:
+            if column.name == "*" or column.get_raw_sql():
+                return None
+            name = column.alias
+            if name is None:
+                name = column.name if column.func is None \
+                    else (column.func, column.name)
+            if isinstance(name, basestring):
+                name = name.lower()
+            if name in column_names:
+                # Duplicate names are rejected in derived tables
+                return None
+            column_names.add(name)
+            shape.append((column.table, column.name, column.func))
+        if self._executor.get_dialect().dynamic_union_types:
+            return True
+        tables = statement.get_tables()
+        if tables is None:
+            return None
+        names = []
+        for table in tables.get_tables():
+            if table.name is None:
+                # Types of result tables are not known
+                return None
+            names.append((table.name, table.alias))
+        return tuple(shape), tuple(names)
+
+    def _split_group(self, statements, indexes):
+        """
+        Split a group of selects into unions within the limits of the
+        dialect, rendering each select with bind parameters once.
+
+        :return: List of tuples of the indexes of the selects in a union,
+            their SQL statements, and their parameters.
+        :rtype: list
+        """
+        dialect = self._executor.get_dialect()
+        max_selects = dialect.max_union_selects
+        max_parameters = dialect.max_parameters
+        parts = []
+        part = None
+        param_count = 0
+        for index in indexes:
+            if part is None or max_selects is not None and \
+                    len(part[0]) >= max_selects:
+                part = ([], [], [])
+                parts.append(part)
+                param_count = 0
+            binding = BindingDialect(dialect, offset=param_count)
+            sql = statements[index].to_sql(binding)
+            params = binding.get_params()
+            if part[0] and max_parameters is not None and \
+                    param_count + len(params) > max_parameters:
+                part = ([], [], [])
+                parts.append(part)
+                param_count = 0
+                # Placeholders are numbered from the start of the union
+                binding = BindingDialect(dialect)
+                sql = statements[index].to_sql(binding)
+                params = binding.get_params()
+            part[0].append(index)
+            part[1].append(sql)
+            part[2].append(params)
+            param_count += len(params)
+        return parts
+
+    def _execute_union(self, statements, indexes, sql_list, params_list,
+                       results):
+        dialect = self._executor.get_dialect()
+        if params_list and isinstance(params_list[0], dict):
+            params = {}
+            for item in params_list:
+                params.update(item)
+        else:
+            params = []
+            for item in params_list:
+                params.extend(item)
+        width = max([len(statements[index].get_columns())
+                     for index in indexes])
+        as_keyword = SQLUtils.get_sql_as_keyword()
+        table = dialect.table2sql(self._batch_table)
+        sql_buffer = []
+        for position, index in enumerate(indexes):
+            statement = statements[index]
+            padding = width - len(statement.get_columns())
+            if position > 0:
+                sql_buffer.append(" UNION ALL ")
+            sql_buffer.extend([
+                "SELECT ", str(position), as_keyword,
+                dialect.column2sql(self._batch_column), ", ", table, ".*",
+                ", NULL" * padding, " FROM (", sql_list[position], ")",
+                as_keyword, table])
+        rows = self._executor.fetch_sql("".join(sql_buffer), params)
+        parts = [[] for _ in indexes]
+        for row in rows:
+            parts[row[0]].append(row[1:])
+        for position, index in enumerate(indexes):
+            count = len(statements[index].get_columns())
+            results[index] = [tuple(row[:count]) for row in parts[position]]
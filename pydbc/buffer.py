@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Write Buffers
+=============
+WriteBuffer
+-----------
+.. autoclass:: pydbc.buffer.WriteBuffer
+    :members:
+
+BufferFullError
+---------------
+.. autoclass:: pydbc.buffer.BufferFullError
+    :members:
+
+BufferClosedError
+-----------------
+.. autoclass:: pydbc.buffer.BufferClosedError
+    :members:
+"""
+
+import threading
+import time
+
+from .constants import ValueTypes
+from .dialect import BindingDialect
+from .dml import Insert, UnsupportedValueError
+
+
+class BufferFullError(RuntimeError):
+    """
+    The error raised if a write buffer is full, since the buffered records
+    could not be written.
+    """
+
+    def __init__(self):
+        """
+        Initialize BufferFullError.
+        """
+        msg = "Write buffer is full!"
+        super(BufferFullError, self).__init__(msg)
+
+
+class BufferClosedError(RuntimeError):
+    """
+    The error raised if records are added to a closed write buffer.
+    """
+
+    def __init__(self):
+        """
+        Initialize BufferClosedError.
+        """
+        msg = "Write buffer is closed!"
+        super(BufferClosedError, self).__init__(msg)
+
+
+class WriteBuffer(object):
+    """
+    Accumulate records to be inserted, and write them in batches.
+
+    Records are grouped by target table and columns. A group is written when
+    it reaches `max_rows` records, when the buffer holds `max_bytes` of data,
+    or when its oldest record waited for `max_latency` seconds::
+
+        with WriteBuffer(executor, max_latency=0.5) as writer:
+            for event in events:
+                writer.insert("event", columns, event)
+
+    Buffers do not run background threads, so waiting records are checked on
+    each insert and by :meth:`poll`, which should be called periodically if
+    records could arrive slowly. Records are always written by the thread
+    adding them, which makes producers wait for the database when it is
+    slower than them. If writing fails, the records are kept in the buffer to
+    be retried, and :class:`BufferFullError` is raised once it holds
+    `capacity` records.
+
+    Groups are written by `executemany` of the driver, or by multi-row
+    :class:`~.dml.Insert` statements limited by the bind parameters of the
+    dialect. Only inserts are buffered; updates and deletes, like
+    :class:`~.dml.Update` and :class:`~.dml.Delete`, are executed by the
+    executor directly.
+
+    .. warning:: With `commit`, a failed group is rolled back before it is
+        written again, and the rollback discards all uncommitted work of the
+        connection, not only the records of the buffer. Give the buffer a
+        connection of its own if `commit` is set. Savepoints are not used,
+        since drivers like `sqlite3` commit implicitly before them.
+
+    :ivar Executor _executor: Executor of the statements.
+    :ivar int _max_rows: Number of records to write a group.
+    :ivar int _max_bytes: Size of buffered values to write all groups.
+    :ivar float _max_latency: Seconds a record could wait in the buffer.
+    :ivar int _capacity: Maximum number of records in the buffer.
+    :ivar bool _executemany: A boolean indicating whether to write records by
+        `executemany` of the driver.
+    :ivar bool _commit: A boolean indicating whether to commit the connection
+        after writing records.
+    :ivar dict _groups: Tuples of time of the oldest record and records by
+        table and columns.
+    """
+    DEFAULT_MAX_ROWS = 500
+    DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+    DEFAULT_MAX_LATENCY = 1.0
+    DEFAULT_CAPACITY = 10000
+
+    # Estimated size of values other than strings
+    _value_size = 8
+
+    def __init__(self, executor, max_rows=DEFAULT_MAX_ROWS,
+                 max_bytes=DEFAULT_MAX_BYTES,
+                 max_latency=DEFAULT_MAX_LATENCY, capacity=DEFAULT_CAPACITY,
+                 executemany=True, commit=False):
+        """
+        Initialize a `WriteBuffer` object.
+
+        :param executor: Executor of the statements.
+        :type executor: Executor
+        :param max_rows: Number of records to write a group.
+        :type max_rows: int
+        :param max_bytes: Size of buffered values in bytes to write all
+            groups, or `None` if not limited.
+        :type max_bytes: int
+        :param max_latency: Seconds a record could wait in the buffer, or
+            `None` if not limited.
+        :type max_latency: float
+        :param capacity: Maximum number of records in the buffer.
+        :type capacity: int
+        :param executemany: A boolean indicating whether to write records by
+            `executemany` of the driver, or by multi-row statements.
+        :type executemany: bool
+        :param commit: A boolean indicating whether to commit the connection
+            after writing records, and roll it back if writing fails.
+        :type commit: bool
+        """
+        self._executor = executor
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._capacity = max(capacity, max_rows)
+        self._executemany = executemany
+        self._commit = commit
+        self._groups = {}
+        self._row_count = 0
+        self._byte_count = 0
+        self._closed = False
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert(self, table_name, columns, values):
+        """
+        Add a record to be inserted.
+
+        :param table_name: Name of the target table.
+        :type table_name: str
+        :param columns: Tuples of column name and value type of the columns.
+        :type columns: tuple
+        :param values: Values of the record in the order of the columns.
+        :type values: list
+        :raises UnsupportedValueError: If number of the values does not match
+            number of the columns.
+        :raises BufferFullError: If the buffer is full since records could
+            not be written.
+        :raises BufferClosedError: If the buffer is closed.
+        """
+        if len(values) != len(columns):
+            raise UnsupportedValueError
+        key = (table_name, tuple(columns))
+        size = self._get_size(values)
+        with self._lock:
+            if self._closed:
+                raise BufferClosedError
+            if self._row_count >= self._capacity:
+                self.flush()
+                if self._row_count >= self._capacity:
+                    raise BufferFullError
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = [time.time(), []]
+            group[1].append(values)
+            self._row_count += 1
+            self._byte_count += size
+            if len(group[1]) >= self._max_rows:
+                self._write(key)
+            if self._max_bytes is not None and \
+                    self._byte_count >= self._max_bytes:
+                self.flush()
+            else:
+                self.poll()
+
+    def add(self, insert):
+        """
+        Add the records of an insert statement.
+
+        :param insert: Insert statement of the records.
+        :type insert: Insert
+        """
+        columns = tuple([(col.name, col.type) for col in insert.get_columns()])
+        for values in insert.get_rows():
+            self.insert(insert.get_table(), columns, values)
+
+    def get_row_count(self):
+        """
+        Get the number of records in the buffer.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        return self._row_count
+
+    def poll(self):
+        """
+        Write the groups with records waiting longer than `max_latency`.
+        """
+        if self._max_latency is None:
+            return
+        with self._lock:
+            deadline = time.time() - self._max_latency
+            for key, group in self._groups.items():
+                if group[0] <= deadline:
+                    self._write(key)
+
+    def flush(self):
+        """
+        Write all records in the buffer.
+        """
+        with self._lock:
+            for key in list(self._groups):
+                self._write(key)
+
+    def close(self):
+        """
+        Write all records in the buffer and close it. Records could not be
+        added to a closed buffer.
+        """
+        with self._lock:
+            if not self._closed:
+                self.flush()
+                self._closed = True
+
+    def _get_size(self, values):
+        size = 0
+        for value in values:
+            if isinstance(value, (basestring, bytearray, buffer)):
+                size += len(value)
+            else:
+                size += self._value_size
+        return size
+
+    def _write(self, key):
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        table_name, columns = key
+        rows = group[1]
+        written = 0
+        try:
+            if self._executemany and self._is_bound(columns):
+                self._write_many(table_name, columns, rows)
+                written = len(rows)
+            else:
+                for chunk in self._split_rows(columns, rows):
+                    self._write_statement(table_name, columns, chunk)
+                    written += len(chunk)
+            if self._commit:
+                self._executor.get_connection().commit()
+        except Exception:
+            if self._commit:
+                # Chunks executed before the failure are discarded with the
+                # transaction, all records are written again on retry
+                self._executor.get_connection().rollback()
+                written = 0
+            if written < len(rows):
+                # Keep the records not written to be written again
+                self._groups[key] = [group[0], rows[written:]]
+            raise
+        finally:
+            self._row_count -= written
+            self._byte_count -= sum([self._get_size(values)
+                                     for values in rows[:written]])
+
+    @staticmethod
+    def _is_bound(columns):
+        # Values used in statements directly could not be passed to
+        # executemany as parameters
+        for _, value_type in columns:
+            if value_type in (ValueTypes.OTHER, None):
+                return False
+        return True
+
+    def _write_many(self, table_name, columns, rows):
+        dialect = self._executor.get_dialect()
+        params = []
+        placeholders = None
+        for values in rows:
+            binding = BindingDialect(dialect)
+            row_placeholders = [
+                binding.value2sql(value, value_type)
+                for value, (_, value_type) in zip(values, columns)]
+            if placeholders is None:
+                placeholders = row_placeholders
+            params.append(binding.get_params())
+        insert = Insert()
+        sql = "".join([
+            insert.create_keyword(), dialect.table2sql(table_name), " (",
+            ", ".join([dialect.column2sql(name) for name, _ in columns]),
+            ") VALUES (", ", ".join(placeholders), ")"])
+        self._executor.execute_sql(sql, params, many=True).close()
+
+    def _split_rows(self, columns, rows):
+        max_parameters = self._executor.get_dialect().max_parameters
+        size = len(rows)
+        if max_parameters is not None:
+            size = max(1, max_parameters // len(columns))
+        return [rows[start:start + size]
+                for start in range(0, len(rows), size)]
+
+    def _write_statement(self, table_name, columns, rows):
+        insert = Insert()
+        insert.set_table(table_name)
+        for column_name, column_type in columns:
+            insert.add_column(column_name, column_type)
+        for values in rows:
+            insert.add_row(values)
+        self._executor.execute(insert).close()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Columnar Results
+================
+ColumnarFetcher
+---------------
+.. autoclass:: pydbc.columnar.ColumnarFetcher
+    :members:
+
+ColumnarResult
+--------------
+.. autoclass:: pydbc.columnar.ColumnarResult
+    :members:
+"""
+
+import array
+
+from .constants import SQLTypes
+
+
+def _get_int64_code():
+    # "l" is a C long, which has 32 bits on Windows and 32-bit builds, while
+    # "q" is not available to every build of Python 2.7
+    for code in ("l", "q"):
+        try:
+            if array.array(code).itemsize == 8:
+                return code
+        except ValueError:
+            pass
+    return None
+
+
+# Type code of 64-bit integers, or `None` if not available
+_INT64_CODE = _get_int64_code()
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ColumnarResult(dict):
+    """
+    Records of a result stored by column, as a dict of column name to the
+    values of the column.
+
+    Values of numeric columns are stored in `array.array` objects, or NumPy
+    arrays if NumPy is used. Values of other columns are stored in lists, or
+    NumPy arrays of objects. `NULL` values of numeric columns are stored as
+    `0` and marked in :attr:`masks`. With NumPy, such columns are masked
+    arrays instead.
+
+    :ivar list names: Column names in the order of the result.
+    :ivar dict masks: Masks of the numeric columns with `NULL` values, as
+        `array.array` of `1` for `NULL` values and `0` for others.
+    """
+
+    def __init__(self, names):
+        """
+        Initialize a `ColumnarResult` object.
+
+        :param names: Column names in the order of the result.
+        :type names: list
+        """
+        super(ColumnarResult, self).__init__()
+        self.names = list(names)
+        self.masks = {}
+
+
+class ColumnarFetcher(object):
+    """
+    Fetch records of a select into typed buffers per column, instead of
+    tuples per record.
+
+    Records are fetched by `fetchmany` in batches, and each batch is appended
+    to the buffers of the columns, so that no list of all records is built.
+    NumPy arrays share the memory of the buffers::
+
+        fetcher = ColumnarFetcher(executor)
+        result = fetcher.fetch(select, reflector.get_table("foo"))
+        prices = result["price"]
+
+    Types of the buffers are chosen by the generic SQL types of the columns.
+    Columns without known numeric types are fetched into lists, as well as
+    integer columns if `array.array` has no 64-bit integer type.
+
+    .. note:: `NUMERIC` and `DECIMAL` values are stored as floats.
+
+    :ivar Executor _executor: Executor of the selects.
+    :ivar int _batch_size: Number of records fetched at once.
+    :ivar object _numpy: The NumPy module, or `None` if NumPy is not used.
+    """
+    DEFAULT_BATCH_SIZE = 1000
+
+    # Type codes of `array.array` by generic SQL type. Integers use 64 bits,
+    # since INTEGER columns of some databases such as SQLite do.
+    _type_codes = {
+        SQLTypes.BIT: "b",
+        SQLTypes.SMALLINT: "h",
+        SQLTypes.INTEGER: _INT64_CODE,
+        SQLTypes.BIGINT: _INT64_CODE,
+        SQLTypes.REAL: "d",
+        SQLTypes.NUMERIC: "d",
+        SQLTypes.DECIMAL: "d",
+    }
+
+    def __init__(self, executor, batch_size=DEFAULT_BATCH_SIZE,
+                 use_numpy=None):
+        """
+        Initialize a `ColumnarFetcher` object.
+
+        :param executor: Executor of the selects.
+        :type executor: Executor
+        :param batch_size: Number of records fetched at once.
+        :type batch_size: int
+        :param use_numpy: A boolean indicating whether to return NumPy arrays.
+            Default by using NumPy if it is installed.
+        :type use_numpy: bool
+        :raises ImportError: If NumPy is required but not installed.
+        """
+        self._executor = executor
+        self._batch_size = batch_size
+        self._numpy = None
+        if use_numpy or use_numpy is None:
+            self._numpy = _import_numpy()
+            if self._numpy is None and use_numpy:
+                raise ImportError("NumPy is required for NumPy arrays!")
+
+    def fetch(self, select, sql_types=None):
+        """
+        Execute a select and fetch its records by column.
+
+        :param select: Select to be executed.
+        :type select: Select
+        :param sql_types: Generic SQL types of the columns, as a dict of
+            column name to :class:`~.constants.SQLTypes`, or the
+            :class:`~.reflection.TableMetadata` of the selected table.
+        :type sql_types: object
+        :return: Values by column name.
+        :rtype: ColumnarResult
+        """
+        cursor = self._executor.execute(select)
+        try:
+            names = [column[0] for column in cursor.description]
+            codes = [self._type_codes.get(self._get_sql_type(sql_types, name))
+                     for name in names]
+            buffers = [[] if code is None else array.array(code)
+                       for code in codes]
+            masks = [None] * len(names)
+            count = 0
+            while True:
+                rows = cursor.fetchmany(self._batch_size)
+                if not rows:
+                    break
+                for index, values in enumerate(zip(*rows)):
+                    if codes[index] is not None and None in values:
+                        if masks[index] is None:
+                            masks[index] = array.array("b", [0] * count)
+                        masks[index].extend(
+                            [value is None for value in values])
+                        values = [0 if value is None else value
+                                  for value in values]
+                    elif masks[index] is not None:
+                        masks[index].extend([0] * len(values))
+                    buffers[index].extend(values)
+                count += len(rows)
+        finally:
+            cursor.close()
+        result = ColumnarResult(names)
+        for name, code, values, mask in zip(names, codes, buffers, masks):
+            if mask is not None:
+                result.masks[name] = mask
+            result[name] = self._to_numpy(code, values, mask) \
+                if self._numpy is not None else values
+        return result
+
+    @staticmethod
+    def _get_sql_type(sql_types, name):
+        if sql_types is None:
+            return None
+        if isinstance(sql_types, dict):
+            return sql_types.get(name)
+        column = sql_types.get_column(name)
+        return column.sql_type if column is not None else None
+
+    def _to_numpy(self, code, values, mask):
+        numpy = self._numpy
+        if code is None:
+            data = numpy.empty(len(values), dtype=object)
+            data[:] = values
+            return data
+        # Share the memory of the buffer
+        data = numpy.frombuffer(values, dtype=numpy.dtype(code))
+        if code == "b":
+            data = data.view(numpy.bool_)
+        if mask is None:
+            return data
+        return numpy.ma.MaskedArray(
+            data, mask=numpy.frombuffer(mask, dtype=numpy.bool_))
@@ -59,6 +59,9 @@ class SQLTypes(object):
         `LONG_VARBINARY`.
     :cvar int BLOB: Type code that identifies the generic SQL type `BLOB`.
     :cvar int CLOB: Type code that identifies the generic SQL type `CLOB`.
+    :cvar int DATE: Type code that identifies the generic SQL type `DATE`.
+    :cvar int TIMESTAMP: Type code that identifies the generic SQL type
+        `TIMESTAMP`.
     """
     BIT = -7
     SMALLINT = 5
@@ -67,7 +70,7 @@ class SQLTypes(object):
     REAL = 7
     NUMERIC = 2
     DECIMAL = 3
-    CHAR = 2
+    CHAR = 1
     VARCHAR = 12
     LONG_VARCHAR = -1
     BINARY = -2
@@ -75,12 +78,41 @@ class SQLTypes(object):
     LONG_VARBINARY = -4
     BLOB = 2004
     CLOB = 2005
+    DATE = 91
+    TIMESTAMP = 93
 
 
 class ValueTypes(object):
+    """
+    Defines the constants that are used to identify the type of values in SQL
+    statements.
+
+    .. note:: This class is never instantiated.
+
+    :cvar int STRING: Type code that identifies string values.
+    :cvar int INTEGER: Type code that identifies integer values.
+    :cvar int LONG: Type code that identifies long integer values.
+    :cvar int BINARY: Type code that identifies binary values, which could be
+        `str`, `bytearray`, `buffer` or `memoryview` objects.
+    :cvar int DECIMAL: Type code that identifies `decimal.Decimal` values.
+    :cvar int FLOAT: Type code that identifies float values.
+    :cvar int BOOLEAN: Type code that identifies boolean values.
+    :cvar int DATE: Type code that identifies `datetime.date` values.
+    :cvar int DATETIME: Type code that identifies `datetime.datetime` values.
+    :cvar int UUID: Type code that identifies `uuid.UUID` values.
+    :cvar int OTHER: Type code that identifies values to be used in SQL
+        statements directly, such as column names.
+    """
     STRING = 0
     INTEGER = 1
     LONG = 2
+    BINARY = 3
+    DECIMAL = 4
+    FLOAT = 5
+    BOOLEAN = 6
+    DATE = 7
+    DATETIME = 8
+    UUID = 9
     OTHER = -1
 
 
@@ -0,0 +1,1019 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+DDL Statements
+==============
+Base Classes
+------------
+DDLBase
+~~~~~~~
+.. autoclass:: pydbc.ddl.DDLBase
+    :members:
+
+ColumnDefinition
+~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.ColumnDefinition
+    :members:
+
+Generic DDL Statements
+----------------------
+CreateTable
+~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.CreateTable
+    :members:
+
+CreateIndex
+~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.CreateIndex
+    :members:
+
+DropIndex
+~~~~~~~~~
+.. autoclass:: pydbc.ddl.DropIndex
+    :members:
+
+AlterTable
+~~~~~~~~~~
+.. autoclass:: pydbc.ddl.AlterTable
+    :members:
+
+Bulk Loading
+------------
+BulkLoad
+~~~~~~~~
+.. autoclass:: pydbc.ddl.BulkLoad
+    :members:
+
+DDL Exceptions
+--------------
+IncompleteStatementError
+~~~~~~~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.IncompleteStatementError
+    :members:
+
+UnsupportedSQLTypeError
+~~~~~~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.UnsupportedSQLTypeError
+    :members:
+
+IndexReflectionError
+~~~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.IndexReflectionError
+    :members:
+
+IndexRebuildError
+~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.ddl.IndexRebuildError
+    :members:
+"""
+
+import re
+import sys
+
+from .constants import ValueTypes
+from .dml import DMLBase, Insert, NoneColumnNameError, NoneTableNameError
+from .sqlutils import SQLUtils
+
+
+# ========================
+# DDL Exceptions:
+#   1. IncompleteStatementError
+#   2. UnsupportedSQLTypeError
+#   3. IndexReflectionError
+#   4. IndexRebuildError
+# ========================
+class IncompleteStatementError(ValueError):
+    """
+    The error raised if a required part of a DDL statement is not set.
+    """
+
+    def __init__(self):
+        """
+        Initialize IncompleteStatementError.
+        """
+        msg = "Incomplete DDL statement!"
+        super(IncompleteStatementError, self).__init__(msg)
+
+
+class UnsupportedSQLTypeError(ValueError):
+    """
+    The error raised if a SQL type is not supported by the dialect.
+    """
+
+    def __init__(self, sql_type):
+        """
+        Initialize UnsupportedSQLTypeError.
+
+        :param sql_type: The unsupported SQL type.
+        :type sql_type: SQLTypes
+        """
+        msg = "Unsupported SQL type %r!" % (sql_type, )
+        super(UnsupportedSQLTypeError, self).__init__(msg)
+
+
+class IndexReflectionError(ValueError):
+    """
+    The error raised if indexes of a table could not be listed by the dialect.
+    """
+
+    def __init__(self, table_name):
+        """
+        Initialize IndexReflectionError.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        """
+        msg = "Could not list indexes of table '%s'!" % table_name
+        super(IndexReflectionError, self).__init__(msg)
+
+
+class IndexRebuildError(ValueError):
+    """
+    The error raised if dropped indexes of a table could not be rebuilt.
+
+    :ivar list errors: A list of tuples of index name and the error raised
+        while rebuilding the index.
+    """
+
+    def __init__(self, table_name, errors):
+        """
+        Initialize IndexRebuildError.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        :param errors: A list of tuples of index name and the error raised
+            while rebuilding the index.
+        :type errors: list
+        """
+        msg = "Could not rebuild indexes of table '%s': %s!" % (
+            table_name, "; ".join(["%s: %s" % (name, error)
+                                   for name, error in errors]))
+        super(IndexRebuildError, self).__init__(msg)
+        self.errors = errors
+
+
+# ==================
+# DDL Base classes:
+#   1. DDLBase
+#   2. ColumnDefinition
+# ==================
+class DDLBase(DMLBase):
+    """
+    Base class for creating DDL statements.
+
+    DDL statements could be executed by :class:`~.executor.Executor` the same
+    way as DML statements.
+
+    .. note:: This class is subclass of :class:`~.dml.DMLBase`.
+    """
+    pass
+
+
+class ColumnDefinition(DDLBase):
+    """
+    Create the definition of a column in a DDL statement.
+
+    :ivar str name: Column name of target column.
+    :ivar SQLTypes type: Generic SQL type of target column.
+    :ivar int size: Length of character and binary types, or precision of
+        numeric types.
+    :ivar int scale: Scale of numeric types.
+    :ivar bool nullable: A boolean indicating whether the column accepts
+        `NULL` values.
+    """
+    name = None
+    type = None
+    size = None
+    scale = None
+    nullable = True
+
+    def __init__(self, name, sql_type, size=None, scale=None, nullable=True):
+        """
+        Initialize a `ColumnDefinition` object.
+
+        :param name: Column name of target column.
+        :type name: str
+        :param sql_type: Generic SQL type of target column.
+        :type sql_type: SQLTypes
+        :param size: Length of character and binary types, or precision of
+            numeric types.
+        :type size: int
+        :param scale: Scale of numeric types.
+        :type scale: int
+        :param nullable: A boolean indicating whether the column accepts
+            `NULL` values.
+        :type nullable: bool
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        if name is None:
+            raise NoneColumnNameError
+        self.name = name
+        self.type = sql_type
+        self.size = size
+        self.scale = scale
+        self.nullable = nullable
+
+    def to_sql(self, dialect):
+        """
+        Convert column definition to be component of DDL statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of column definition.
+        :rtype: str
+        :raises UnsupportedSQLTypeError: If the SQL type is not supported by
+            the dialect.
+        """
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            return self._raw_sql
+        type_name = dialect.type2sql(self.type, self.size, self.scale)
+        if type_name is None:
+            raise UnsupportedSQLTypeError(self.type)
+        col_buffer = [dialect.column2sql(self.name), " ", type_name]
+        if not self.nullable:
+            col_buffer.append(" NOT NULL")
+        return "".join(col_buffer)
+
+
+# =======================
+# Generic DDL statements:
+#   1. CreateTable
+#   2. CreateIndex
+#   3. DropIndex
+#   4. AlterTable
+# =======================
+class CreateTable(DDLBase):
+    """
+    Create SQL `CREATE TABLE` statement.
+
+    :cvar str _table: Name of the table to be created.
+    :cvar list _columns: A list of column definitions.
+    :cvar list _primary_key: Column names of the primary key.
+    :cvar bool _if_not_exists: A boolean indicating whether to skip creating
+        the table if it exists.
+    """
+    _table = None
+    _columns = []
+    _primary_key = []
+    _if_not_exists = False
+
+    def __init__(self, table_name=None):
+        """
+        Initialize a `CreateTable` object.
+
+        :param table_name: Name of the table to be created.
+        :type table_name: str
+        """
+        super(CreateTable, self).__init__()
+        self._table = table_name
+        self._columns = []
+        self._primary_key = []
+
+    def set_table(self, table_name):
+        """
+        Set the table to be created.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        """
+        self._table = table_name
+
+    def get_table(self):
+        """
+        Get the table to be created.
+
+        :return: Name of the table.
+        :rtype: str
+        """
+        return self._table
+
+    def add_column(self, column_name, sql_type, size=None, scale=None,
+                   nullable=True):
+        """
+        Add a column to the table.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param sql_type: Generic SQL type of target column.
+        :type sql_type: SQLTypes
+        :param size: Length of character and binary types, or precision of
+            numeric types.
+        :type size: int
+        :param scale: Scale of numeric types.
+        :type scale: int
+        :param nullable: A boolean indicating whether the column accepts
+            `NULL` values.
+        :type nullable: bool
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        self._columns.append(ColumnDefinition(
+            column_name, sql_type, size, scale, nullable))
+
+    def get_columns(self):
+        """
+        Get the column definitions of the table.
+
+        :return: List of column definitions.
+        :rtype: list
+        """
+        return self._columns
+
+    def set_primary_key(self, column_names):
+        """
+        Set the primary key of the table.
+
+        :param column_names: Column names of the primary key.
+        :type column_names: list
+        """
+        self._primary_key = list(column_names)
+
+    def get_primary_key(self):
+        """
+        Get the primary key of the table.
+
+        :return: Column names of the primary key.
+        :rtype: list
+        """
+        return self._primary_key
+
+    def set_if_not_exists(self, if_not_exists=True):
+        """
+        Set whether to skip creating the table if it exists.
+
+        :param if_not_exists: A boolean indicating whether to skip creating
+            the table if it exists.
+        :type if_not_exists: bool
+        """
+        self._if_not_exists = if_not_exists
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `CREATE TABLE` statement.
+
+        :return: Keyword string of SQL `CREATE TABLE` statement.
+        :rtype: str
+        """
+        return "CREATE TABLE "
+
+    def to_sql(self, dialect):
+        """
+        Convert `CreateTable` object to be a SQL `CREATE TABLE` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `CREATE TABLE` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table name is not set.
+        :raises IncompleteStatementError: If no column is added.
+        :raises UnsupportedSQLTypeError: If any SQL type is not supported by
+            the dialect.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        if not self._columns:
+            raise IncompleteStatementError
+        if self._if_not_exists:
+            sql_buffer.append("IF NOT EXISTS ")
+        sql_buffer.append(dialect.table2sql(self._table))
+        definitions = [col.to_sql(dialect) for col in self._columns]
+        if self._primary_key:
+            definitions.append("".join([
+                "PRIMARY KEY (",
+                ", ".join([dialect.column2sql(name)
+                           for name in self._primary_key]), ")"]))
+        sql_buffer.extend([" (", ", ".join(definitions), ")"])
+        return "".join(sql_buffer)
+
+
+class CreateIndex(DDLBase):
+    """
+    Create SQL `CREATE INDEX` statement.
+
+    :cvar str _name: Name of the index.
+    :cvar str _table: Name of the table to create index on.
+    :cvar list _columns: A list of tuples of column name and sort order of the
+        indexed columns.
+    :cvar bool _unique: A boolean indicating whether the index is unique.
+    :cvar bool _if_not_exists: A boolean indicating whether to skip creating
+        the index if it exists.
+    """
+    _name = None
+    _table = None
+    _columns = []
+    _unique = False
+    _if_not_exists = False
+
+    _statement_pattern = re.compile(
+        r"^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+", re.IGNORECASE)
+
+    def __init__(self, index_name=None, table_name=None, unique=False):
+        """
+        Initialize a `CreateIndex` object.
+
+        :param index_name: Name of the index.
+        :type index_name: str
+        :param table_name: Name of the table to create index on.
+        :type table_name: str
+        :param unique: A boolean indicating whether the index is unique.
+        :type unique: bool
+        """
+        super(CreateIndex, self).__init__()
+        self._name = index_name
+        self._table = table_name
+        self._unique = unique
+        self._columns = []
+
+    @classmethod
+    def from_sql(cls, index_name, sql):
+        """
+        Create a `CreateIndex` object from an existing `CREATE INDEX`
+        statement, such as the statements stored by databases.
+
+        :param index_name: Name of the index.
+        :type index_name: str
+        :param sql: SQL `CREATE INDEX` statement.
+        :type sql: str
+        :return: Index statement using the statement as RAW SQL.
+        :rtype: CreateIndex
+        :raises IncompleteStatementError: If the statement is not a
+            `CREATE INDEX` statement.
+        """
+        match = cls._statement_pattern.match(sql)
+        if match is None:
+            raise IncompleteStatementError
+        index = cls(index_name, unique=match.group(1) is not None)
+        index.set_raw_sql(sql[match.end():])
+        return index
+
+    def set_name(self, index_name):
+        """
+        Set the name of the index.
+
+        :param index_name: Name of the index.
+        :type index_name: str
+        """
+        self._name = index_name
+
+    def get_name(self):
+        """
+        Get the name of the index.
+
+        :return: Name of the index.
+        :rtype: str
+        """
+        return self._name
+
+    def set_table(self, table_name):
+        """
+        Set the table to create index on.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        """
+        self._table = table_name
+
+    def get_table(self):
+        """
+        Get the table to create index on.
+
+        :return: Name of the table.
+        :rtype: str
+        """
+        return self._table
+
+    def add_column(self, column_name, asc=True):
+        """
+        Add a column to the index.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param asc: Sort the index of target column in ascending order or in a
+            descending order.
+        :type asc: bool
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        if column_name is None:
+            raise NoneColumnNameError
+        self._columns.append((column_name, asc))
+
+    def get_columns(self):
+        """
+        Get the indexed columns.
+
+        :return: List of tuples of column name and sort order.
+        :rtype: list
+        """
+        return self._columns
+
+    def set_unique(self, unique=True):
+        """
+        Set whether the index is unique.
+
+        :param unique: A boolean indicating whether the index is unique.
+        :type unique: bool
+        """
+        self._unique = unique
+
+    def is_unique(self):
+        """
+        Get whether the index is unique.
+
+        :return: A boolean indicating whether the index is unique.
+        :rtype: bool
+        """
+        return self._unique
+
+    def set_if_not_exists(self, if_not_exists=True):
+        """
+        Set whether to skip creating the index if it exists.
+
+        :param if_not_exists: A boolean indicating whether to skip creating
+            the index if it exists.
+        :type if_not_exists: bool
+        """
+        self._if_not_exists = if_not_exists
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `CREATE INDEX` statement.
+
+        :return: Keyword string of SQL `CREATE INDEX` statement.
+        :rtype: str
+        """
+        if self._unique:
+            return "CREATE UNIQUE INDEX "
+        return "CREATE INDEX "
+
+    def to_sql(self, dialect):
+        """
+        Convert `CreateIndex` object to be a SQL `CREATE INDEX` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `CREATE INDEX` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table name is not set.
+        :raises IncompleteStatementError: If index name is not set or no
+            column is added.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        if self._name is None or not self._columns:
+            raise IncompleteStatementError
+        if self._if_not_exists:
+            sql_buffer.append("IF NOT EXISTS ")
+        sql_buffer.extend([
+            dialect.table2sql(self._name), " ON ",
+            dialect.table2sql(self._table), " (",
+            ", ".join([
+                "".join([dialect.column2sql(name),
+                         SQLUtils.get_sql_order_type(asc)])
+                for name, asc in self._columns]),
+            ")"])
+        return "".join(sql_buffer)
+
+
+class DropIndex(DDLBase):
+    """
+    Create SQL `DROP INDEX` statement.
+
+    :cvar str _name: Name of the index to be dropped.
+    :cvar bool _if_exists: A boolean indicating whether to skip dropping the
+        index if it does not exist.
+    """
+    _name = None
+    _if_exists = False
+
+    def __init__(self, index_name=None):
+        """
+        Initialize a `DropIndex` object.
+
+        :param index_name: Name of the index to be dropped.
+        :type index_name: str
+        """
+        super(DropIndex, self).__init__()
+        self._name = index_name
+
+    def set_name(self, index_name):
+        """
+        Set the name of the index to be dropped.
+
+        :param index_name: Name of the index.
+        :type index_name: str
+        """
+        self._name = index_name
+
+    def get_name(self):
+        """
+        Get the name of the index to be dropped.
+
+        :return: Name of the index.
+        :rtype: str
+        """
+        return self._name
+
+    def set_if_exists(self, if_exists=True):
+        """
+        Set whether to skip dropping the index if it does not exist.
+
+        :param if_exists: A boolean indicating whether to skip dropping the
+            index if it does not exist.
+        :type if_exists: bool
+        """
+        self._if_exists = if_exists
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `DROP INDEX` statement.
+
+        :return: Keyword string of SQL `DROP INDEX` statement.
+        :rtype: str
+        """
+        return "DROP INDEX "
+
+    def to_sql(self, dialect):
+        """
+        Convert `DropIndex` object to be a SQL `DROP INDEX` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `DROP INDEX` statement.
+        :rtype: str
+        :raises IncompleteStatementError: If index name is not set.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._name is None:
+            raise IncompleteStatementError
+        if self._if_exists:
+            sql_buffer.append("IF EXISTS ")
+        sql_buffer.append(dialect.table2sql(self._name))
+        return "".join(sql_buffer)
+
+
+class AlterTable(DDLBase):
+    """
+    Create SQL `ALTER TABLE` statement.
+
+    Each statement holds one action, as some databases such as SQLite do not
+    accept multiple actions in one statement. Setting an action replaces the
+    previous one.
+
+    :cvar str _table: Name of the table to be altered.
+    :cvar str _action: Keyword of the action.
+    :cvar object _target: Column definition, column name or new table name
+        the action applies to.
+    """
+    _table = None
+    _action = None
+    _target = None
+
+    def __init__(self, table_name=None):
+        """
+        Initialize an `AlterTable` object.
+
+        :param table_name: Name of the table to be altered.
+        :type table_name: str
+        """
+        super(AlterTable, self).__init__()
+        self._table = table_name
+
+    def set_table(self, table_name):
+        """
+        Set the table to be altered.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        """
+        self._table = table_name
+
+    def get_table(self):
+        """
+        Get the table to be altered.
+
+        :return: Name of the table.
+        :rtype: str
+        """
+        return self._table
+
+    def add_column(self, column_name, sql_type, size=None, scale=None,
+                   nullable=True):
+        """
+        Add a column to the table.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param sql_type: Generic SQL type of target column.
+        :type sql_type: SQLTypes
+        :param size: Length of character and binary types, or precision of
+            numeric types.
+        :type size: int
+        :param scale: Scale of numeric types.
+        :type scale: int
+        :param nullable: A boolean indicating whether the column accepts
+            `NULL` values.
+        :type nullable: bool
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        self._action = "ADD COLUMN "
+        self._target = ColumnDefinition(
+            column_name, sql_type, size, scale, nullable)
+
+    def drop_column(self, column_name):
+        """
+        Drop a column from the table.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        if column_name is None:
+            raise NoneColumnNameError
+        self._action = "DROP COLUMN "
+        self._target = column_name
+
+    def rename_to(self, table_name):
+        """
+        Rename the table.
+
+        :param table_name: New name of the table.
+        :type table_name: str
+        :raises NoneTableNameError: If table name is `None`.
+        """
+        if table_name is None:
+            raise NoneTableNameError
+        self._action = "RENAME TO "
+        self._target = table_name
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `ALTER TABLE` statement.
+
+        :return: Keyword string of SQL `ALTER TABLE` statement.
+        :rtype: str
+        """
+        return "ALTER TABLE "
+
+    def to_sql(self, dialect):
+        """
+        Convert `AlterTable` object to be a SQL `ALTER TABLE` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `ALTER TABLE` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table name is not set.
+        :raises IncompleteStatementError: If no action is set.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        if self._action is None:
+            raise IncompleteStatementError
+        sql_buffer.extend([dialect.table2sql(self._table), " ", self._action])
+        if isinstance(self._target, ColumnDefinition):
+            sql_buffer.append(self._target.to_sql(dialect))
+        elif self._action == "DROP COLUMN ":
+            sql_buffer.append(dialect.column2sql(self._target))
+        else:
+            sql_buffer.append(dialect.table2sql(self._target))
+        return "".join(sql_buffer)
+
+
+# =============
+# Bulk loading:
+#   1. BulkLoad
+# =============
+class BulkLoad(object):
+    """
+    Load records into a table with its secondary indexes dropped, and rebuild
+    the indexes once after loading.
+
+    Building an index once after loading is much cheaper than updating it for
+    every inserted record. Records are inserted in batches by multi-row
+    :class:`~.dml.Insert` statements, limited by the number of bind
+    parameters the dialect accepts in one statement::
+
+        with BulkLoad(executor, "foo") as load:
+            load.add_column("id", ValueTypes.INTEGER)
+            load.add_column("name")
+            load.add_rows(records)
+
+    Indexes are rebuilt even if loading or dropping other indexes fails, so
+    that the table keeps its indexes. Every dropped index is rebuilt, and
+    the indexes which could not be rebuilt are reported together by
+    :class:`IndexRebuildError`. Transactions are left to the caller.
+
+    .. note:: Indexes implementing primary key or unique constraints are kept,
+        since they could not be dropped separately.
+
+    :ivar Executor _executor: Executor of the statements.
+    :ivar str _table: Name of the table to load records into.
+    :ivar list _indexes: Definitions of the indexes to be dropped.
+    :ivar list _dropped: Definitions of the indexes dropped so far.
+    :ivar list _columns: A list of tuples of column name and value type.
+    :ivar list _rows: Records waiting to be inserted.
+    :ivar int _batch_size: Maximum number of records in one statement.
+    """
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(self, executor, table_name, indexes=None,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Initialize a `BulkLoad` object.
+
+        :param executor: Executor of the statements.
+        :type executor: Executor
+        :param table_name: Name of the table to load records into.
+        :type table_name: str
+        :param indexes: Definitions of the secondary indexes of the table.
+            Indexes are listed by the dialect if not specified.
+        :type indexes: list
+        :param batch_size: Maximum number of records in one statement.
+        :type batch_size: int
+        """
+        self._executor = executor
+        self._table = table_name
+        self._indexes = indexes
+        self._dropped = []
+        self._columns = []
+        self._rows = []
+        self._batch_size = batch_size
+        self._started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.finish(exc_type is None)
+
+    def add_column(self, column_name, column_type=ValueTypes.STRING):
+        """
+        Add a column to load values into.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param column_type: Data type of the values for target column.
+        :type column_type: ValueTypes
+        """
+        self._columns.append((column_name, column_type))
+
+    def get_indexes(self):
+        """
+        Get definitions of the secondary indexes of the table.
+
+        :return: List of index definitions.
+        :rtype: list
+        """
+        return self._indexes
+
+    def start(self):
+        """
+        Record the secondary indexes of the table and drop them. If an index
+        could not be dropped, the indexes already dropped are rebuilt.
+
+        :raises IndexReflectionError: If no index is specified and the dialect
+            could not list indexes.
+        :raises IndexRebuildError: If an index could not be dropped, and the
+            indexes already dropped could not be rebuilt.
+        """
+        if self._indexes is None:
+            index_sql = self._executor.get_dialect().get_index_sql(
+                self._executor.get_connection(), self._table)
+            if index_sql is None:
+                raise IndexReflectionError(self._table)
+            self._indexes = [CreateIndex.from_sql(name, sql)
+                             for name, sql in index_sql]
+        self._dropped = []
+        self._started = True
+        try:
+            for index in self._indexes:
+                self._executor.execute(DropIndex(index.get_name())).close()
+                self._dropped.append(index)
+        except Exception:
+            error = sys.exc_info()
+            self.finish(False)
+            raise error[0], error[1], error[2]
+
+    def add_row(self, values):
+        """
+        Add a record to be loaded. Records are inserted once a batch is full.
+
+        :param values: Values of the record in the order of the columns.
+        :type values: list
+        """
+        self._rows.append(values)
+        if len(self._rows) >= self.get_rows_per_statement():
+            self.flush()
+
+    def add_rows(self, rows):
+        """
+        Add records to be loaded.
+
+        :param rows: Iterable of records.
+        :type rows: iterable
+        """
+        for values in rows:
+            self.add_row(values)
+
+    def get_rows_per_statement(self):
+        """
+        Get the maximum number of records inserted by one statement.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        max_parameters = self._executor.get_dialect().max_parameters
+        if max_parameters is None or not self._columns:
+            return self._batch_size
+        return max(1, min(self._batch_size,
+                          max_parameters // len(self._columns)))
+
+    def flush(self):
+        """
+        Insert the records waiting to be loaded.
+        """
+        if not self._rows:
+            return
+        insert = Insert()
+        insert.set_table(self._table)
+        for column_name, column_type in self._columns:
+            insert.add_column(column_name, column_type)
+        for values in self._rows:
+            insert.add_row(values)
+        self._rows = []
+        self._executor.execute(insert).close()
+
+    def finish(self, load=True):
+        """
+        Insert the remaining records and rebuild the dropped indexes.
+
+        :param load: A boolean indicating whether to insert the remaining
+            records. Records are discarded if loading failed.
+        :type load: bool
+        :raises IndexRebuildError: If any dropped index could not be rebuilt.
+            All of the other indexes are rebuilt before it is raised.
+        """
+        if not self._started:
+            return
+        self._started = False
+        try:
+            if load:
+                self.flush()
+        finally:
+            self._rows = []
+            self._rebuild()
+
+    def _rebuild(self):
+        dropped, self._dropped = self._dropped, []
+        errors = []
+        for index in dropped:
+            try:
+                self._executor.execute(index).close()
+            except Exception as e:
+                errors.append((index.get_name(), e))
+        if errors:
+            raise IndexRebuildError(self._table, errors)
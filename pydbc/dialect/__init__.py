@@ -14,6 +14,60 @@
 
 __author__ = "huhamhire <me@huhamhire.com>"
 
-__all__ = ["Dialect"]
+__doc__ = """
+SQL Dialects
+============
+Dialect
+-------
+.. autoclass:: pydbc.dialect.Dialect
+    :members:
 
-from .base_dialect import Dialect
+SQLiteDialect
+-------------
+.. autoclass:: pydbc.dialect.SQLiteDialect
+    :members:
+
+BindingDialect
+--------------
+.. autoclass:: pydbc.dialect.BindingDialect
+    :members:
+
+LiteralRenderer
+---------------
+.. autoclass:: pydbc.dialect.LiteralRenderer
+    :members:
+
+DialectRegistry
+---------------
+.. autoclass:: pydbc.dialect.DialectRegistry
+    :members:
+
+UnsupportedDialectError
+-----------------------
+.. autoclass:: pydbc.dialect.UnsupportedDialectError
+    :members:
+"""
+
+__all__ = ["Dialect", "SQLiteDialect", "BindingDialect", "LiteralRenderer",
+           "DialectRegistry", "UnsupportedDialectError"]
+
+import sys
+
+from .. import _LazyModule
+
+# Dialects are imported on first access, so that resolving a dialect by name
+# only imports the modules of that dialect.
+_lazy_attributes = {
+    "Dialect": (".base_dialect", "Dialect"),
+    "SQLiteDialect": (".sqlite_dialect", "SQLiteDialect"),
+    "BindingDialect": (".binding", "BindingDialect"),
+    "LiteralRenderer": (".literal", "LiteralRenderer"),
+    "DialectRegistry": (".registry", "DialectRegistry"),
+    "UnsupportedDialectError": (".registry", "UnsupportedDialectError"),
+}
+
+_module = _LazyModule(__name__)
+_module.__dict__.update(globals())
+# Keep the original module alive, as its globals are used by _LazyModule
+_module.__dict__["_origin"] = sys.modules[__name__]
+sys.modules[__name__] = _module
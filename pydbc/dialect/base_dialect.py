@@ -14,13 +14,412 @@
 
 __author__ = "huhamhire <me@huhamhire.com>"
 
+import sys
+
+from .binding import BindingDialect
+from .literal import LiteralRenderer
+from ..constants import SQLTypes, ValueTypes
+
+# Streams of large objects could only be created once the module is imported,
+# so it is not imported with the dialects
+_LOB_MODULE = __name__.rsplit(".", 2)[0] + ".lob"
+
+
+def _is_stream(value):
+    lob = sys.modules.get(_LOB_MODULE)
+    return lob is not None and isinstance(value, lob.LOBStream)
+
 
 class Dialect(object):
+    """
+    Generic SQL dialect converting names and values into SQL.
+
+    :cvar str paramstyle: DB-API parameter style of the driver used with this
+        dialect. Could be `qmark`, `numeric`, `named`, `format` or
+        `pyformat`.
+    :cvar bool stream_parameters: A boolean indicating whether the driver
+        reads file-like parameters incrementally.
+    :cvar int max_parameters: Maximum number of bind parameters in one
+        statement, or `None` if not limited.
+    :cvar bool multi_statements: A boolean indicating whether the driver
+        executes statements separated by `;` in one call, returning their
+        result sets by `nextset`.
+    :cvar bool dynamic_union_types: A boolean indicating whether columns of
+        the selects combined by `UNION` could have different types.
+    :cvar int max_union_selects: Maximum number of selects combined by
+        `UNION`, or `None` if not limited.
+    :cvar bool prepare_statements: A boolean indicating whether statements
+        are executed as server-side prepared statements by
+        :class:`~.executor.Executor`.
+    :cvar str prepared_paramstyle: Style of the placeholders in prepared
+        statements.
+    :cvar str multi_table_update: Form of `UPDATE` statements joining other
+        tables, `from` for `UPDATE ... SET ... FROM`, `join` for
+        `UPDATE ... JOIN ... SET`, or `None` to filter the records by an
+        `EXISTS` subquery.
+    :cvar str multi_table_delete: Form of `DELETE` statements joining other
+        tables, `using` for `DELETE FROM ... USING`, `join` for
+        `DELETE t FROM t JOIN ...`, or `None` to filter the records by an
+        `EXISTS` subquery.
+    """
     _table_quote = ""
     _column_quote = ""
+    _all_columns = "*"
+    _explain_keyword = "EXPLAIN "
+    # Literals of values which could not be bound as parameters
+    _literal_renderer = LiteralRenderer()
+
+    _type_names = {
+        SQLTypes.BIT: "BIT",
+        SQLTypes.SMALLINT: "SMALLINT",
+        SQLTypes.INTEGER: "INTEGER",
+        SQLTypes.BIGINT: "BIGINT",
+        SQLTypes.REAL: "REAL",
+        SQLTypes.NUMERIC: "NUMERIC",
+        SQLTypes.DECIMAL: "DECIMAL",
+        SQLTypes.CHAR: "CHAR",
+        SQLTypes.VARCHAR: "VARCHAR",
+        SQLTypes.LONG_VARCHAR: "LONG VARCHAR",
+        SQLTypes.BINARY: "BINARY",
+        SQLTypes.VARBINARY: "VARBINARY",
+        SQLTypes.LONG_VARBINARY: "LONG VARBINARY",
+        SQLTypes.BLOB: "BLOB",
+        SQLTypes.CLOB: "CLOB",
+        SQLTypes.DATE: "DATE",
+        SQLTypes.TIMESTAMP: "TIMESTAMP",
+    }
+    # Other names of generic types used by databases
+    _type_aliases = {
+        "BOOLEAN": SQLTypes.BIT,
+        "INT": SQLTypes.INTEGER,
+        "DOUBLE PRECISION": SQLTypes.REAL,
+        "FLOAT": SQLTypes.REAL,
+        "CHARACTER": SQLTypes.CHAR,
+        "CHARACTER VARYING": SQLTypes.VARCHAR,
+        "TEXT": SQLTypes.LONG_VARCHAR,
+        "TIMESTAMP WITHOUT TIME ZONE": SQLTypes.TIMESTAMP,
+        "DATETIME": SQLTypes.TIMESTAMP,
+    }
+    # Types taking a length, or a precision and a scale
+    _sized_types = (SQLTypes.CHAR, SQLTypes.VARCHAR, SQLTypes.BINARY,
+                    SQLTypes.VARBINARY, SQLTypes.NUMERIC, SQLTypes.DECIMAL)
+
+    paramstyle = "qmark"
+    stream_parameters = False
+    max_parameters = None
+    multi_statements = False
+    dynamic_union_types = False
+    max_union_selects = None
+    prepare_statements = False
+    prepared_paramstyle = "dollar"
+    multi_table_update = None
+    multi_table_delete = None
 
     def column2sql(self, column_name):
+        if column_name == self._all_columns:
+            return column_name
         return "".join([self._column_quote, column_name, self._column_quote])
 
     def table2sql(self, table_name):
         return "".join([self._table_quote, table_name, self._table_quote])
+
+    def type2sql(self, sql_type, size=None, scale=None):
+        """
+        Convert a generic SQL type into the type name of the database.
+
+        :param sql_type: Generic SQL type.
+        :type sql_type: SQLTypes
+        :param size: Length of character and binary types, or precision of
+            numeric types.
+        :type size: int
+        :param scale: Scale of numeric types.
+        :type scale: int
+        :return: A string of the type name. `None` would be returned if the
+            type is not supported by the database.
+        :rtype: str
+        """
+        name = self._type_names.get(sql_type)
+        if name is None or size is None or sql_type not in self._sized_types:
+            return name
+        if scale is not None:
+            return "%s(%d, %d)" % (name, size, scale)
+        return "%s(%d)" % (name, size)
+
+    def name2type(self, type_name):
+        """
+        Convert a type name of the database into a generic SQL type.
+
+        :param type_name: Type name of the database, which could include the
+            length or precision of the type.
+        :type type_name: str
+        :return: Generic SQL type. `None` would be returned if the type is not
+            known.
+        :rtype: SQLTypes
+        """
+        name = " ".join(type_name.split("(", 1)[0].upper().split())
+        for sql_type, sql_name in self._type_names.items():
+            if sql_name == name:
+                return sql_type
+        return self._type_aliases.get(name)
+
+    def reflect_table(self, connection, table_name):
+        """
+        Read metadata of a table from the `information_schema` views.
+
+        .. note:: Indexes are not described by `information_schema`, so only
+            unique constraints are listed as unique indexes.
+
+        :param connection: DB-API 2.0 connection to the database.
+        :type connection: object
+        :param table_name: Name of the table.
+        :type table_name: str
+        :return: Table metadata. `None` would be returned if the table does
+            not exist.
+        :rtype: TableMetadata
+        """
+        from ..reflection import ColumnMetadata, IndexMetadata, TableMetadata
+        rows = self._query_catalog(
+            connection,
+            "SELECT column_name, data_type, is_nullable "
+            "FROM information_schema.columns WHERE table_name = %s "
+            "ORDER BY ordinal_position", table_name)
+        if not rows:
+            return None
+        columns = [ColumnMetadata(name, type_name, self.name2type(type_name),
+                                  nullable.upper() == "YES")
+                   for name, type_name, nullable in rows]
+        rows = self._query_catalog(
+            connection,
+            "SELECT t.constraint_name, t.constraint_type, k.column_name "
+            "FROM information_schema.table_constraints t "
+            "JOIN information_schema.key_column_usage k "
+            "ON t.constraint_name = k.constraint_name "
+            "AND t.table_name = k.table_name "
+            "WHERE t.constraint_type IN ('PRIMARY KEY', 'UNIQUE') "
+            "AND t.table_name = %s "
+            "ORDER BY t.constraint_name, k.ordinal_position", table_name)
+        primary_key = []
+        indexes = []
+        for name, constraint_type, column_name in rows:
+            if constraint_type == "PRIMARY KEY":
+                primary_key.append(column_name)
+            elif indexes and indexes[-1].name == name:
+                indexes[-1].columns.append(column_name)
+            else:
+                indexes.append(IndexMetadata(name, [column_name], True))
+        return TableMetadata(table_name, columns, primary_key, indexes)
+
+    def _query_catalog(self, connection, sql, table_name):
+        binding = BindingDialect(self)
+        sql = sql % binding.value2sql(table_name, ValueTypes.STRING)
+        cursor = connection.cursor()
+        try:
+            cursor.execute(sql, binding.get_params())
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def explain(self, connection, sql, params):
+        """
+        Get the query plan of a SQL statement.
+
+        :param connection: DB-API 2.0 connection to the database.
+        :type connection: object
+        :param sql: SQL statement with bind parameters.
+        :type sql: str
+        :param params: Parameters of the statement.
+        :type params: list or dict
+        :return: List of records of the query plan.
+        :rtype: list
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(self._explain_keyword + sql, params)
+            return [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def get_index_sql(self, connection, table_name):
+        """
+        Get the statements creating the secondary indexes of a table.
+
+        Indexes created implicitly by primary key or unique constraints are not
+        included.
+
+        :param connection: DB-API 2.0 connection to the database.
+        :type connection: object
+        :param table_name: Name of the table.
+        :type table_name: str
+        :return: List of tuples of index name and `CREATE INDEX` statement.
+            `None` would be returned if the dialect could not list indexes.
+        :rtype: list
+        """
+        return None
+
+    def value2sql(self, value, value_type):
+        """
+        Convert a value into a SQL literal.
+
+        :param value: Value to be converted.
+        :type value: object
+        :param value_type: Type of the value.
+        :type value_type: ValueTypes
+        :return: A string of SQL literal. `None` would be returned if the value
+            could not be used in a SQL statement safely.
+        :rtype: str
+        """
+        if _is_stream(value):
+            value = self.read_stream(value, value_type)
+        return self._literal_renderer.render(value, value_type)
+
+    def values2sql(self, values, value_type):
+        """
+        Convert a list of values into SQL literals separated by commas, such
+        as the values of `IN` operators.
+
+        :param values: Values to be converted.
+        :type values: list
+        :param value_type: Type of the values.
+        :type value_type: ValueTypes
+        :return: A string of SQL literals. `None` would be returned if any
+            value could not be used in a SQL statement safely.
+        :rtype: str
+        """
+        return self._literal_renderer.render_list(values, value_type)
+
+    def bind_value(self, value, value_type):
+        """
+        Convert a value into the parameter object passed to the database
+        driver. Values are passed to the driver unchanged by default, so
+        binary values are not copied.
+
+        :param value: Value to be bound.
+        :type value: object
+        :param value_type: Type of the value.
+        :type value_type: ValueTypes
+        :return: Parameter object for the driver.
+        :rtype: object
+        """
+        if _is_stream(value):
+            return self.bind_stream(value, value_type)
+        return value
+
+    def bind_stream(self, stream, value_type):
+        """
+        Convert a large object stream into the parameter object passed to the
+        database driver.
+
+        :param stream: Stream of the large object.
+        :type stream: LOBStream
+        :param value_type: Type of the value.
+        :type value_type: ValueTypes
+        :return: The stream itself if the driver reads parameters
+            incrementally, otherwise the data read by :meth:`read_stream`.
+        :rtype: object
+        """
+        if self.stream_parameters:
+            return stream
+        return self.read_stream(stream, value_type)
+
+    def read_stream(self, stream, value_type):
+        """
+        Read a large object stream into memory.
+
+        :param stream: Stream of the large object.
+        :type stream: LOBStream
+        :param value_type: Type of the value.
+        :type value_type: ValueTypes
+        :return: Data of the object, as a `bytearray` for binary objects or a
+            string for character objects.
+        :rtype: object
+        """
+        if value_type == ValueTypes.BINARY:
+            return stream.read_all()
+        return stream.read_text()
+
+    def compile(self, statement, paramstyle=None):
+        """
+        Convert a statement object into a SQL statement with bind parameters.
+
+        :param statement: Statement to be converted.
+        :type statement: DMLBase
+        :param paramstyle: Style of the placeholders. Default by
+            :attr:`paramstyle`.
+        :type paramstyle: str
+        :return: Tuple of the SQL statement and its parameters, which is a list
+            or a dict according to the parameter style.
+        :rtype: tuple
+        """
+        binding = BindingDialect(self, paramstyle)
+        sql = statement.to_sql(binding)
+        return sql, binding.get_params()
+
+    def compile_to(self, writer, statement, paramstyle=None):
+        """
+        Write a statement object as a SQL statement with bind parameters into
+        a writer, such as a buffer of the database driver, in pieces.
+
+        :param writer: File-like object to write the SQL statement into.
+        :type writer: object
+        :param statement: Statement to be converted.
+        :type statement: DMLBase
+        :param paramstyle: Style of the placeholders. Default by
+            :attr:`paramstyle`.
+        :type paramstyle: str
+        :return: Parameters of the statement, which is a list or a dict
+            according to the parameter style.
+        :rtype: list or dict
+        """
+        binding = BindingDialect(self, paramstyle)
+        statement.write_sql(writer, binding)
+        return binding.get_params()
+
+    def prepare(self, cursor, name, sql):
+        """
+        Create a prepared statement on the database server.
+
+        Prepared statements are created by SQL `PREPARE` by default, with
+        placeholders in :attr:`prepared_paramstyle`.
+
+        :param cursor: Cursor of the connection to prepare the statement on.
+        :type cursor: object
+        :param name: Name of the prepared statement.
+        :type name: str
+        :param sql: SQL statement to be prepared.
+        :type sql: str
+        """
+        cursor.execute("".join(["PREPARE ", name, " AS ", sql]))
+
+    def execute_prepared(self, cursor, name, params):
+        """
+        Execute a prepared statement by SQL `EXECUTE`.
+
+        :param cursor: Cursor to execute the statement.
+        :type cursor: object
+        :param name: Name of the prepared statement.
+        :type name: str
+        :param params: Parameters of the statement.
+        :type params: list
+        """
+        sql_buffer = ["EXECUTE ", name]
+        if params:
+            binding = BindingDialect(self)
+            sql_buffer.extend([
+                " (", ", ".join([binding.get_placeholder(index + 1)
+                                 for index in range(len(params))]), ")"])
+            if self.paramstyle in ("named", "pyformat"):
+                params = dict([("p%d" % (index + 1), value)
+                               for index, value in enumerate(params)])
+        cursor.execute("".join(sql_buffer), params)
+
+    def deallocate(self, cursor, name):
+        """
+        Remove a prepared statement from the database server by SQL
+        `DEALLOCATE`.
+
+        :param cursor: Cursor of the connection the statement is prepared on.
+        :type cursor: object
+        :param name: Name of the prepared statement.
+        :type name: str
+        """
+        cursor.execute("".join(["DEALLOCATE ", name]))
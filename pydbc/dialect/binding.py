@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+from ..constants import ValueTypes
+
+
+class BindingDialect(object):
+    """
+    Dialect wrapper replacing values in SQL statements with bind parameters.
+
+    Names are converted by the wrapped dialect. Values of type
+    :attr:`~.constants.ValueTypes.OTHER`, such as column names, and values
+    without a type are still used in the statement directly.
+
+    :ivar Dialect _dialect: The wrapped dialect.
+    :ivar str _paramstyle: Style of the placeholders.
+    :ivar list _params: Bound values in order of the placeholders.
+    :ivar int _offset: Number of parameters placed before the statement.
+    """
+    _literal_types = (ValueTypes.OTHER, None)
+
+    def __init__(self, dialect, paramstyle=None, offset=0):
+        """
+        Initialize a `BindingDialect` object.
+
+        :param dialect: SQL dialect to be wrapped.
+        :type dialect: Dialect
+        :param paramstyle: Style of the placeholders. Besides the DB-API
+            styles, `dollar` creates placeholders like `$1` used by prepared
+            statements of some databases. Default by the style of the
+            dialect.
+        :type paramstyle: str
+        :param offset: Number of parameters placed before the statement, by
+            which placeholders are numbered, so that the statement could be
+            combined with other statements.
+        :type offset: int
+        """
+        self._dialect = dialect
+        self._paramstyle = paramstyle or dialect.paramstyle
+        self._params = []
+        self._offset = offset
+
+    def __getattr__(self, name):
+        return getattr(self._dialect, name)
+
+    def column2sql(self, column_name):
+        return self._dialect.column2sql(column_name)
+
+    def table2sql(self, table_name):
+        return self._dialect.table2sql(table_name)
+
+    def value2sql(self, value, value_type):
+        """
+        Bind a value and get the placeholder for it.
+
+        :param value: Value to be bound.
+        :type value: object
+        :param value_type: Type of the value.
+        :type value_type: ValueTypes
+        :return: Placeholder of the parameter.
+        :rtype: str
+        """
+        if value_type in self._literal_types:
+            return self._dialect.value2sql(value, value_type)
+        self._params.append(self._dialect.bind_value(value, value_type))
+        return self.get_placeholder(self._offset + len(self._params))
+
+    def values2sql(self, values, value_type):
+        """
+        Bind a list of values and get their placeholders separated by commas.
+
+        :param values: Values to be bound.
+        :type values: list
+        :param value_type: Type of the values.
+        :type value_type: ValueTypes
+        :return: Placeholders of the parameters.
+        :rtype: str
+        """
+        if value_type in self._literal_types:
+            return self._dialect.values2sql(values, value_type)
+        return ", ".join([self.value2sql(value, value_type)
+                          for value in values])
+
+    def get_placeholder(self, index):
+        """
+        Get the placeholder of a parameter in the style of the dialect.
+
+        :param index: Position of the parameter, starting from `1`.
+        :type index: int
+        :return: Placeholder of the parameter.
+        :rtype: str
+        """
+        style = self._paramstyle
+        if style == "qmark":
+            return "?"
+        elif style == "format":
+            return "%s"
+        elif style == "numeric":
+            return ":%d" % index
+        elif style == "named":
+            return ":p%d" % index
+        elif style == "pyformat":
+            return "%%(p%d)s" % index
+        elif style == "dollar":
+            return "$%d" % index
+        raise ValueError("Unsupported parameter style '%s'!" % style)
+
+    def get_params(self):
+        """
+        Get the bound values.
+
+        :return: List of values, or a dict of values by placeholder names for
+            named parameter styles.
+        :rtype: list or dict
+        """
+        if self._paramstyle in ("named", "pyformat"):
+            return dict([("p%d" % (self._offset + index + 1), value)
+                         for index, value in enumerate(self._params)])
+        return list(self._params)
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import binascii
+import datetime
+
+from ..constants import ValueTypes
+
+_INTEGER_TYPES = frozenset([int, long])
+_STRING_TYPES = frozenset([str, unicode])
+
+
+class LiteralRenderer(object):
+    """
+    Renderer converting values into SQL literals with the escaping rules of a
+    database, for statements which could not use bind parameters.
+
+    Quotes in strings are always escaped by doubling them. Strings containing
+    NUL characters are not rendered, since most databases end strings at
+    them. Values of other types are validated, so that they could not inject
+    SQL, and values of the wrong type are not rendered.
+
+    Large lists of integers or strings are rendered by
+    :meth:`render_list` in a single join pass, instead of formatting each
+    value.
+
+    :ivar bool backslash_escapes: A boolean indicating whether backslashes in
+        string literals are escape characters, like in MySQL, so that they are
+        doubled.
+    :ivar bool escape_prefix: A boolean indicating whether strings containing
+        backslashes are written as `E''` strings with doubled backslashes,
+        like in PostgreSQL, which are read the same whatever
+        `standard_conforming_strings` is.
+    :ivar bool national_prefix: A boolean indicating whether unicode strings
+        are written as `N''` strings, like in SQL Server.
+    :ivar tuple booleans: Literals of `False` and `True`.
+    """
+
+    def __init__(self, backslash_escapes=False, escape_prefix=False,
+                 national_prefix=False, booleans=("FALSE", "TRUE")):
+        """
+        Initialize a `LiteralRenderer` object.
+
+        :param backslash_escapes: Whether backslashes in string literals are
+            escape characters.
+        :type backslash_escapes: bool
+        :param escape_prefix: Whether strings containing backslashes are
+            written as `E''` strings.
+        :type escape_prefix: bool
+        :param national_prefix: Whether unicode strings are written as `N''`
+            strings.
+        :type national_prefix: bool
+        :param booleans: Literals of `False` and `True`.
+        :type booleans: tuple
+        """
+        self.backslash_escapes = backslash_escapes
+        self.escape_prefix = escape_prefix
+        self.national_prefix = national_prefix
+        self.booleans = booleans
+        self._renderers = {
+            ValueTypes.STRING: self.render_string,
+            ValueTypes.INTEGER: self.render_integer,
+            ValueTypes.LONG: self.render_integer,
+            ValueTypes.BINARY: self.render_binary,
+            ValueTypes.DECIMAL: self.render_decimal,
+            ValueTypes.FLOAT: self.render_float,
+            ValueTypes.BOOLEAN: self.render_boolean,
+            ValueTypes.DATE: self.render_date,
+            ValueTypes.DATETIME: self.render_datetime,
+            ValueTypes.UUID: self.render_uuid,
+        }
+
+    def render(self, value, value_type):
+        """
+        Convert a value into a SQL literal.
+
+        :param value: Value to be converted.
+        :type value: object
+        :param value_type: Type of the value. Values of type
+            :attr:`~.constants.ValueTypes.OTHER` or without a type are used
+            directly.
+        :type value_type: ValueTypes
+        :return: A string of SQL literal. `None` would be returned if the value
+            could not be used in a SQL statement safely.
+        :rtype: str
+        """
+        renderer = self._renderers.get(value_type)
+        if renderer is None:
+            return str(value)
+        return renderer(value)
+
+    def render_list(self, values, value_type):
+        """
+        Convert a list of values into SQL literals separated by commas.
+
+        Lists of integers or strings are rendered in a single pass.
+
+        :param values: Values to be converted.
+        :type values: list
+        :param value_type: Type of the values.
+        :type value_type: ValueTypes
+        :return: A string of SQL literals. `None` would be returned if any
+            value could not be used in a SQL statement safely.
+        :rtype: str
+        """
+        if not values:
+            return ""
+        if value_type in (ValueTypes.INTEGER, ValueTypes.LONG):
+            if set(map(type, values)) <= _INTEGER_TYPES:
+                return ", ".join(map(str, values))
+        elif value_type == ValueTypes.STRING:
+            sql = self._render_strings(values)
+            if sql is not False:
+                return sql
+        literals = [self.render(value, value_type) for value in values]
+        if None in literals:
+            return None
+        return ", ".join(literals)
+
+    def _render_strings(self, values):
+        # Join the values by NUL, which could not be part of any value, and
+        # escape all of them at once; returns False to render one by one
+        types = set(map(type, values))
+        if len(types) != 1 or not types <= _STRING_TYPES:
+            return False
+        joined = "\x00".join(values)
+        if joined.count("\x00") != len(values) - 1:
+            return None
+        if "\\" in joined:
+            if self.backslash_escapes:
+                joined = joined.replace("\\", "\\\\")
+            elif self.escape_prefix:
+                return False
+        prefix = "N'" if self.national_prefix and unicode in types else "'"
+        return "".join([prefix, joined.replace("'", "''").replace(
+            "\x00", "', " + prefix), "'"])
+
+    def render_string(self, value):
+        """
+        Convert a string into a SQL string literal.
+
+        :param value: String to be converted.
+        :type value: str or unicode
+        :return: A string of SQL literal, or `None` if the string contains NUL
+            characters.
+        :rtype: str
+        """
+        if not isinstance(value, basestring):
+            value = str(value)
+        if "\x00" in value:
+            return None
+        prefix = "'"
+        if "\\" in value:
+            if self.backslash_escapes:
+                value = value.replace("\\", "\\\\")
+            elif self.escape_prefix:
+                value = value.replace("\\", "\\\\")
+                prefix = "E'"
+        if self.national_prefix and isinstance(value, unicode):
+            prefix = "N'"
+        return "".join([prefix, value.replace("'", "''"), "'"])
+
+    def render_integer(self, value):
+        """
+        Convert an integer into a SQL literal. Values are never truncated,
+        so only integers, and strings or decimals of integral values are
+        converted.
+
+        :param value: Integer to be converted.
+        :type value: int or long or str or decimal.Decimal
+        :return: A string of SQL literal, or `None` if the value is not an
+            integer.
+        :rtype: str
+        """
+        if type(value) in _INTEGER_TYPES:
+            return str(value)
+        if isinstance(value, (int, long, basestring)):
+            try:
+                return str(int(value))
+            except ValueError:
+                return None
+        # The decimal module is slow to import, only use it when required
+        import decimal
+        if isinstance(value, decimal.Decimal) and value.is_finite() and \
+                value == value.to_integral_value():
+            return str(int(value))
+        return None
+
+    def render_float(self, value):
+        """
+        Convert a float into a SQL literal.
+
+        :param value: Float to be converted.
+        :type value: float
+        :return: A string of SQL literal, or `None` if the value is not a
+            finite number.
+        :rtype: str
+        """
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        if value != value or value in (float("inf"), float("-inf")):
+            return None
+        return repr(value)
+
+    def render_decimal(self, value):
+        """
+        Convert a decimal into a SQL literal.
+
+        :param value: Decimal to be converted.
+        :type value: decimal.Decimal
+        :return: A string of SQL literal, or `None` if the value is not a
+            finite number.
+        :rtype: str
+        """
+        # The decimal module is slow to import, only use it when required
+        import decimal
+        if not isinstance(value, decimal.Decimal):
+            try:
+                value = decimal.Decimal(value)
+            except (TypeError, ValueError, decimal.InvalidOperation):
+                return None
+        if not value.is_finite():
+            return None
+        return str(value)
+
+    def render_boolean(self, value):
+        """
+        Convert a boolean into a SQL literal.
+
+        :param value: Boolean to be converted, or the integer 0 or 1.
+        :type value: bool or int
+        :return: A string of SQL literal, or `None` if the value is not a
+            boolean.
+        :rtype: str
+        """
+        if isinstance(value, bool) or \
+                type(value) in _INTEGER_TYPES and value in (0, 1):
+            return self.booleans[bool(value)]
+        return None
+
+    def render_binary(self, value):
+        """
+        Convert a binary string into a SQL hexadecimal literal.
+
+        :param value: Binary string to be converted.
+        :type value: str or bytearray or buffer or memoryview
+        :return: A string of SQL literal, or `None` if the value is not a
+            binary string.
+        :rtype: str
+        """
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        elif not isinstance(value, (str, bytearray, buffer)):
+            return None
+        return "".join(["X'", binascii.hexlify(value), "'"])
+
+    def render_date(self, value):
+        """
+        Convert a date into a SQL literal.
+
+        :param value: Date to be converted.
+        :type value: datetime.date
+        :return: A string of SQL literal, or `None` if the value is not a
+            date.
+        :rtype: str
+        """
+        if not isinstance(value, datetime.date):
+            return None
+        return "".join(["'", value.isoformat(), "'"])
+
+    def render_datetime(self, value):
+        """
+        Convert a date and time into a SQL literal.
+
+        :param value: Date and time to be converted.
+        :type value: datetime.datetime
+        :return: A string of SQL literal, or `None` if the value is not a
+            date and time.
+        :rtype: str
+        """
+        if not isinstance(value, datetime.datetime):
+            return None
+        return "".join(["'", value.isoformat(" "), "'"])
+
+    def render_uuid(self, value):
+        """
+        Convert a UUID into a SQL literal of its canonical form.
+
+        :param value: UUID to be converted, or a string of UUID.
+        :type value: uuid.UUID or str
+        :return: A string of SQL literal, or `None` if the value is not a
+            UUID.
+        :rtype: str
+        """
+        # The uuid module is slow to import, only use it when required
+        import uuid
+        if not isinstance(value, uuid.UUID):
+            if not isinstance(value, basestring):
+                return None
+            try:
+                value = uuid.UUID(value)
+            except ValueError:
+                return None
+        return "".join(["'", str(value), "'"])
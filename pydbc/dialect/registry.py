@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import importlib
+
+
+class UnsupportedDialectError(ValueError):
+    """
+    The error raised if a SQL dialect could not be found by name.
+    """
+
+    def __init__(self, name):
+        """
+        Initialize UnsupportedDialectError.
+
+        :param name: Name of the requested dialect.
+        :type name: str
+        """
+        msg = "Unsupported SQL dialect '%s'!" % name
+        super(UnsupportedDialectError, self).__init__(msg)
+
+
+class DialectRegistry(object):
+    """
+    Registry resolving SQL dialect classes by name.
+
+    Dialects are registered as import paths in form of `module:Class`, which
+    are only imported when the dialect is requested for the first time.
+    Dialects which are not registered are searched in the `pydbc.dialects`
+    entry point group of installed packages.
+
+    .. note:: This class is never instantiated.
+
+    :cvar str ENTRY_POINT_GROUP: Entry point group of third-party dialects.
+    """
+    ENTRY_POINT_GROUP = "pydbc.dialects"
+
+    _dialects = {
+        "generic": "pydbc.dialect.base_dialect:Dialect",
+        "sqlite": "pydbc.dialect.sqlite_dialect:SQLiteDialect",
+    }
+    _loaded = {}
+
+    @classmethod
+    def register(cls, name, dialect):
+        """
+        Register a dialect by name.
+
+        :param name: Name of the dialect.
+        :type name: str
+        :param dialect: Dialect class, or import path of the dialect class in
+            form of `module:Class`.
+        :type dialect: type or str
+        """
+        cls._loaded.pop(name, None)
+        cls._dialects[name] = dialect
+
+    @classmethod
+    def get_names(cls):
+        """
+        Get names of the registered dialects.
+
+        .. note:: Dialects only available through entry points are not
+            included.
+
+        :return: Sorted list of dialect names.
+        :rtype: list
+        """
+        return sorted(cls._dialects)
+
+    @classmethod
+    def load(cls, name):
+        """
+        Get a dialect class by name, importing it if needed.
+
+        :param name: Name of the dialect.
+        :type name: str
+        :return: The dialect class.
+        :rtype: type
+        :raises UnsupportedDialectError: If no dialect is found by the name.
+        """
+        dialect = cls._loaded.get(name)
+        if dialect is not None:
+            return dialect
+        target = cls._dialects.get(name)
+        if target is None:
+            target = cls._find_entry_point(name)
+        if isinstance(target, basestring):
+            module_name, class_name = target.split(":", 1)
+            module = importlib.import_module(module_name)
+            dialect = getattr(module, class_name)
+        else:
+            dialect = target
+        cls._loaded[name] = dialect
+        return dialect
+
+    @classmethod
+    def create(cls, name):
+        """
+        Create a dialect instance by name.
+
+        :param name: Name of the dialect.
+        :type name: str
+        :return: The dialect object.
+        :rtype: Dialect
+        :raises UnsupportedDialectError: If no dialect is found by the name.
+        """
+        return cls.load(name)()
+
+    @classmethod
+    def _find_entry_point(cls, name):
+        try:
+            # pkg_resources is slow to import, only use it when required
+            import pkg_resources
+        except ImportError:
+            raise UnsupportedDialectError(name)
+        for entry_point in pkg_resources.iter_entry_points(
+                cls.ENTRY_POINT_GROUP, name):
+            return entry_point.load()
+        raise UnsupportedDialectError(name)
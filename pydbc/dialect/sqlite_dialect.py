@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+
+from .base_dialect import Dialect
+from .literal import LiteralRenderer
+from ..constants import SQLTypes, ValueTypes
+
+
+class SQLiteDialect(Dialect):
+    """
+    SQL dialect of SQLite, to be used with the `sqlite3` module.
+
+    The `sqlite3` module caches compiled statements of each connection by SQL
+    itself, sized by the `cached_statements` argument of `connect`, so
+    statements are not prepared by :class:`~.executor.Executor`.
+
+    Binary values are bound as `buffer` objects sharing the memory of `str`
+    and `bytearray` values, while `memoryview` values are copied, since
+    `sqlite3` does not accept them.
+
+    .. note:: This class is subclass of :class:`Dialect`.
+    """
+    _table_quote = "\""
+    _column_quote = "\""
+    _explain_keyword = "EXPLAIN QUERY PLAN "
+    _literal_renderer = LiteralRenderer(booleans=("0", "1"))
+
+    # Names with the type affinities of SQLite, which ignores lengths
+    _type_names = {
+        SQLTypes.BIT: "INTEGER",
+        SQLTypes.SMALLINT: "INTEGER",
+        SQLTypes.INTEGER: "INTEGER",
+        SQLTypes.BIGINT: "INTEGER",
+        SQLTypes.REAL: "REAL",
+        SQLTypes.NUMERIC: "NUMERIC",
+        SQLTypes.DECIMAL: "NUMERIC",
+        SQLTypes.CHAR: "TEXT",
+        SQLTypes.VARCHAR: "TEXT",
+        SQLTypes.LONG_VARCHAR: "TEXT",
+        SQLTypes.BINARY: "BLOB",
+        SQLTypes.VARBINARY: "BLOB",
+        SQLTypes.LONG_VARBINARY: "BLOB",
+        SQLTypes.BLOB: "BLOB",
+        SQLTypes.CLOB: "TEXT",
+        SQLTypes.DATE: "DATE",
+        SQLTypes.TIMESTAMP: "TIMESTAMP",
+    }
+    _sized_types = ()
+
+    paramstyle = "qmark"
+    # SQLITE_MAX_VARIABLE_NUMBER of SQLite builds before 3.32.0
+    max_parameters = 999
+    # Values of any type could be stored in any column of SQLite
+    dynamic_union_types = True
+    # SQLITE_MAX_COMPOUND_SELECT of default SQLite builds
+    max_union_selects = 500
+    # UPDATE ... FROM is supported since SQLite 3.33.0
+    multi_table_update = "from" \
+        if sqlite3.sqlite_version_info >= (3, 33, 0) else None
+
+    def name2type(self, type_name):
+        # Rules of type affinity in SQLite
+        name = type_name.upper()
+        if "INT" in name:
+            return SQLTypes.INTEGER
+        elif "CHAR" in name or "CLOB" in name or "TEXT" in name:
+            return SQLTypes.VARCHAR
+        elif "BLOB" in name or not name:
+            return SQLTypes.BLOB
+        elif "REAL" in name or "FLOA" in name or "DOUB" in name:
+            return SQLTypes.REAL
+        elif name.startswith("DATETIME") or name.startswith("TIMESTAMP"):
+            return SQLTypes.TIMESTAMP
+        elif name.startswith("DATE"):
+            return SQLTypes.DATE
+        return SQLTypes.NUMERIC
+
+    def reflect_table(self, connection, table_name):
+        from ..reflection import ColumnMetadata, IndexMetadata, TableMetadata
+        name = "".join(["\"", table_name.replace("\"", "\"\""), "\""])
+        cursor = connection.cursor()
+        try:
+            cursor.execute("PRAGMA table_info(%s)" % name)
+            rows = cursor.fetchall()
+            if not rows:
+                return None
+            columns = []
+            primary_key = []
+            for _, column_name, type_name, not_null, _, pk in rows:
+                columns.append(ColumnMetadata(
+                    column_name, type_name, self.name2type(type_name),
+                    not not_null))
+                if pk:
+                    primary_key.append((pk, column_name))
+            indexes = []
+            cursor.execute("PRAGMA index_list(%s)" % name)
+            for row in cursor.fetchall():
+                index_name, unique = row[1], row[2]
+                cursor.execute("PRAGMA index_info(%s)" % "".join([
+                    "\"", index_name.replace("\"", "\"\""), "\""]))
+                indexes.append(IndexMetadata(
+                    index_name, [col[2] for col in cursor.fetchall()],
+                    bool(unique)))
+        finally:
+            cursor.close()
+        return TableMetadata(table_name, columns,
+                             [col for _, col in sorted(primary_key)], indexes)
+
+    def get_index_sql(self, connection, table_name):
+        cursor = connection.cursor()
+        try:
+            # Indexes of constraints are listed without SQL statements
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = ? AND sql IS NOT NULL ORDER BY name",
+                (table_name, ))
+            return [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def bind_value(self, value, value_type):
+        value = super(SQLiteDialect, self).bind_value(value, value_type)
+        if value_type == ValueTypes.BINARY:
+            if isinstance(value, memoryview):
+                # sqlite3 only accepts buffer objects for BLOB parameters,
+                # which could not be created from memoryview objects, so
+                # the data of memoryview objects is copied
+                return buffer(value.tobytes())
+            if not isinstance(value, buffer):
+                # Buffers share the memory of str and bytearray objects
+                return buffer(value)
+        elif value_type in (ValueTypes.DECIMAL, ValueTypes.UUID):
+            # Stored as text to keep the precision and the format
+            return str(value)
+        return value
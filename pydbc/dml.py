@@ -87,6 +87,21 @@ Select
 .. autoclass:: pydbc.dml.Select
     :members:
 
+Insert
+~~~~~~
+.. autoclass:: pydbc.dml.Insert
+    :members:
+
+Update
+~~~~~~
+.. autoclass:: pydbc.dml.Update
+    :members:
+
+Delete
+~~~~~~
+.. autoclass:: pydbc.dml.Delete
+    :members:
+
 DML Exceptions
 --------------
 NoneColumnNameError
@@ -103,6 +118,11 @@ UnsupportedJoinTypeError
 ~~~~~~~~~~~~~~~~~~~~~~~~
 .. autoclass:: pydbc.dml.UnsupportedJoinTypeError
     :members:
+
+UnsupportedValueError
+~~~~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.dml.UnsupportedValueError
+    :members:
 """
 
 from abc import ABCMeta, abstractmethod
@@ -146,6 +166,24 @@ class DMLBase(object):
         """
         pass
 
+    def write_sql(self, writer, dialect):
+        """
+        Write the SQL statement of this object into a writer.
+
+        Large statements and clauses are written in pieces, so that the
+        memory used does not depend on the size of the statement. Other
+        objects are written by :meth:`to_sql` at once.
+
+        :param writer: File-like object to write the SQL statement into, like
+            a :class:`~.render.SQLWriter` object.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        """
+        writer.write(self.to_sql(dialect))
+
     def create_keyword(self):
         """
         Create the keyword string of current statement.
@@ -236,6 +274,46 @@ class ClauseBase(DMLBase):
                     sql_buffer.append(column)
         return "".join(sql_buffer)
 
+    def write_sql(self, writer, dialect):
+        """
+        Write the clause into a writer column by column.
+
+        :param writer: File-like object to write the clause into.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        """
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            writer.write(self.create_keyword())
+            writer.write(self._raw_sql)
+        elif self.get_size() > 0:
+            writer.write(self.create_keyword())
+            for col in self._columns:
+                col.write_sql(writer, dialect)
+
+    def get_columns(self):
+        """
+        Get the column attributes of current clause.
+
+        :return: List of column attributes.
+        :rtype: list
+        """
+        return self._columns
+
+    def set_columns(self, columns):
+        """
+        Replace the column attributes of current clause.
+
+        :param columns: List of column attributes for current clause to use.
+        :type columns: list
+        """
+        self._columns = list(columns)
+        for index, col in enumerate(self._columns):
+            col.is_first = index == 0
+
     def get_size(self):
         """
         Get number of the columns in current clause.
@@ -258,6 +336,7 @@ class ClauseBase(DMLBase):
 #   1. NoneColumnNameError
 #   2. NoneTableNameError
 #   3. UnsupportedJoinTypeError
+#   4. UnsupportedValueError
 # ========================
 class NoneColumnNameError(ValueError):
     """
@@ -298,6 +377,19 @@ class UnsupportedJoinTypeError(ValueError):
         super(UnsupportedJoinTypeError, self).__init__(msg)
 
 
+class UnsupportedValueError(ValueError):
+    """
+    The error raised if a value could not be used in a SQL statement.
+    """
+
+    def __init__(self):
+        """
+        Initialize UnsupportedValueError.
+        """
+        msg = "Unsupported value in SQL statement!"
+        super(UnsupportedValueError, self).__init__(msg)
+
+
 # =====================
 # Basic SQL Components:
 #   1. Table
@@ -320,6 +412,8 @@ class Table(DMLBase):
         with the previous table.
     :ivar bool is_first: A boolean indicating if current column is the first
         column in a column list.
+    :ivar list unique_keys: Declared unique keys of the target table. Each key
+        is a list of column names.
 
     .. seealso:: :class:`~.constants.JoinTypes`.
     """
@@ -329,6 +423,7 @@ class Table(DMLBase):
     join = None
     condition = None
     is_first = True
+    unique_keys = None
 
     def __init__(self, name=None, alias=None, select=None, is_first=True):
         """
@@ -420,7 +515,11 @@ class Column(DMLBase):
         descending order.
     :ivar bool is_first: A boolean indicating if current column is the first
         column in a column list.
+    :cvar int WRITE_CHUNK_SIZE: Number of values in a value list written at
+        once by :meth:`write_sql`.
     """
+    WRITE_CHUNK_SIZE = 1000
+
     name = ""
     table = None
     func = None
@@ -463,6 +562,73 @@ class Column(DMLBase):
         if self._raw_sql:
             # Use raw SQL statement if exists
             return self._raw_sql
+        col_buffer = self._create_head(dialect)
+        # Add operator & value
+        if self.compare is not None and self.value is not None:
+            op, val = SQLUtils.get_operator_with_value(
+                self.compare, self.value)
+            col_buffer.append(op)
+            if self.compare not in (CompareTypes.NULL, CompareTypes.NOT_NULL):
+                if isinstance(val, (list, tuple)):
+                    # Add value list for IN operators
+                    values = dialect.values2sql(val, self.type)
+                    if values is None:
+                        return None
+                    val = "".join(["(", values, ")"])
+                else:
+                    val = dialect.value2sql(val, self.type)
+                    if val is None:
+                        # Ignore values which could not be used safely
+                        return None
+                col_buffer.append(val)
+        self._add_alias(col_buffer, dialect)
+        return "".join(col_buffer)
+
+    def write_sql(self, writer, dialect):
+        """
+        Write the column into a writer. Value lists of `IN` operators are
+        written in chunks.
+
+        .. note:: Unlike :meth:`to_sql`, which leaves out columns with values
+            which could not be used safely, an error is raised for such
+            values in a value list, since the values written before could not
+            be taken back.
+
+        :param writer: File-like object to write the column into.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :raises UnsupportedValueError: If any value in a value list could not
+            be used in SQL statement.
+        """
+        if self._raw_sql or self.compare in (
+                None, CompareTypes.NULL, CompareTypes.NOT_NULL) \
+                or not isinstance(self.value, (list, tuple)):
+            column = self.to_sql(dialect)
+            if column is not None:
+                writer.write(column)
+            return
+        col_buffer = self._create_head(dialect)
+        col_buffer.append(
+            SQLUtils.get_operator_with_value(self.compare, self.value)[0])
+        col_buffer.append("(")
+        writer.write("".join(col_buffer))
+        values = self.value
+        for start in xrange(0, len(values), self.WRITE_CHUNK_SIZE):
+            chunk = dialect.values2sql(
+                values[start:start + self.WRITE_CHUNK_SIZE], self.type)
+            if chunk is None:
+                raise UnsupportedValueError
+            if start > 0:
+                writer.write(", ")
+            writer.write(chunk)
+        col_buffer = [")"]
+        self._add_alias(col_buffer, dialect)
+        writer.write("".join(col_buffer))
+
+    def _create_head(self, dialect):
         col_buffer = []
         # Create table name with or without table name
         if self.table is not None:
@@ -472,10 +638,6 @@ class Column(DMLBase):
             ])
         else:
             col_name = dialect.column2sql(self.name)
-        # Ignore column values with " or '
-        if self.value is not None and self.type == ValueTypes.STRING:
-            if "'" in self.value or "\"" in self.value:
-                return None
         if not self.is_first:
             if self.relation is not None:
                 # Add relation key word
@@ -493,19 +655,12 @@ class Column(DMLBase):
             # Add aggregate function
             func = SQLUtils.get_aggr_func_with_column(self.func, col_name)
             col_buffer.append(func)
-        # Add operator & value
-        if self.compare is not None and self.value is not None:
-            op, val = SQLUtils.get_operator_with_value(
-                self.compare, self.value)
-            col_buffer.append(op)
-            if self.type == ValueTypes.STRING:
-                val = "".join(["'", val, "'"])
-            col_buffer.append(str(val))
-        # Add alias
+        return col_buffer
+
+    def _add_alias(self, col_buffer, dialect):
         if self.alias is not None:
             col_buffer.append(SQLUtils.get_sql_as_keyword())
             col_buffer.append(dialect.column2sql(self.alias))
-        return "".join(col_buffer)
 
 
 class Condition(DMLBase):
@@ -629,6 +784,26 @@ class JoinedConditions(DMLBase):
             column_1, column_2, compare_type, relation_type, is_first)
         )
 
+    def get_conditions(self):
+        """
+        Get the sub-conditions of current join condition.
+
+        :return: List of sub-conditions.
+        :rtype: list
+        """
+        return self._conditions
+
+    def set_conditions(self, conditions):
+        """
+        Replace the sub-conditions of current join condition.
+
+        :param conditions: List of sub-conditions used in a SQL join condition.
+        :type conditions: list
+        """
+        self._conditions = list(conditions)
+        for index, condition in enumerate(self._conditions):
+            condition.is_first = index == 0
+
     def get_size(self):
         """
         Get number of the sub-conditions in current join condition.
@@ -690,7 +865,8 @@ class JoinedTables(DMLBase):
         self._tables = []
 
     def add_table(self, name=None, alias=None, select=None,
-                  join=JoinTypes.INNER_JOIN, condition=None):
+                  join=JoinTypes.INNER_JOIN, condition=None,
+                  unique_keys=None):
         """
         A table into the table list.
 
@@ -707,11 +883,15 @@ class JoinedTables(DMLBase):
         :param condition: The condition for combining current table
             with the previous table.
         :type condition: JoinedConditions
+        :param unique_keys: Declared unique keys of the target table. Each key
+            is a list of column names. Default by `None`.
+        :type unique_keys: list
         :raises UnsupportedJoinTypeError: If join condition is not provided
             while current table is not the first in the table list.
         """
         is_first = self.get_size() == 0
         table = Table(name, alias, select, is_first)
+        table.unique_keys = unique_keys
         if not is_first:
             if condition is None:
                 raise UnsupportedJoinTypeError
@@ -719,6 +899,26 @@ class JoinedTables(DMLBase):
             table.condition = condition
         self._tables.append(table)
 
+    def get_tables(self):
+        """
+        Get the tables or result tables in current table list.
+
+        :return: List of tables or result tables.
+        :rtype: list
+        """
+        return self._tables
+
+    def remove_table(self, table):
+        """
+        Remove a table from the table list.
+
+        :param table: Table object in current table list to be removed.
+        :type table: Table
+        """
+        self._tables.remove(table)
+        if self._tables:
+            self._tables[0].is_first = True
+
     def get_size(self):
         """
         Get number of the tables to be used in current SQL.
@@ -754,6 +954,24 @@ class JoinedTables(DMLBase):
             tables_buffer.append(table.to_sql(dialect))
         return "".join(tables_buffer)
 
+    def write_sql(self, writer, dialect):
+        """
+        Write the tables into a writer table by table.
+
+        :param writer: File-like object to write the tables into.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        """
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            writer.write(self._raw_sql)
+            return
+        for table in self._tables:
+            table.write_sql(writer, dialect)
+
 
 # ====================
 # Generic SQL clauses:
@@ -959,6 +1177,9 @@ class OrderBy(ClauseBase):
 # =======================
 # Generic DML statements:
 #   1. Select
+#   2. Insert
+#   3. Update
+#   4. Delete
 # =======================
 class Select(DMLBase):
     """
@@ -1032,6 +1253,26 @@ class Select(DMLBase):
         else:
             raise NoneColumnNameError
 
+    def get_columns(self):
+        """
+        Get the columns for selecting data from.
+
+        :return: List of columns for selecting data.
+        :rtype: list
+        """
+        return self._columns
+
+    def set_columns(self, columns):
+        """
+        Replace the columns for selecting data from.
+
+        :param columns: List of columns for selecting data.
+        :type columns: list
+        """
+        self._columns = list(columns)
+        for index, col in enumerate(self._columns):
+            col.is_first = index == 0
+
     def set_distinct(self, distinct):
         """
         Set whether to use `DISTINCT` keyword in the SQL `SELECT` statement or
@@ -1043,6 +1284,17 @@ class Select(DMLBase):
         """
         self._distinct = distinct
 
+    def get_distinct(self):
+        """
+        Get whether to use `DISTINCT` keyword in the SQL `SELECT` statement or
+        not.
+
+        :return: A boolean indicating whether to return only distinct
+            (different) values or not.
+        :rtype: bool
+        """
+        return self._distinct
+
     def set_tables(self, tables):
         """
         Set the target table to select data from.
@@ -1195,3 +1447,632 @@ class Select(DMLBase):
             if self._order_by:
                 sql_buffer.append(self._order_by.to_sql(dialect))
         return "".join(sql_buffer)
+
+    def write_sql(self, writer, dialect):
+        """
+        Write the SQL `SELECT` statement into a writer clause by clause.
+
+        :param writer: File-like object to write the statement into.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :raises NoneTableNameError: If table(s) for selecting data from is not
+            set.
+        """
+        writer.write(self.create_keyword())
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            writer.write(self._raw_sql)
+            return
+        if not isinstance(self._tables, JoinedTables):
+            raise NoneTableNameError
+        if len(self._columns) > 0:
+            for col in self._columns:
+                col.write_sql(writer, dialect)
+        else:
+            writer.write(SQLUtils.get_sql_all_columns())
+        writer.write(SQLUtils.get_sql_from_keyword())
+        self._tables.write_sql(writer, dialect)
+        for clause in (self._where, self._group_by, self._having,
+                       self._order_by):
+            if clause:
+                clause.write_sql(writer, dialect)
+
+
+class Insert(DMLBase):
+    """
+    Create SQL `INSERT` statement to insert records into a table.
+
+    :cvar str _table: Name of the table to insert records into.
+    :cvar list _columns: A list of columns to insert values into.
+    :cvar list _rows: A list of records to be inserted. Each record is a list
+        of values in the order of the columns.
+    """
+    _table = None
+    _columns = []
+    _rows = []
+
+    def __init__(self):
+        """
+        Initialize an `Insert` object for generating a SQL insert statement.
+        """
+        super(Insert, self).__init__()
+        self.clear()
+
+    def clear(self):
+        """
+        Reset current `Insert` object.
+        """
+        self._raw_sql = None
+        self._table = None
+        self._columns = []
+        self._rows = []
+
+    def set_table(self, table_name):
+        """
+        Set the table to insert records into.
+
+        :param table_name: Name of the target table.
+        :type table_name: str
+        """
+        self._table = table_name
+
+    def get_table(self):
+        """
+        Get the table to insert records into.
+
+        :return: Name of the target table.
+        :rtype: str
+        """
+        return self._table
+
+    def add_column(self, column_name, column_type=ValueTypes.STRING):
+        """
+        Add a column to insert values into.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param column_type: Data type of the values for target column.
+        :type column_type: ValueTypes
+        :raises NoneColumnNameError: If column name is `None`.
+
+        .. note:: Values of `BINARY` and `STRING` columns could be file-like
+            objects or iterables of chunks wrapped by
+            :class:`~.lob.LOBStream`, to insert large objects.
+        """
+        if column_name is not None:
+            is_first = len(self._columns) == 0
+            column = Column(column_name, is_first)
+            column.type = column_type
+            self._columns.append(column)
+        else:
+            raise NoneColumnNameError
+
+    def get_columns(self):
+        """
+        Get the columns to insert values into.
+
+        :return: List of columns.
+        :rtype: list
+        """
+        return self._columns
+
+    def add_row(self, values):
+        """
+        Add a record to be inserted.
+
+        :param values: Values of the record in the order of the columns.
+            `None` values are inserted as `NULL`.
+        :type values: list
+        :raises UnsupportedValueError: If number of the values does not match
+            number of the columns.
+        """
+        if len(values) != len(self._columns):
+            raise UnsupportedValueError
+        self._rows.append(list(values))
+
+    def get_rows(self):
+        """
+        Get the records to be inserted.
+
+        :return: List of records.
+        :rtype: list
+        """
+        return self._rows
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `INSERT` statement.
+
+        :return: Keyword string of SQL `INSERT` statement.
+        :rtype: str
+        """
+        return "INSERT INTO "
+
+    def to_sql(self, dialect):
+        """
+        Convert `Insert` object to be a SQL `INSERT` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `INSERT` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table for inserting records is not set.
+        :raises UnsupportedValueError: If no record is added or any value
+            could not be used in SQL statement.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        if not self._rows:
+            raise UnsupportedValueError
+        sql_buffer.append(dialect.table2sql(self._table))
+        # Add columns
+        sql_buffer.append(" (")
+        for col in self._columns:
+            sql_buffer.append(col.to_sql(dialect))
+        sql_buffer.append(") VALUES ")
+        # Add values
+        for index, row in enumerate(self._rows):
+            if index > 0:
+                sql_buffer.append(", ")
+            sql_buffer.append("(")
+            for col, value in zip(self._columns, row):
+                if not col.is_first:
+                    sql_buffer.append(", ")
+                if value is None:
+                    sql_buffer.append("NULL")
+                    continue
+                value = dialect.value2sql(value, col.type)
+                if value is None:
+                    raise UnsupportedValueError
+                sql_buffer.append(value)
+            sql_buffer.append(")")
+        return "".join(sql_buffer)
+
+    def write_sql(self, writer, dialect):
+        """
+        Write the SQL `INSERT` statement into a writer record by record.
+
+        :param writer: File-like object to write the statement into.
+        :type writer: object
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :raises NoneTableNameError: If table for inserting records is not set.
+        :raises UnsupportedValueError: If no record is added or any value
+            could not be used in SQL statement.
+        """
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            writer.write(self.create_keyword())
+            writer.write(self._raw_sql)
+            return
+        if self._table is None:
+            raise NoneTableNameError
+        if not self._rows:
+            raise UnsupportedValueError
+        sql_buffer = [self.create_keyword(), dialect.table2sql(self._table),
+                      " ("]
+        for col in self._columns:
+            sql_buffer.append(col.to_sql(dialect))
+        sql_buffer.append(") VALUES ")
+        writer.write("".join(sql_buffer))
+        for index, row in enumerate(self._rows):
+            row_buffer = [", (" if index > 0 else "("]
+            for col, value in zip(self._columns, row):
+                if not col.is_first:
+                    row_buffer.append(", ")
+                if value is None:
+                    row_buffer.append("NULL")
+                    continue
+                value = dialect.value2sql(value, col.type)
+                if value is None:
+                    raise UnsupportedValueError
+                row_buffer.append(value)
+            row_buffer.append(")")
+            writer.write("".join(row_buffer))
+
+
+class Update(DMLBase):
+    """
+    Create SQL `UPDATE` statement to update records of a table, optionally
+    joined with other tables, so that one statement could replace updates
+    of single records.
+
+    Joined tables are rendered in the form of
+    :attr:`~.dialect.Dialect.multi_table_update`: `UPDATE ... FROM` like
+    PostgreSQL and SQLite, `UPDATE t1 JOIN t2 ... SET` like MySQL, or an
+    `EXISTS` subquery filtering the updated records otherwise. Conditions
+    joining the updated table with the other tables are set in the `Where`
+    clause, with values of type `OTHER` like `o.customer_id=c.id`.
+
+    New values of type `OTHER` could refer to columns of the joined tables.
+    Since the joined tables are only visible inside the subquery of the
+    `EXISTS` form, such values are rendered as correlated scalar subqueries
+    over the joined tables in that form.
+
+    :cvar str _table: Name of the table to be updated.
+    :cvar str _alias: Alias of the table to be updated.
+    :cvar list _columns: A list of columns to be set to new values.
+    :cvar JoinedTables _tables: Other tables joined with the updated table.
+    :cvar Where _where: Object to create SQL `WHERE` clause to filter records.
+    """
+    _table = None
+    _alias = None
+    _columns = []
+    _tables = None
+    _where = None
+
+    def __init__(self):
+        """
+        Initialize an `Update` object for generating a SQL update statement.
+        """
+        super(Update, self).__init__()
+        self.clear()
+
+    def clear(self):
+        """
+        Reset current `Update` object.
+        """
+        self._raw_sql = None
+        self._table = None
+        self._alias = None
+        self._columns = []
+        self._tables = None
+        self._where = None
+
+    def set_table(self, table_name, alias=None):
+        """
+        Set the table to be updated.
+
+        :param table_name: Name of the target table.
+        :type table_name: str
+        :param alias: Alias of the target table. Default by `None`.
+        :type alias: str
+        """
+        self._table = table_name
+        self._alias = alias
+
+    def get_table(self):
+        """
+        Get the table to be updated.
+
+        :return: Name of the target table.
+        :rtype: str
+        """
+        return self._table
+
+    def get_alias(self):
+        """
+        Get the alias of the table to be updated.
+
+        :return: Alias of the target table.
+        :rtype: str
+        """
+        return self._alias
+
+    def add_column(self, column_name, column_value,
+                   column_type=ValueTypes.STRING):
+        """
+        Add a column to be set to a new value.
+
+        :param column_name: Column name of target column.
+        :type column_name: str
+        :param column_value: New value of the column. `None` sets the column
+            to `NULL`. Values of type `OTHER` are used directly, such as
+            columns of the joined tables.
+        :type column_value: object
+        :param column_type: Data type of the value.
+        :type column_type: ValueTypes
+        :raises NoneColumnNameError: If column name is `None`.
+        """
+        if column_name is None:
+            raise NoneColumnNameError
+        column = Column(column_name, len(self._columns) == 0)
+        column.value = column_value
+        column.type = column_type
+        self._columns.append(column)
+
+    def get_columns(self):
+        """
+        Get the columns to be set.
+
+        :return: List of columns.
+        :rtype: list
+        """
+        return self._columns
+
+    def set_tables(self, tables):
+        """
+        Set the other tables joined with the updated table.
+
+        :param tables: Tables joined with the updated table.
+        :type tables: JoinedTables
+        """
+        self._tables = tables
+
+    def get_tables(self):
+        """
+        Get the other tables joined with the updated table.
+
+        :return: Tables joined with the updated table.
+        :rtype: JoinedTables
+        """
+        return self._tables
+
+    def set_where(self, where):
+        """
+        Set DML `Where` object for creating SQL `UPDATE` statement.
+
+        :param where: Object to create SQL `WHERE` clause to filter records.
+        :type where: Where
+        """
+        self._where = where
+
+    def get_where(self):
+        """
+        Get DML `Where` object of SQL `UPDATE` statement.
+
+        :return: Object to create SQL `WHERE` clause to filter records.
+        :rtype: Where
+        """
+        return self._where
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `UPDATE` statement.
+
+        :return: Keyword string of SQL `UPDATE` statement.
+        :rtype: str
+        """
+        return "UPDATE "
+
+    def to_sql(self, dialect):
+        """
+        Convert `Update` object to be a SQL `UPDATE` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `UPDATE` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table to be updated is not set.
+        :raises UnsupportedValueError: If no column is set or any value could
+            not be used in SQL statement.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        if not self._columns:
+            raise UnsupportedValueError
+        form = dialect.multi_table_update if _has_tables(self._tables) \
+            else None
+        sql_buffer.append(_target_to_sql(dialect, self._table, self._alias))
+        if form == "join":
+            sql_buffer.append(" JOIN ")
+            sql_buffer.append(self._tables.to_sql(dialect))
+        sql_buffer.append(" SET ")
+        exists = form is None and _has_tables(self._tables)
+        qualifier = None
+        if form == "join":
+            qualifier = dialect.table2sql(self._alias or self._table)
+        for col in self._columns:
+            if not col.is_first:
+                sql_buffer.append(", ")
+            if qualifier is not None:
+                sql_buffer.append(qualifier)
+                sql_buffer.append(".")
+            sql_buffer.append(dialect.column2sql(col.name))
+            sql_buffer.append("=")
+            if col.value is None:
+                sql_buffer.append("NULL")
+                continue
+            value = dialect.value2sql(col.value, col.type)
+            if value is None:
+                raise UnsupportedValueError
+            if exists and col.type == ValueTypes.OTHER:
+                # Columns of the joined tables are out of scope here
+                value = _subquery_to_sql(
+                    dialect, value, self._tables, self._where)
+            sql_buffer.append(value)
+        if form == "from":
+            sql_buffer.append(SQLUtils.get_sql_from_keyword())
+            sql_buffer.append(self._tables.to_sql(dialect))
+        sql_buffer.append(_filter_to_sql(
+            dialect, exists, self._tables, self._where))
+        return "".join(sql_buffer)
+
+
+class Delete(DMLBase):
+    """
+    Create SQL `DELETE` statement to delete records of a table, optionally
+    joined with other tables, so that one statement could replace deletions
+    of single records.
+
+    Joined tables are rendered in the form of
+    :attr:`~.dialect.Dialect.multi_table_delete`: `DELETE ... USING` like
+    PostgreSQL, `DELETE t1 FROM t1 JOIN t2` like MySQL, or an `EXISTS`
+    subquery filtering the deleted records otherwise. Conditions joining the
+    table with the other tables are set in the `Where` clause.
+
+    :cvar str _table: Name of the table to delete records from.
+    :cvar str _alias: Alias of the table to delete records from.
+    :cvar JoinedTables _tables: Other tables joined with the table.
+    :cvar Where _where: Object to create SQL `WHERE` clause to filter records.
+    """
+    _table = None
+    _alias = None
+    _tables = None
+    _where = None
+
+    def __init__(self):
+        """
+        Initialize a `Delete` object for generating a SQL delete statement.
+        """
+        super(Delete, self).__init__()
+        self.clear()
+
+    def clear(self):
+        """
+        Reset current `Delete` object.
+        """
+        self._raw_sql = None
+        self._table = None
+        self._alias = None
+        self._tables = None
+        self._where = None
+
+    def set_table(self, table_name, alias=None):
+        """
+        Set the table to delete records from.
+
+        :param table_name: Name of the target table.
+        :type table_name: str
+        :param alias: Alias of the target table. Default by `None`.
+        :type alias: str
+        """
+        self._table = table_name
+        self._alias = alias
+
+    def get_table(self):
+        """
+        Get the table to delete records from.
+
+        :return: Name of the target table.
+        :rtype: str
+        """
+        return self._table
+
+    def get_alias(self):
+        """
+        Get the alias of the table to delete records from.
+
+        :return: Alias of the target table.
+        :rtype: str
+        """
+        return self._alias
+
+    def set_tables(self, tables):
+        """
+        Set the other tables joined with the table.
+
+        :param tables: Tables joined with the table.
+        :type tables: JoinedTables
+        """
+        self._tables = tables
+
+    def get_tables(self):
+        """
+        Get the other tables joined with the table.
+
+        :return: Tables joined with the table.
+        :rtype: JoinedTables
+        """
+        return self._tables
+
+    def set_where(self, where):
+        """
+        Set DML `Where` object for creating SQL `DELETE` statement.
+
+        :param where: Object to create SQL `WHERE` clause to filter records.
+        :type where: Where
+        """
+        self._where = where
+
+    def get_where(self):
+        """
+        Get DML `Where` object of SQL `DELETE` statement.
+
+        :return: Object to create SQL `WHERE` clause to filter records.
+        :rtype: Where
+        """
+        return self._where
+
+    def create_keyword(self):
+        """
+        Create the keyword string of SQL `DELETE` statement.
+
+        :return: Keyword string of SQL `DELETE` statement.
+        :rtype: str
+        """
+        return "DELETE "
+
+    def to_sql(self, dialect):
+        """
+        Convert `Delete` object to be a SQL `DELETE` statement.
+
+        :param dialect: SQL dialect to generate statements to work with
+            different databases. This dialect should be an instance of
+            :class:`Dialect` class.
+        :type dialect: Dialect
+        :return: A string of SQL `DELETE` statement.
+        :rtype: str
+        :raises NoneTableNameError: If table to delete records from is not
+            set.
+        """
+        sql_buffer = [self.create_keyword()]
+        if self._raw_sql:
+            # Use raw SQL statement if exists
+            sql_buffer.append(self._raw_sql)
+            return "".join(sql_buffer)
+        if self._table is None:
+            raise NoneTableNameError
+        form = dialect.multi_table_delete if _has_tables(self._tables) \
+            else None
+        if form == "join":
+            sql_buffer.append(dialect.table2sql(self._alias or self._table))
+            sql_buffer.append(" ")
+        sql_buffer.append("FROM ")
+        sql_buffer.append(_target_to_sql(dialect, self._table, self._alias))
+        if form == "join":
+            sql_buffer.append(" JOIN ")
+            sql_buffer.append(self._tables.to_sql(dialect))
+        elif form == "using":
+            sql_buffer.append(" USING ")
+            sql_buffer.append(self._tables.to_sql(dialect))
+        sql_buffer.append(_filter_to_sql(
+            dialect, form is None and _has_tables(self._tables),
+            self._tables, self._where))
+        return "".join(sql_buffer)
+
+
+def _has_tables(tables):
+    return tables is not None and (
+        tables.get_raw_sql() or tables.get_size() > 0)
+
+
+def _target_to_sql(dialect, table_name, alias):
+    if alias is None:
+        return dialect.table2sql(table_name)
+    return "".join([dialect.table2sql(table_name),
+                    SQLUtils.get_sql_as_keyword(), dialect.table2sql(alias)])
+
+
+def _subquery_to_sql(dialect, columns_sql, tables, where):
+    where_sql = where.to_sql(dialect) if where else ""
+    return "".join([
+        "(SELECT ", columns_sql, SQLUtils.get_sql_from_keyword(),
+        tables.to_sql(dialect), where_sql, ")"])
+
+
+def _filter_to_sql(dialect, exists, tables, where):
+    # Filter the records of the target table by a correlated subquery if the
+    # database could not join tables in UPDATE or DELETE statements
+    if not exists:
+        return where.to_sql(dialect) if where else ""
+    return " WHERE EXISTS " + _subquery_to_sql(dialect, "1", tables, where)
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Statement Execution
+===================
+Executor
+--------
+.. autoclass:: pydbc.executor.Executor
+    :members:
+"""
+
+import time
+
+from .dialect import Dialect
+from .dml import Select, Insert, Update, Delete
+from .row import Row
+from .statement_cache import StatementCache
+
+
+class Executor(object):
+    """
+    Execute DML statements on a DB-API 2.0 connection.
+
+    Values of statements are passed to the database driver as bind
+    parameters, converted by :meth:`Dialect.bind_value` of the dialect.
+
+    If the dialect prepares statements, selects, inserts, updates and
+    deletes are executed as prepared statements cached by a
+    :class:`~.statement_cache.StatementCache` of the connection, so that
+    frequent statements are only parsed and planned once by the database.
+    Other statements like DDL could not be prepared, and are executed
+    directly.
+
+    :ivar object _connection: DB-API 2.0 connection to execute statements on.
+    :ivar Dialect _dialect: SQL dialect of the database.
+    :ivar StatementCache _statement_cache: Cache of the prepared statements,
+        or `None` if statements are not prepared.
+    :ivar SingleFlight _single_flight: Single-flight layer sharing results of
+        identical selects in flight, or `None` if not used.
+    :ivar QueryMetrics _metrics: Metrics of the executed statements, or
+        `None` if not collected.
+    :ivar SlowQueryLog _slow_query_log: Log of the slow queries, or `None` if
+        not logged.
+    :ivar WorkloadRecorder _recorder: Recorder of the executed statements, or
+        `None` if not recorded.
+    """
+    _connection = None
+    _dialect = None
+    _statement_cache = None
+    _single_flight = None
+    _metrics = None
+    _slow_query_log = None
+    _recorder = None
+    # Statements which could be executed as prepared statements
+    _prepared_types = (Select, Insert, Update, Delete)
+
+    def __init__(self, connection, dialect=None,
+                 statement_cache_size=StatementCache.DEFAULT_SIZE,
+                 single_flight=None, metrics=None, slow_query_log=None,
+                 recorder=None):
+        """
+        Initialize an `Executor` object.
+
+        :param connection: DB-API 2.0 connection to execute statements on.
+        :type connection: object
+        :param dialect: SQL dialect of the database. Default by the generic
+            :class:`Dialect`.
+        :type dialect: Dialect
+        :param statement_cache_size: Maximum number of prepared statements
+            kept on the connection. Statements are not prepared if `0`.
+        :type statement_cache_size: int
+        :param single_flight: Single-flight layer shared with executors of
+            other threads, to share results of identical selects executed
+            at the same time by :meth:`fetchall`.
+        :type single_flight: SingleFlight
+        :param metrics: Metrics collecting the executed statements.
+        :type metrics: QueryMetrics
+        :param slow_query_log: Log of the queries fetched longer than its
+            threshold, including the time spent on fetching the records.
+        :type slow_query_log: SlowQueryLog
+        :param recorder: Recorder of the executed statements, to be replayed
+            as a workload.
+        :type recorder: WorkloadRecorder
+        """
+        self._connection = connection
+        self._dialect = dialect if dialect is not None else Dialect()
+        self._single_flight = single_flight
+        self._metrics = metrics
+        self._slow_query_log = slow_query_log
+        self._recorder = recorder
+        if self._dialect.prepare_statements and statement_cache_size > 0:
+            self._statement_cache = StatementCache(
+                self._dialect, connection, statement_cache_size)
+
+    def get_connection(self):
+        """
+        Get the connection to execute statements on.
+
+        :return: DB-API 2.0 connection.
+        :rtype: object
+        """
+        return self._connection
+
+    def get_dialect(self):
+        """
+        Get the SQL dialect of the database.
+
+        :return: SQL dialect.
+        :rtype: Dialect
+        """
+        return self._dialect
+
+    def get_statement_cache(self):
+        """
+        Get the cache of the prepared statements.
+
+        :return: The statement cache, or `None` if statements are not
+            prepared.
+        :rtype: StatementCache
+        """
+        return self._statement_cache
+
+    def compile(self, statement, prepared=False):
+        """
+        Convert a statement object into a SQL statement with bind parameters.
+
+        :param statement: Statement to be converted.
+        :type statement: DMLBase
+        :param prepared: A boolean indicating whether to compile the statement
+            as it is executed by this executor, with the placeholders of
+            prepared statements if it is executed as a prepared statement.
+        :type prepared: bool
+        :return: Tuple of the SQL statement and its parameters.
+        :rtype: tuple
+        """
+        if prepared and self._is_prepared(statement):
+            return self._dialect.compile(
+                statement, self._dialect.prepared_paramstyle)
+        return self._dialect.compile(statement)
+
+    def _is_prepared(self, statement):
+        return self._statement_cache is not None and isinstance(
+            statement, self._prepared_types)
+
+    def execute(self, statement):
+        """
+        Execute a statement.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :return: The cursor which executed the statement.
+        :rtype: object
+        """
+        return self._execute(statement)[0]
+
+    def _execute(self, statement, compiled=None):
+        start = time.time()
+        sql, params = compiled if compiled is not None \
+            else self.compile(statement, True)
+        ready = time.time()
+        if self._recorder is not None:
+            # Statements are compiled only once, since compiling consumes
+            # the streams of large objects; prepared statements have other
+            # placeholders, so they are compiled again if recorded as SQL
+            self._recorder.record(self, statement, None
+                                  if self._is_prepared(statement)
+                                  else (sql, params))
+            # Leave the time of recording out of the statement
+            delay = time.time() - ready
+            start += delay
+            ready += delay
+        if self._is_prepared(statement):
+            name = self._statement_cache.get(sql)
+            cursor = self._run(sql, start, ready, lambda cursor:
+                               self._dialect.execute_prepared(
+                                   cursor, name, params))
+        else:
+            cursor = self._run(sql, start, ready, lambda cursor:
+                               cursor.execute(sql, params))
+        return cursor, sql, params, start
+
+    def execute_sql(self, sql, params=None, many=False):
+        """
+        Execute a SQL statement built by the caller, like the combined
+        statements of :class:`~.batch.StatementBatch` and
+        :class:`~.buffer.WriteBuffer`. The statement is recorded and measured
+        like other statements, but never prepared.
+
+        :param sql: SQL statement with placeholders of the dialect.
+        :type sql: str
+        :param params: Parameters of the statement, or a list of parameter
+            sets if `many` is `True`.
+        :type params: list or dict
+        :param many: A boolean indicating whether the statement is executed
+            once for each parameter set by `executemany` of the cursor.
+        :type many: bool
+        :return: The cursor which executed the statement.
+        :rtype: object
+        """
+        if params is None:
+            params = []
+        if self._recorder is not None:
+            if many and not isinstance(params, (list, tuple)):
+                # Iterators of parameter sets could only be consumed once
+                params = list(params)
+            self._recorder.record_sql(sql, params, many)
+        start = time.time()
+        if many:
+            return self._run(sql, start, start, lambda cursor:
+                             cursor.executemany(sql, params))
+        return self._run(sql, start, start, lambda cursor:
+                         cursor.execute(sql, params))
+
+    def fetch_sql(self, sql, params=None):
+        """
+        Execute a SQL statement built by the caller and fetch all records of
+        the result, recording and measuring it like :meth:`execute_sql`.
+
+        :param sql: SQL statement with placeholders of the dialect.
+        :type sql: str
+        :param params: Parameters of the statement.
+        :type params: list or dict
+        :return: List of records.
+        :rtype: list
+        """
+        if params is None:
+            params = []
+        start = time.time()
+        cursor = self.execute_sql(sql, params)
+        try:
+            records = cursor.fetchall()
+        finally:
+            cursor.close()
+        self._record_rows(None, sql, params, start, len(records))
+        return records
+
+    def _run(self, sql, start, compiled, execute):
+        cursor = self._connection.cursor()
+        try:
+            execute(cursor)
+        except Exception:
+            cursor.close()
+            self._record_execution(sql, start, compiled, True)
+            raise
+        self._record_execution(sql, start, compiled, False)
+        return cursor
+
+    def _record_execution(self, sql, start, compiled, error):
+        if self._metrics is not None:
+            self._metrics.record_execution(
+                type(self._dialect).__name__, sql, compiled - start,
+                time.time() - compiled, error)
+
+    def _record_rows(self, statement, sql, params, start, rows):
+        if self._metrics is not None:
+            self._metrics.record_rows(type(self._dialect).__name__, sql, rows)
+        if self._slow_query_log is not None:
+            self._slow_query_log.record(
+                self, statement, sql, params, time.time() - start, rows)
+
+    def fetchall(self, statement):
+        """
+        Execute a statement and fetch all records of the result.
+
+        Selects are executed through the single-flight layer if it is set.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :return: List of records.
+        :rtype: list
+        """
+        if self._single_flight is not None and isinstance(statement, Select):
+            return self._single_flight.fetchall(self, statement)
+        return self.fetch_statement(statement)
+
+    def fetch_statement(self, statement, compiled=None):
+        """
+        Execute a statement and fetch all records of the result on the
+        connection of this executor.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :param compiled: SQL statement and parameters of the statement
+            compiled by :meth:`compile` with `prepared`, so that it is not
+            compiled again.
+        :type compiled: tuple
+        :return: List of records.
+        :rtype: list
+        """
+        cursor, sql, params, start = self._execute(statement, compiled)
+        try:
+            records = cursor.fetchall()
+        finally:
+            cursor.close()
+        self._record_rows(statement, sql, params, start, len(records))
+        return records
+
+    def fetchrows(self, statement):
+        """
+        Execute a statement and fetch all records of the result as
+        :class:`~.row.Row` objects, which could be accessed by column name.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :return: List of rows.
+        :rtype: list
+        """
+        return list(self.iterrows(statement))
+
+    def iterrows(self, statement, batch_size=1000):
+        """
+        Execute a statement and iterate over the records of the result as
+        :class:`~.row.Row` objects, fetching records in batches.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :param batch_size: Number of records fetched at once.
+        :type batch_size: int
+        :return: Iterator of rows.
+        :rtype: iterator
+        """
+        count = 0
+        cursor, sql, params, start = self._execute(statement)
+        try:
+            row_type = Row.create_type(
+                Row.get_names(statement, cursor.description))
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                count += len(records)
+                for record in records:
+                    yield row_type(record)
+        finally:
+            cursor.close()
+            self._record_rows(statement, sql, params, start, count)
+
+    def export(self, statement, sink, batch_size=1000):
+        """
+        Execute a statement and write the records of the result into a sink,
+        fetching records in batches, so that the memory used does not depend
+        on the number of records.
+
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :param sink: Sink of the records, which is opened by this method.
+        :type sink: ExportSink
+        :param batch_size: Number of records fetched and written at once.
+        :type batch_size: int
+        :return: Dict of number of `rows` written, `seconds` spent and
+            `rows_per_second`.
+        :rtype: dict
+        """
+        count = 0
+        cursor, sql, params, start = self._execute(statement)
+        try:
+            sink.open(Row.get_names(statement, cursor.description))
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                sink.write_rows(records)
+                count += len(records)
+        finally:
+            cursor.close()
+            self._record_rows(statement, sql, params, start, count)
+        seconds = time.time() - start
+        return {
+            "rows": count,
+            "seconds": seconds,
+            "rows_per_second": count / seconds if seconds > 0 else 0.0,
+        }
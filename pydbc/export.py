@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Result Export
+=============
+ExportSink
+----------
+.. autoclass:: pydbc.export.ExportSink
+    :members:
+
+CSVSink
+-------
+.. autoclass:: pydbc.export.CSVSink
+    :members:
+
+JSONLinesSink
+-------------
+.. autoclass:: pydbc.export.JSONLinesSink
+    :members:
+"""
+
+from abc import ABCMeta, abstractmethod
+import base64
+import csv
+import datetime
+import decimal
+import gzip
+import io
+import json
+import uuid
+from cStringIO import StringIO
+
+
+class ExportSink(object):
+    """
+    Base class of the sinks writing records of results into files.
+
+    Records are written in batches. Each batch is formatted into one string
+    and written at once, so that only one batch of records is kept in memory.
+    Sinks are used by :meth:`~.executor.Executor.export`::
+
+        with CSVSink("foo.csv.gz", compress=True) as sink:
+            statistics = executor.export(select, sink)
+
+    Binary values are written as Base64 strings, and values of dates, decimals
+    and UUIDs as strings.
+
+    :ivar object _target: Path of the file, or a file-like object.
+    :ivar bool _compress: A boolean indicating whether to compress the file
+        by gzip.
+    :ivar int _buffer_size: Size of the write buffer of the file in bytes.
+    :ivar object _file: File-like object the records are written to.
+    """
+    __metaclass__ = ABCMeta
+
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, target, compress=False,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Initialize an `ExportSink` object.
+
+        :param target: Path of the file to write, or a file-like object which
+            is not closed by the sink.
+        :type target: object
+        :param compress: A boolean indicating whether to compress the file by
+            gzip.
+        :type compress: bool
+        :param buffer_size: Size of the write buffer of the file in bytes,
+            used if the file is opened by the sink.
+        :type buffer_size: int
+        """
+        self._target = target
+        self._compress = compress
+        self._buffer_size = buffer_size
+        self._raw = None
+        self._file = None
+        self._names = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, names):
+        """
+        Open the file and write the header of the records.
+
+        :param names: Column names of the records.
+        :type names: tuple
+        """
+        if isinstance(self._target, basestring):
+            self._raw = io.open(self._target, "wb",
+                                buffering=self._buffer_size)
+        else:
+            self._raw = self._target
+        if self._compress:
+            self._file = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        else:
+            self._file = self._raw
+        self._names = names
+        header = self.format_header(names)
+        if header:
+            self._file.write(header)
+
+    def write_rows(self, rows):
+        """
+        Write a batch of records.
+
+        :param rows: Records to be written.
+        :type rows: list
+        """
+        self._file.write(self.format_rows(rows))
+
+    def close(self):
+        """
+        Finish writing the file. Files opened by the sink are closed.
+        """
+        if self._file is None:
+            return
+        if self._compress:
+            self._file.close()
+        if self._raw is not self._target:
+            self._raw.close()
+        else:
+            self._raw.flush()
+        self._file = None
+        self._raw = None
+
+    def format_header(self, names):
+        """
+        Format the header of the records.
+
+        :param names: Column names of the records.
+        :type names: tuple
+        :return: The header, or an empty string if the format has no header.
+        :rtype: str
+        """
+        return ""
+
+    @abstractmethod
+    def format_rows(self, rows):
+        """
+        Format a batch of records.
+
+        .. note:: This is an abstract method.
+
+        :param rows: Records to be formatted.
+        :type rows: list
+        :return: The formatted records.
+        :rtype: str
+        """
+        pass
+
+    @staticmethod
+    def convert_value(value):
+        """
+        Convert a value which has no representation in text formats.
+
+        :param value: Value of a record.
+        :type value: object
+        :return: The converted value.
+        :rtype: object
+        """
+        if isinstance(value, (buffer, bytearray, memoryview)):
+            return base64.b64encode(bytes(value) if not isinstance(
+                value, memoryview) else value.tobytes())
+        elif isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+        elif isinstance(value, (decimal.Decimal, uuid.UUID)):
+            return str(value)
+        return value
+
+
+class CSVSink(ExportSink):
+    """
+    Sink writing records into a CSV file with a header of column names.
+    Unicode strings are encoded by UTF-8, and `NULL` values are written as
+    empty fields.
+
+    .. note:: This class is subclass of :class:`ExportSink`.
+
+    :ivar dict _format: Format parameters of the `csv` module.
+    """
+
+    def __init__(self, target, compress=False,
+                 buffer_size=ExportSink.DEFAULT_BUFFER_SIZE, **format_params):
+        """
+        Initialize a `CSVSink` object.
+
+        :param target: Path of the file to write, or a file-like object which
+            is not closed by the sink.
+        :type target: object
+        :param compress: A boolean indicating whether to compress the file by
+            gzip.
+        :type compress: bool
+        :param buffer_size: Size of the write buffer of the file in bytes,
+            used if the file is opened by the sink.
+        :type buffer_size: int
+        :param format_params: Format parameters of the `csv` module, such as
+            `delimiter`.
+        :type format_params: dict
+        """
+        super(CSVSink, self).__init__(target, compress, buffer_size)
+        self._format = format_params
+
+    def format_header(self, names):
+        return self.format_rows([names])
+
+    def format_rows(self, rows):
+        output = StringIO()
+        writer = csv.writer(output, **self._format)
+        convert = self.convert_value
+        for row in rows:
+            writer.writerow([
+                value.encode("utf-8") if isinstance(value, unicode)
+                else convert(value) for value in row])
+        return output.getvalue()
+
+
+class JSONLinesSink(ExportSink):
+    """
+    Sink writing records into a JSON Lines file, with one JSON object of
+    column names and values for each record.
+
+    .. note:: This class is subclass of :class:`ExportSink`.
+    """
+
+    def format_rows(self, rows):
+        names = self._names
+        encoder = json.JSONEncoder(default=self._default,
+                                   separators=(",", ":"))
+        return "".join([
+            encoder.encode(dict(zip(names, row))) + "\n" for row in rows])
+
+    def _default(self, value):
+        converted = self.convert_value(value)
+        if converted is value:
+            raise TypeError("%r is not JSON serializable" % (value, ))
+        return converted
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import os
+import tempfile
+
+if os.name == "nt":
+    import ctypes
+
+    _MOVEFILE_REPLACE_EXISTING = 0x1
+    _MOVEFILE_WRITE_THROUGH = 0x8
+
+    def _replace(source, target):
+        # os.rename could not replace an existing file on Windows
+        if not ctypes.windll.kernel32.MoveFileExW(
+                unicode(source), unicode(target),
+                _MOVEFILE_REPLACE_EXISTING | _MOVEFILE_WRITE_THROUGH):
+            raise ctypes.WinError()
+else:
+    _replace = os.rename
+
+
+class FileUtils(object):
+    """
+    Utilities of files written by PyDBC, like cache and metrics files.
+    """
+
+    @staticmethod
+    def write_atomic(path, data, mode=0o644):
+        """
+        Write data into a file, which is replaced at once, so that readers
+        never see a partial file.
+
+        Data is written into a unique temporary file in the directory of the
+        file first, so concurrent writers of the same file never share a
+        temporary file, and the last one replacing the file wins.
+
+        :param path: Path of the file.
+        :type path: str
+        :param data: Data to be written.
+        :type data: str
+        :param mode: Permission bits of the file.
+        :type mode: int
+        """
+        directory, name = os.path.split(os.path.abspath(path))
+        handle, temp_file = tempfile.mkstemp(
+            prefix=name + ".", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(handle, "wb") as target_file:
+                target_file.write(data)
+            # Temporary files are only readable by the owner
+            os.chmod(temp_file, mode)
+            _replace(temp_file, path)
+        except BaseException:
+            os.remove(temp_file)
+            raise
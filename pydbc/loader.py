@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Key Loaders
+===========
+KeyLoader
+---------
+.. autoclass:: pydbc.loader.KeyLoader
+    :members:
+
+LoadResult
+----------
+.. autoclass:: pydbc.loader.LoadResult
+    :members:
+
+UnsupportedTemplateError
+------------------------
+.. autoclass:: pydbc.loader.UnsupportedTemplateError
+    :members:
+"""
+
+import copy
+
+from .constants import CompareTypes, RelationTypes, ValueTypes
+from .dml import Column, Where
+from .sqlutils import SQLUtils
+
+
+class UnsupportedTemplateError(ValueError):
+    """
+    The error raised if a select could not be used as template of a loader.
+    """
+
+    def __init__(self):
+        """
+        Initialize UnsupportedTemplateError.
+        """
+        msg = "Template select could only be filtered by AND conditions!"
+        super(UnsupportedTemplateError, self).__init__(msg)
+
+
+class LoadResult(object):
+    """
+    Result of a key requested from a :class:`KeyLoader`, which is available
+    after the loader is dispatched.
+
+    :ivar KeyLoader _loader: The loader of the key.
+    :ivar object _key: The requested key.
+    """
+
+    def __init__(self, loader, key):
+        """
+        Initialize a `LoadResult` object.
+
+        :param loader: The loader of the key.
+        :type loader: KeyLoader
+        :param key: The requested key.
+        :type key: object
+        """
+        self._loader = loader
+        self._key = key
+
+    def get_key(self):
+        """
+        Get the requested key.
+
+        :return: The requested key.
+        :rtype: object
+        """
+        return self._key
+
+    def get(self):
+        """
+        Get the result of the key. The loader is dispatched first if the key is
+        still pending.
+
+        :return: The record of the key or `None` for unique keys, otherwise a
+            list of records.
+        :rtype: object
+        """
+        return self._loader.get_result(self._key)
+
+
+class KeyLoader(object):
+    """
+    Coalesce lookups of single keys into selects with `IN` predicates, to
+    avoid executing one select per key.
+
+    Keys are collected by :meth:`load`, and dispatched together by
+    :meth:`dispatch`, which executes the template select filtered by the
+    requested keys. Loaders could be used as a scope dispatching the keys on
+    exit, while results are also dispatched on first access::
+
+        select = Select()
+        ...
+        loader = KeyLoader(executor, select, "id")
+        with loader:
+            results = [loader.load(row[0]) for row in parents]
+        records = [result.get() for result in results]
+
+    Results are cached by key until :meth:`clear` is called, so each key is
+    only requested once.
+
+    .. note:: Conditions of the template select could only be combined by
+        `AND`, since the key predicate is appended to them.
+
+    :ivar Executor _executor: Executor of the selects.
+    :ivar Select _select: Template select of the records.
+    :ivar str _key_column: Name of the key column.
+    :ivar str _key_table: Table name or table alias of the key column.
+    :ivar ValueTypes _key_type: Type of the keys.
+    :ivar bool _unique: A boolean indicating whether each key matches one
+        record at most.
+    :ivar int _max_keys: Maximum number of keys in one select.
+    :ivar list _pending: Keys waiting to be dispatched, in the order of
+        requests.
+    :ivar set _pending_keys: Keys waiting to be dispatched, to look them up
+        in constant time.
+    :ivar dict _results: Results by key.
+    """
+    DEFAULT_MAX_KEYS = 500
+
+    def __init__(self, executor, select, key_column, key_table=None,
+                 key_type=ValueTypes.INTEGER, unique=True,
+                 max_keys=DEFAULT_MAX_KEYS):
+        """
+        Initialize a `KeyLoader` object.
+
+        :param executor: Executor of the selects.
+        :type executor: Executor
+        :param select: Template select of the records, without the key
+            predicate.
+        :type select: Select
+        :param key_column: Name of the key column.
+        :type key_column: str
+        :param key_table: Table name or table alias of the key column.
+        :type key_table: str
+        :param key_type: Type of the keys.
+        :type key_type: ValueTypes
+        :param unique: A boolean indicating whether each key matches one
+            record at most. Results are lists of records if not unique.
+        :type unique: bool
+        :param max_keys: Maximum number of keys in one select. The number is
+            also limited by bind parameters accepted by the dialect.
+        :type max_keys: int
+        :raises UnsupportedTemplateError: If conditions of the select are
+            not combined by `AND`.
+        """
+        where = select.get_where()
+        if where is not None:
+            if where.get_raw_sql():
+                raise UnsupportedTemplateError
+            for col in where.get_columns()[1:]:
+                if col.relation == RelationTypes.OR:
+                    raise UnsupportedTemplateError
+        self._executor = executor
+        self._select = select
+        self._key_column = key_column
+        self._key_table = key_table
+        self._key_type = key_type
+        self._unique = unique
+        self._max_keys = max_keys
+        self._pending = []
+        self._pending_keys = set()
+        self._results = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.dispatch()
+
+    def load(self, key):
+        """
+        Request the records of a key.
+
+        :param key: The key to be loaded.
+        :type key: object
+        :return: Result of the key.
+        :rtype: LoadResult
+        """
+        if key not in self._results:
+            self._results[key] = None
+            self._pending.append(key)
+            self._pending_keys.add(key)
+        return LoadResult(self, key)
+
+    def load_many(self, keys):
+        """
+        Request the records of several keys.
+
+        :param keys: Iterable of keys to be loaded.
+        :type keys: iterable
+        :return: List of results in the order of the keys.
+        :rtype: list
+        """
+        return [self.load(key) for key in keys]
+
+    def get_result(self, key):
+        """
+        Get the result of a requested key, dispatching pending keys first if
+        the key is pending.
+
+        :param key: The requested key.
+        :type key: object
+        :return: The record of the key or `None` for unique keys, otherwise a
+            list of records.
+        :rtype: object
+        :raises KeyError: If the key was not requested.
+        """
+        if key in self._pending_keys:
+            self.dispatch()
+        return self._results[key]
+
+    def get_keys_per_select(self):
+        """
+        Get the maximum number of keys in one select.
+
+        :return: Number of keys.
+        :rtype: int
+        """
+        dialect = self._executor.get_dialect()
+        if dialect.max_parameters is None:
+            return self._max_keys
+        used = len(dialect.compile(self._select)[1])
+        return max(1, min(self._max_keys, dialect.max_parameters - used))
+
+    def dispatch(self):
+        """
+        Load the records of all pending keys.
+        """
+        pending = self._pending
+        self._pending = []
+        self._pending_keys = set()
+        if not pending:
+            return
+        size = self.get_keys_per_select()
+        for start in range(0, len(pending), size):
+            try:
+                self._load_keys(pending[start:start + size])
+            except Exception:
+                # Forget keys not loaded, so they could be requested again
+                for key in pending[start:]:
+                    self._results.pop(key, None)
+                raise
+
+    def clear(self):
+        """
+        Remove the cached results and pending keys.
+        """
+        self._pending = []
+        self._pending_keys = set()
+        self._results = {}
+
+    def _load_keys(self, keys):
+        select = self.create_select(keys)
+        results = {}
+        for row in self._executor.fetchall(select):
+            key, record = row[-1], tuple(row[:-1])
+            if self._unique:
+                results[key] = record
+            else:
+                results.setdefault(key, []).append(record)
+        for key in keys:
+            if self._unique:
+                self._results[key] = results.get(key)
+            else:
+                self._results[key] = results.get(key, [])
+
+    def create_select(self, keys):
+        """
+        Create the select of records for several keys. The key column is
+        appended to the columns of the template select, or to all columns
+        (`*`) if the template select has no columns.
+
+        :param keys: Keys to be loaded.
+        :type keys: list
+        :return: The select of the keys.
+        :rtype: Select
+        """
+        select = copy.copy(self._select)
+        # Columns are copied since their flags are reset by the new select
+        columns = [copy.copy(col) for col in self._select.get_columns()]
+        if not columns:
+            columns = [Column(SQLUtils.get_sql_all_columns())]
+        key = Column(self._key_column, is_first=False)
+        key.table = self._key_table
+        select.set_columns(columns + [key])
+        criterion = Column(self._key_column)
+        criterion.table = self._key_table
+        criterion.value = list(keys)
+        criterion.type = self._key_type
+        criterion.compare = CompareTypes.IN
+        criterion.relation = RelationTypes.AND
+        where = Where()
+        template = self._select.get_where()
+        if template is not None:
+            where.set_columns([copy.copy(col) for col in template.get_columns()]
+                              + [criterion])
+        else:
+            where.set_columns([criterion])
+        select.set_where(where)
+        return select
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Large Objects
+=============
+LOBStream
+---------
+.. autoclass:: pydbc.lob.LOBStream
+    :members:
+
+LOBTooLargeError
+----------------
+.. autoclass:: pydbc.lob.LOBTooLargeError
+    :members:
+"""
+
+import os
+
+
+class LOBTooLargeError(ValueError):
+    """
+    The error raised if a large object exceeds the size limit of its buffer.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initialize LOBTooLargeError.
+
+        :param max_size: Size limit of the buffer in bytes.
+        :type max_size: int
+        """
+        msg = "Large object exceeds the buffer limit of %d bytes!" % max_size
+        super(LOBTooLargeError, self).__init__(msg)
+
+
+class LOBStream(object):
+    """
+    Value of a large object column read from a file-like object or an
+    iterable of chunks.
+
+    Dialects of drivers which read parameters incrementally pass the stream to
+    the driver directly, which calls :meth:`read` on it. Other dialects read
+    the whole object into one buffer by :meth:`read_all` or
+    :meth:`read_text`, without intermediate copies of the data.
+
+    .. note:: A stream could only be consumed once.
+
+    :ivar object _source: File-like object or iterable of chunks.
+    :ivar int _size: Size of the object in bytes if known.
+    :ivar int _chunk_size: Size of the chunks to read at once.
+    :ivar int _max_size: Size limit of the buffer in bytes.
+    """
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, source, size=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                 max_size=None):
+        """
+        Initialize a `LOBStream` object.
+
+        :param source: File-like object with a `read` method, or an iterable
+            of `str` chunks.
+        :type source: object
+        :param size: Size of the object in bytes. The size of files is detected
+            automatically if not specified.
+        :type size: int
+        :param chunk_size: Size of the chunks to read at once.
+        :type chunk_size: int
+        :param max_size: Size limit of the buffer in bytes when the object has
+            to be read into memory. Default by no limit.
+        :type max_size: int
+        """
+        self._source = source
+        self._size = size
+        self._chunk_size = chunk_size
+        self._max_size = max_size
+        self._chunks = None
+        self._pending = ""
+
+    def get_size(self):
+        """
+        Get the size of the object.
+
+        :return: Size in bytes, or `None` if unknown.
+        :rtype: int
+        """
+        if self._size is None:
+            try:
+                size = os.fstat(self._source.fileno()).st_size
+                self._size = size - self._source.tell()
+            except (AttributeError, IOError, OSError, ValueError):
+                pass
+        return self._size
+
+    def read(self, size=-1):
+        """
+        Read data from the object.
+
+        :param size: Maximum number of bytes to read. Read until the end of the
+            object if negative.
+        :type size: int
+        :return: Data read from the object. An empty string is returned at the
+            end of the object.
+        :rtype: str
+        """
+        if hasattr(self._source, "read"):
+            return self._source.read(size)
+        if self._chunks is None:
+            self._chunks = iter(self._source)
+        parts = [self._pending]
+        length = len(self._pending)
+        while size < 0 or length < size:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                break
+            parts.append(chunk)
+            length += len(chunk)
+        data = "".join(parts)
+        if size < 0 or length <= size:
+            self._pending = data[:0]
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+    def iter_chunks(self):
+        """
+        Iterate over the data of the object in chunks.
+
+        :return: Iterator of data chunks.
+        :rtype: iterator
+        """
+        if not hasattr(self._source, "read"):
+            if self._pending:
+                yield self._pending
+                self._pending = ""
+            if self._chunks is None:
+                self._chunks = iter(self._source)
+            for chunk in self._chunks:
+                yield chunk
+            return
+        while True:
+            chunk = self._source.read(self._chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def read_all(self):
+        """
+        Read the whole object into one buffer.
+
+        The buffer is allocated once if the size of the object is known, and
+        filled without intermediate copies by `readinto` of the source.
+
+        :return: Data of the object.
+        :rtype: bytearray
+        :raises LOBTooLargeError: If the object exceeds the size limit.
+        """
+        size = self.get_size()
+        self._check_size(size)
+        data = bytearray()
+        if size is not None and hasattr(self._source, "readinto"):
+            data = bytearray(size)
+            view = memoryview(data)
+            pos = 0
+            while pos < size:
+                count = self._source.readinto(
+                    view[pos:pos + self._chunk_size])
+                if not count:
+                    break
+                pos += count
+            del view
+            if pos < size:
+                del data[pos:]
+        for chunk in self.iter_chunks():
+            data.extend(chunk)
+            self._check_size(len(data))
+        return data
+
+    def read_text(self):
+        """
+        Read the whole object as a string, for character large objects.
+
+        :return: Data of the object.
+        :rtype: str or unicode
+        :raises LOBTooLargeError: If the object exceeds the size limit.
+        """
+        chunks = []
+        length = 0
+        for chunk in self.iter_chunks():
+            chunks.append(chunk)
+            length += len(chunk)
+            self._check_size(length)
+        if not chunks:
+            return ""
+        return chunks[0][:0].join(chunks)
+
+    def _check_size(self, size):
+        if self._max_size is not None and size is not None \
+                and size > self._max_size:
+            raise LOBTooLargeError(self._max_size)
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Query Metrics
+=============
+QueryMetrics
+------------
+.. autoclass:: pydbc.metrics.QueryMetrics
+    :members:
+"""
+
+import bisect
+import threading
+
+from .fileutils import FileUtils
+from .sqlutils import SQLUtils
+
+
+class _Histogram(object):
+    """
+    Histogram of durations in seconds, with fixed buckets.
+    """
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        self.counts[bisect.bisect_left(buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Series(object):
+    """
+    Metrics of the statements of a dialect and fingerprint.
+    """
+    __slots__ = ("sql", "queries", "errors", "rows", "compile", "execute")
+
+    def __init__(self, sql, buckets):
+        self.sql = sql
+        self.queries = 0
+        self.errors = 0
+        self.rows = 0
+        self.compile = _Histogram(buckets)
+        self.execute = _Histogram(buckets)
+
+
+class QueryMetrics(object):
+    """
+    Collect metrics of the executed statements by dialect and statement
+    fingerprint, and export them in the Prometheus text format.
+
+    Statements only differing in values are counted as the same statement,
+    see :meth:`~.sqlutils.SQLUtils.get_fingerprint`. The number of series
+    kept is limited by `max_series`; statements of new fingerprints beyond
+    the limit are counted with the fingerprint `other`.
+
+    Metrics are collected by passing the object to executors::
+
+        metrics = QueryMetrics()
+        executor = Executor(connection, dialect, metrics=metrics)
+        ...
+        metrics.write("/var/lib/node_exporter/pydbc.prom")
+
+    Gauges of the application, like the connections in use or idle of a
+    connection pool, could be exported along with :meth:`set_gauge`.
+
+    :ivar tuple buckets: Upper bounds in seconds of the histogram buckets.
+    :ivar int max_series: Maximum number of series kept.
+    :cvar tuple DEFAULT_BUCKETS: Default upper bounds of histogram buckets.
+    :cvar str OTHER: Fingerprint of statements beyond the series limit.
+    :cvar str PREFIX: Prefix of the metric names.
+    """
+    DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                       0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    OTHER = "other"
+    PREFIX = "pydbc_"
+
+    def __init__(self, max_series=1000, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize a `QueryMetrics` object.
+
+        :param max_series: Maximum number of series of dialect and
+            fingerprint kept.
+        :type max_series: int
+        :param buckets: Upper bounds in seconds of the histogram buckets.
+        :type buckets: tuple
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.max_series = max_series
+        self._lock = threading.Lock()
+        self._series = {}
+        self._gauges = {}
+        self._fingerprints = {}
+
+    def _get_series(self, dialect, sql):
+        fingerprint = self._fingerprints.get(sql)
+        if fingerprint is None:
+            if len(self._fingerprints) >= self.max_series * 4:
+                self._fingerprints.clear()
+            fingerprint = self._fingerprints[sql] = \
+                SQLUtils.get_fingerprint(sql)
+        key = (dialect, fingerprint)
+        series = self._series.get(key)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                key = (dialect, self.OTHER)
+                series = self._series.get(key)
+            if series is None:
+                normalized = None if key[1] == self.OTHER else \
+                    SQLUtils.normalize_sql(sql)
+                series = self._series[key] = _Series(
+                    normalized, self.buckets)
+        return series
+
+    def record_execution(self, dialect, sql, compile_seconds,
+                         execute_seconds, error=False):
+        """
+        Record an executed statement.
+
+        :param dialect: Name of the dialect.
+        :type dialect: str
+        :param sql: SQL statement executed.
+        :type sql: str
+        :param compile_seconds: Seconds spent on compiling the statement.
+        :type compile_seconds: float
+        :param execute_seconds: Seconds spent on executing the statement.
+        :type execute_seconds: float
+        :param error: Whether the statement failed.
+        :type error: bool
+        """
+        with self._lock:
+            series = self._get_series(dialect, sql)
+            series.queries += 1
+            if error:
+                series.errors += 1
+            series.compile.observe(self.buckets, compile_seconds)
+            series.execute.observe(self.buckets, execute_seconds)
+
+    def record_rows(self, dialect, sql, rows):
+        """
+        Record the number of rows returned by an executed statement.
+
+        :param dialect: Name of the dialect.
+        :type dialect: str
+        :param sql: SQL statement executed.
+        :type sql: str
+        :param rows: Number of rows returned.
+        :type rows: int
+        """
+        with self._lock:
+            self._get_series(dialect, sql).rows += rows
+
+    def set_gauge(self, name, value, help=None):
+        """
+        Set the value of a gauge exported along with the query metrics.
+
+        :param name: Name of the gauge, without the `pydbc_` prefix.
+        :type name: str
+        :param value: Value of the gauge.
+        :type value: int or float
+        :param help: Description of the gauge.
+        :type help: str
+        """
+        with self._lock:
+            self._gauges[name] = (value, help)
+
+    def get_series(self):
+        """
+        Get the metrics collected.
+
+        :return: Dict of metrics by tuple of dialect and fingerprint. The
+            metrics are dicts of normalized `sql`, number of `queries`,
+            `errors` and `rows`, and `compile_seconds` and `execute_seconds`
+            spent in total.
+        :rtype: dict
+        """
+        with self._lock:
+            return dict([(key, {
+                "sql": series.sql,
+                "queries": series.queries,
+                "errors": series.errors,
+                "rows": series.rows,
+                "compile_seconds": series.compile.sum,
+                "execute_seconds": series.execute.sum,
+            }) for key, series in self._series.items()])
+
+    def clear(self):
+        """
+        Clear the metrics collected.
+        """
+        with self._lock:
+            self._series.clear()
+            self._gauges.clear()
+
+    @staticmethod
+    def _escape(value):
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace(
+            '"', '\\"')
+
+    @staticmethod
+    def _format_value(value):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value) if isinstance(value, float) else str(value)
+
+    def to_prometheus(self):
+        """
+        Export the metrics in the Prometheus text format.
+
+        :return: Metrics in the Prometheus text format.
+        :rtype: str
+        """
+        lines = []
+        prefix = self.PREFIX
+        with self._lock:
+            series = sorted(self._series.items())
+            labels = ['dialect="%s",fingerprint="%s"' % (
+                self._escape(dialect), self._escape(fingerprint))
+                for (dialect, fingerprint), item in series]
+            for name, attribute, help in (
+                    ("queries_total", "queries", "Statements executed."),
+                    ("query_errors_total", "errors", "Statements failed."),
+                    ("query_rows_total", "rows", "Rows returned.")):
+                lines.append("# HELP %s%s %s" % (prefix, name, help))
+                lines.append("# TYPE %s%s counter" % (prefix, name))
+                for label, (key, item) in zip(labels, series):
+                    lines.append("%s%s{%s} %d" % (
+                        prefix, name, label, getattr(item, attribute)))
+            for name, attribute, help in (
+                    ("compile_seconds", "compile",
+                     "Seconds spent on compiling statements."),
+                    ("execute_seconds", "execute",
+                     "Seconds spent on executing statements.")):
+                lines.append("# HELP %s%s %s" % (prefix, name, help))
+                lines.append("# TYPE %s%s histogram" % (prefix, name))
+                for label, (key, item) in zip(labels, series):
+                    histogram = getattr(item, attribute)
+                    count = 0
+                    for bound, bucket in zip(
+                            self.buckets + (float("inf"), ),
+                            histogram.counts):
+                        count += bucket
+                        lines.append('%s%s_bucket{%s,le="%s"} %d' % (
+                            prefix, name, label, self._format_value(bound),
+                            count))
+                    lines.append("%s%s_sum{%s} %r" % (
+                        prefix, name, label, histogram.sum))
+                    lines.append("%s%s_count{%s} %d" % (
+                        prefix, name, label, histogram.count))
+            for name, (value, help) in sorted(self._gauges.items()):
+                if help is not None:
+                    lines.append("# HELP %s%s %s" % (prefix, name, help))
+                lines.append("# TYPE %s%s gauge" % (prefix, name))
+                lines.append("%s%s %s" % (
+                    prefix, name, self._format_value(value)))
+        lines.append("")
+        return "\n".join(lines)
+
+    def write(self, path):
+        """
+        Write the metrics in the Prometheus text format into a file, which is
+        replaced at once, as expected by the textfile collector of the node
+        exporter.
+
+        :param path: Path of the file.
+        :type path: str
+        """
+        FileUtils.write_atomic(path, self.to_prometheus())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+DML Optimizers
+==============
+Optimizer base class
+--------------------
+Optimizer
+~~~~~~~~~
+.. autoclass:: pydbc.optimizer.Optimizer
+    :members:
+
+Rule-based optimizers
+---------------------
+PredicateOptimizer
+~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.optimizer.PredicateOptimizer
+    :members:
+
+ProjectionOptimizer
+~~~~~~~~~~~~~~~~~~~
+.. autoclass:: pydbc.optimizer.ProjectionOptimizer
+    :members:
+
+JoinOptimizer
+~~~~~~~~~~~~~
+.. autoclass:: pydbc.optimizer.JoinOptimizer
+    :members:
+"""
+
+__all__ = ["Optimizer", "PredicateOptimizer", "ProjectionOptimizer",
+           "JoinOptimizer"]
+
+from .base_optimizer import Optimizer
+from .predicate_optimizer import PredicateOptimizer
+from .projection_optimizer import ProjectionOptimizer
+from .join_optimizer import JoinOptimizer
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+from abc import ABCMeta, abstractmethod
+
+from ..constants import ValueTypes, RelationTypes
+from ..dml import Select
+
+
+class Optimizer(object):
+    """
+    Base class of rule-based optimizers rewriting DML statement trees.
+
+    Optimizers modify the given statement in place. Any part of the statement
+    set by RAW SQL is treated as opaque and left untouched.
+    """
+    __metaclass__ = ABCMeta
+
+    _all_columns = "*"
+
+    @abstractmethod
+    def optimize(self, select):
+        """
+        Rewrite a `Select` statement.
+
+        .. note:: This is an abstract method.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        :return: The optimized statement.
+        :rtype: Select
+        """
+        pass
+
+    @staticmethod
+    def is_raw(dml):
+        """
+        Check whether a DML object is missing or set by RAW SQL.
+
+        :param dml: DML object to check.
+        :type dml: DMLBase
+        :return: A boolean indicating if the object could not be analyzed.
+        :rtype: bool
+        """
+        return dml is None or bool(dml.get_raw_sql())
+
+    @staticmethod
+    def has_or(columns):
+        """
+        Check whether a column list contains criteria joined by `OR`.
+
+        :param columns: List of filter columns.
+        :type columns: list
+        :return: A boolean indicating if any `OR` relation exists.
+        :rtype: bool
+        """
+        for col in columns[1:]:
+            if col.relation == RelationTypes.OR:
+                return True
+        return False
+
+    @staticmethod
+    def get_subqueries(select):
+        """
+        Get the result tables created by sub-queries of a statement.
+
+        :param select: Statement to get sub-queries from.
+        :type select: Select
+        :return: List of `Table` objects which have a `Select` object.
+        :rtype: list
+        """
+        tables = select.get_tables()
+        if Optimizer.is_raw(tables):
+            return []
+        return [table for table in tables.get_tables()
+                if isinstance(table.select, Select)
+                and not table.get_raw_sql()
+                and not Optimizer.is_raw(table.select)]
+
+    @staticmethod
+    def column_key(column):
+        """
+        Create a hashable key identifying a column criterion.
+
+        :param column: Column to create key for.
+        :type column: Column
+        :return: Key of the column.
+        :rtype: tuple
+        """
+        if column is None:
+            return None
+        value = column.value
+        if isinstance(value, list):
+            value = tuple(value)
+        return (column.get_raw_sql(), column.table, column.name, column.func,
+                column.type, column.compare, value)
+
+    def get_references(self, select, exclude=None):
+        """
+        Collect the columns referenced by a statement.
+
+        :param select: Statement to collect references from.
+        :type select: Select
+        :param exclude: Table whose join condition should not be collected.
+        :type exclude: Table
+        :return: A tuple of qualified references as a set of `(table, column)`
+            pairs and unqualified references as a set of column names. `None`
+            would be returned if the references could not be determined.
+        :rtype: tuple
+        """
+        columns = select.get_columns()
+        if not columns:
+            # SELECT * references all columns
+            return None
+        references = self.get_clause_references(select)
+        if references is None or self._add_references(references, columns):
+            return None
+        for condition in self._get_join_conditions(select, exclude):
+            if condition is None:
+                return None
+            if self._add_references(references, [
+                    col for col in (condition.column_1, condition.column_2)
+                    if col is not None]):
+                return None
+        return references
+
+    def get_clause_references(self, select):
+        """
+        Collect the columns referenced by the `WHERE`, `GROUP BY`, `HAVING`
+        and `ORDER BY` clauses of a statement.
+
+        :param select: Statement to collect references from.
+        :type select: Select
+        :return: References in the same format as :meth:`get_references`.
+        :rtype: tuple
+        """
+        references = (set(), set())
+        for clause in (select.get_where(), select.get_group_by(),
+                       select.get_having(), select.get_order_by()):
+            if clause is None:
+                continue
+            if clause.get_raw_sql() \
+                    or self._add_references(references, clause.get_columns()):
+                return None
+        return references
+
+    def _add_references(self, references, columns):
+        """
+        Add column references into the reference sets.
+
+        :return: A boolean indicating if any reference could not be
+            determined.
+        :rtype: bool
+        """
+        qualified, unqualified = references
+        for col in columns:
+            if col.get_raw_sql():
+                return True
+            names = []
+            if col.func is None or col.name != self._all_columns:
+                names.append((col.table, col.name))
+            if col.type == ValueTypes.OTHER and isinstance(col.value, str):
+                # Column value could be a column name or alias
+                parts = col.value.rsplit(".", 1)
+                if len(parts) == 2:
+                    names.append((parts[0], parts[1]))
+                else:
+                    names.append((None, parts[0]))
+            for table, name in names:
+                if table is None:
+                    unqualified.add(name)
+                else:
+                    qualified.add((table, name))
+        return False
+
+    def _get_join_conditions(self, select, exclude=None):
+        """
+        Get the sub-conditions of all join conditions in a statement.
+
+        :return: List of sub-conditions. `None` is included for conditions set
+            by RAW SQL.
+        :rtype: list
+        """
+        conditions = []
+        tables = select.get_tables()
+        if self.is_raw(tables):
+            return [None]
+        for table in tables.get_tables():
+            if table is exclude:
+                continue
+            if table.get_raw_sql():
+                conditions.append(None)
+            elif table.condition is not None:
+                if table.condition.get_raw_sql():
+                    conditions.append(None)
+                else:
+                    conditions.extend(table.condition.get_conditions())
+        return conditions
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+from .base_optimizer import Optimizer
+from ..constants import CompareTypes, RelationTypes, JoinTypes
+
+
+class JoinOptimizer(Optimizer):
+    """
+    Optimizer removing redundant `LEFT JOIN` tables from a statement.
+
+    A left joined table is redundant if none of its columns is referenced by
+    the statement and its join condition compares all columns of one of its
+    declared unique keys with columns of other tables. Such a table matches at
+    most one record for each record of the other tables, so dropping it does
+    not change the result.
+
+    .. note:: Any unqualified column reference in the statement keeps all of
+        its tables, as the table it refers to could not be determined.
+
+    .. note:: This class is subclass of :class:`Optimizer`.
+    """
+
+    def optimize(self, select):
+        """
+        Remove redundant joined tables from a `Select` statement and all of
+        its sub-queries.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        :return: The optimized statement.
+        :rtype: Select
+        """
+        if self.is_raw(select):
+            return select
+        tables = select.get_tables()
+        if not self.is_raw(tables):
+            # Tables removed later could release references to earlier ones
+            for table in reversed(tables.get_tables()[1:]):
+                if self.is_redundant(select, table):
+                    tables.remove_table(table)
+        for table in self.get_subqueries(select):
+            self.optimize(table.select)
+        return select
+
+    def is_redundant(self, select, table):
+        """
+        Check whether a joined table could be removed from a statement.
+
+        :param select: Statement containing the table.
+        :type select: Select
+        :param table: Joined table to check.
+        :type table: Table
+        :return: A boolean indicating if the table is redundant.
+        :rtype: bool
+        """
+        if table.is_first or table.join != JoinTypes.LEFT_JOIN \
+                or not table.unique_keys or table.get_raw_sql() \
+                or self.is_raw(table.condition):
+            return False
+        name = table.alias if table.alias is not None else table.name
+        references = self.get_references(select, table)
+        if references is None:
+            return False
+        qualified, unqualified = references
+        if unqualified:
+            return False
+        for ref_table, ref_column in qualified:
+            if ref_table == name:
+                return False
+        joined_columns = self._get_joined_columns(table.condition, name)
+        if joined_columns is None:
+            return False
+        for key in table.unique_keys:
+            if set(key) <= joined_columns:
+                return True
+        return False
+
+    @staticmethod
+    def _get_joined_columns(condition, name):
+        """
+        Get the columns of a table compared for equality with columns of other
+        tables in its join condition.
+
+        :return: A set of column names. `None` would be returned if the join
+            condition is not a conjunction.
+        :rtype: set
+        """
+        columns = set()
+        conditions = condition.get_conditions()
+        for sub_condition in conditions[1:]:
+            if sub_condition.relation != RelationTypes.AND:
+                return None
+        for sub_condition in conditions:
+            column_1 = sub_condition.column_1
+            column_2 = sub_condition.column_2
+            if sub_condition.compare != CompareTypes.EQUALS \
+                    or column_1.value is not None or column_2 is None \
+                    or column_1.func is not None or column_2.func is not None \
+                    or column_1.get_raw_sql() or column_2.get_raw_sql():
+                continue
+            if column_1.table == name and column_2.table not in (None, name):
+                columns.add(column_1.name)
+            elif column_2.table == name \
+                    and column_1.table not in (None, name):
+                columns.add(column_2.name)
+        return columns
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import copy
+import numbers
+
+from .base_optimizer import Optimizer
+from ..constants import CompareTypes, ValueTypes, RelationTypes, JoinTypes
+from ..dml import Where
+
+
+class PredicateOptimizer(Optimizer):
+    """
+    Rule-based optimizer simplifying the filter predicates of a `Select`
+    statement and all of its sub-queries.
+
+    The following rules are applied:
+
+    1. Duplicated predicates in `WHERE`, `HAVING` and join conditions are
+       removed.
+    2. `OR` chains of equality predicates on the same column are folded into
+       one `IN` predicate.
+    3. Range predicates on the same column are merged into the tightest
+       bounds. Contradictory criteria in an `OR` chain are dropped.
+    4. `HAVING` predicates on non-aggregated group columns are moved into the
+       `WHERE` clause.
+    5. `WHERE` predicates on result tables of sub-queries are pushed down into
+       the sub-queries where this does not change the result.
+
+    .. note:: This class is subclass of :class:`Optimizer`.
+    """
+    _range_compares = (
+        CompareTypes.EQUALS, CompareTypes.GREATER_THAN,
+        CompareTypes.GREATER_THAN_OR_EQUAL, CompareTypes.LESS_THAN,
+        CompareTypes.LESS_THAN_OR_EQUAL)
+    _range_types = (ValueTypes.INTEGER, ValueTypes.LONG)
+    _literal_types = (ValueTypes.STRING, ValueTypes.INTEGER, ValueTypes.LONG)
+
+    def optimize(self, select):
+        """
+        Simplify the predicates of a `Select` statement.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        :return: The optimized statement.
+        :rtype: Select
+        """
+        if self.is_raw(select):
+            return select
+        self.move_having_predicates(select)
+        where = select.get_where()
+        if not self.is_raw(where):
+            self.optimize_clause(where)
+        having = select.get_having()
+        if not self.is_raw(having):
+            self.optimize_clause(having)
+        tables = select.get_tables()
+        if not self.is_raw(tables):
+            for table in tables.get_tables():
+                if not self.is_raw(table.condition):
+                    self.optimize_conditions(table.condition)
+        self.push_down_predicates(select)
+        for table in self.get_subqueries(select):
+            self.optimize(table.select)
+        return select
+
+    def optimize_clause(self, clause):
+        """
+        Remove duplicated predicates, merge range predicates and fold equality
+        chains of a `WHERE` or `HAVING` clause.
+
+        :param clause: Filter clause to be optimized.
+        :type clause: ClauseBase
+        """
+        columns = clause.get_columns()
+        if not columns:
+            return
+        # Split criteria into AND groups joined by OR
+        groups = []
+        for col in columns:
+            if not groups or col.relation == RelationTypes.OR:
+                groups.append([])
+            groups[-1].append(col)
+        # Simplify each group and drop the duplicated ones
+        simplified = []
+        group_keys = set()
+        for group in groups:
+            group, satisfiable = self._simplify_group(group)
+            key = frozenset([self.column_key(col) for col in group])
+            if key not in group_keys:
+                group_keys.add(key)
+                simplified.append((group, satisfiable))
+        # Contradictory groups could be ignored if any other group exists
+        satisfiable = [group for group, ok in simplified if ok]
+        if satisfiable:
+            groups = satisfiable
+        else:
+            groups = [group for group, ok in simplified]
+        groups = self._fold_equality_chains(groups)
+        # Join groups back into one criteria list
+        optimized = []
+        for group in groups:
+            for index, col in enumerate(group):
+                if index == 0:
+                    col.relation = RelationTypes.OR
+                else:
+                    col.relation = RelationTypes.AND
+                optimized.append(col)
+        clause.set_columns(optimized)
+
+    def optimize_conditions(self, condition):
+        """
+        Remove duplicated sub-conditions of a table join condition.
+
+        :param condition: Join condition to be optimized.
+        :type condition: JoinedConditions
+        """
+        conditions = condition.get_conditions()
+        if self.has_or(conditions):
+            return
+        unique = []
+        keys = set()
+        for sub_condition in conditions:
+            key = (self.column_key(sub_condition.column_1),
+                   self.column_key(sub_condition.column_2),
+                   sub_condition.compare)
+            if key not in keys:
+                keys.add(key)
+                unique.append(sub_condition)
+        if len(unique) < len(conditions):
+            condition.set_conditions(unique)
+
+    def move_having_predicates(self, select):
+        """
+        Move `HAVING` predicates on non-aggregated group columns into the
+        `WHERE` clause, so that records are filtered before being grouped.
+        Predicates with values of type :attr:`~.constants.ValueTypes.OTHER`
+        are kept, since the values could refer to aggregates.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        """
+        having = select.get_having()
+        group_by = select.get_group_by()
+        where = select.get_where()
+        if self.is_raw(having) or self.is_raw(group_by):
+            return
+        if where is not None and where.get_raw_sql():
+            return
+        columns = having.get_columns()
+        if self.has_or(columns):
+            return
+        if where is not None and self.has_or(where.get_columns()):
+            return
+        group_columns = set([
+            (col.table, col.name) for col in group_by.get_columns()])
+        moved = [col for col in columns
+                 if col.func is None and not col.get_raw_sql()
+                 and col.type not in (ValueTypes.OTHER, None)
+                 and (col.table, col.name) in group_columns]
+        if not moved:
+            return
+        if where is None:
+            where = Where()
+            select.set_where(where)
+        for col in moved:
+            col.relation = RelationTypes.AND
+        where.set_columns(where.get_columns() + moved)
+        remaining = [col for col in columns if col not in moved]
+        if remaining:
+            having.set_columns(remaining)
+        else:
+            select.set_having(None)
+
+    def push_down_predicates(self, select):
+        """
+        Push `WHERE` predicates on result tables of sub-queries down into the
+        sub-queries.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        """
+        where = select.get_where()
+        tables = select.get_tables()
+        if self.is_raw(where) or self.is_raw(tables):
+            return
+        columns = where.get_columns()
+        if self.has_or(columns):
+            return
+        remaining = [col for col in columns
+                     if not self._push_down(col, tables.get_tables())]
+        if len(remaining) < len(columns):
+            where.set_columns(remaining)
+
+    def _push_down(self, column, tables):
+        """
+        Push one predicate down into the sub-query it refers to.
+
+        :param column: Predicate to be pushed down.
+        :type column: Column
+        :param tables: List of tables of the outer statement.
+        :type tables: list
+        :return: A boolean indicating if the predicate is pushed down.
+        :rtype: bool
+        """
+        if column.get_raw_sql() or column.table is None \
+                or column.func is not None or not self._is_literal(column):
+            return False
+        for index, table in enumerate(tables):
+            if table.select is None or table.alias != column.table:
+                continue
+            inner = table.select
+            if self.is_raw(inner) or self._is_null_supplying(tables, index):
+                return False
+            target = self._get_output_column(inner, column.name)
+            if target is None:
+                return False
+            group_by = inner.get_group_by()
+            if group_by is not None:
+                if group_by.get_raw_sql():
+                    return False
+                group_columns = [(col.table, col.name)
+                                 for col in group_by.get_columns()]
+                if (target.table, target.name) not in group_columns:
+                    return False
+            where = inner.get_where()
+            if where is not None and (where.get_raw_sql()
+                                      or self.has_or(where.get_columns())):
+                return False
+            pushed = copy.copy(column)
+            pushed.table = target.table
+            pushed.name = target.name
+            pushed.relation = RelationTypes.AND
+            if where is None:
+                where = Where()
+                inner.set_where(where)
+            where.set_columns(where.get_columns() + [pushed])
+            return True
+        return False
+
+    def _simplify_group(self, group):
+        """
+        Remove duplicated predicates and merge range predicates in a group of
+        criteria joined by AND.
+
+        :param group: List of criteria joined by AND.
+        :type group: list
+        :return: Simplified criteria, and a boolean indicating whether the
+            criteria could be satisfied.
+        :rtype: tuple
+        """
+        unique = []
+        keys = set()
+        for col in group:
+            key = self.column_key(col)
+            if key not in keys:
+                keys.add(key)
+                unique.append(col)
+        # Collect range predicates by column
+        ranges = {}
+        slots = []
+        for col in unique:
+            if self._is_range(col):
+                key = (col.table, col.name, col.func)
+                if key not in ranges:
+                    ranges[key] = []
+                    slots.append(key)
+                ranges[key].append(col)
+            else:
+                slots.append(col)
+        simplified = []
+        satisfiable = True
+        for slot in slots:
+            if isinstance(slot, tuple):
+                merged, ok = self._merge_range(ranges[slot])
+                simplified.extend(merged)
+                satisfiable = satisfiable and ok
+            else:
+                simplified.append(slot)
+        return simplified, satisfiable
+
+    def _merge_range(self, columns):
+        """
+        Merge range predicates on the same column into the tightest bounds.
+
+        :param columns: List of range predicates on the same column.
+        :type columns: list
+        :return: Merged predicates, and a boolean indicating whether the
+            predicates could be satisfied.
+        :rtype: tuple
+        """
+        equals = []
+        lower = None
+        upper = None
+        for col in columns:
+            if col.compare == CompareTypes.EQUALS:
+                if col.value not in [eq.value for eq in equals]:
+                    equals.append(col)
+            elif col.compare in (CompareTypes.GREATER_THAN,
+                                 CompareTypes.GREATER_THAN_OR_EQUAL):
+                if lower is None or col.value > lower.value or (
+                        col.value == lower.value
+                        and col.compare == CompareTypes.GREATER_THAN):
+                    lower = col
+            else:
+                if upper is None or col.value < upper.value or (
+                        col.value == upper.value
+                        and col.compare == CompareTypes.LESS_THAN):
+                    upper = col
+        bounds = [col for col in columns if col is lower or col is upper]
+        if equals:
+            value = equals[0].value
+            if len(equals) == 1 and self._in_bounds(value, lower, upper):
+                return equals, True
+            return equals + bounds, False
+        if lower is not None and upper is not None:
+            if lower.value > upper.value:
+                return bounds, False
+            if lower.value == upper.value:
+                if lower.compare == CompareTypes.GREATER_THAN_OR_EQUAL \
+                        and upper.compare == CompareTypes.LESS_THAN_OR_EQUAL:
+                    equal = copy.copy(bounds[0])
+                    equal.compare = CompareTypes.EQUALS
+                    return [equal], True
+                return bounds, False
+        return bounds, True
+
+    def _fold_equality_chains(self, groups):
+        """
+        Fold single equality or `IN` predicates on the same column in an `OR`
+        chain into one `IN` predicate.
+
+        :param groups: List of criteria groups joined by OR.
+        :type groups: list
+        :return: Folded criteria groups.
+        :rtype: list
+        """
+        folded = []
+        chains = {}
+        for group in groups:
+            if len(group) != 1 or not self._is_foldable(group[0]):
+                folded.append(group)
+                continue
+            col = group[0]
+            if col.compare == CompareTypes.IN:
+                values = list(col.value)
+            else:
+                values = [col.value]
+            key = (col.table, col.name, col.func, col.type)
+            if key in chains:
+                chain = chains[key]
+                for value in values:
+                    if value not in chain.value:
+                        chain.value.append(value)
+                continue
+            chain = copy.copy(col)
+            chain.compare = CompareTypes.IN
+            chain.value = []
+            for value in values:
+                if value not in chain.value:
+                    chain.value.append(value)
+            chains[key] = chain
+            folded.append([chain])
+        for chain in chains.values():
+            if len(chain.value) == 1:
+                chain.compare = CompareTypes.EQUALS
+                chain.value = chain.value[0]
+        return folded
+
+    def _is_range(self, column):
+        """
+        Check whether a predicate compares a column with an integer value.
+        """
+        return not column.get_raw_sql() \
+            and column.compare in self._range_compares \
+            and column.type in self._range_types \
+            and isinstance(column.value, numbers.Integral) \
+            and not isinstance(column.value, bool)
+
+    def _is_foldable(self, column):
+        """
+        Check whether a predicate could be folded into an `IN` predicate.
+        """
+        if column.get_raw_sql() or column.value is None \
+                or column.type not in self._literal_types:
+            return False
+        if column.compare == CompareTypes.EQUALS:
+            values = [column.value]
+        elif column.compare == CompareTypes.IN \
+                and isinstance(column.value, (list, tuple)):
+            values = column.value
+        else:
+            return False
+        return True
+
+    def _is_literal(self, column):
+        """
+        Check whether a predicate compares a column with literal values only.
+        """
+        if column.value is None:
+            return False
+        return column.type in self._literal_types \
+            or column.compare in (CompareTypes.NULL, CompareTypes.NOT_NULL) \
+            or isinstance(column.value, (list, tuple))
+
+    @staticmethod
+    def _in_bounds(value, lower, upper):
+        """
+        Check whether a value is within the range of lower and upper bounds.
+        """
+        if lower is not None:
+            if value < lower.value or (
+                    value == lower.value
+                    and lower.compare == CompareTypes.GREATER_THAN):
+                return False
+        if upper is not None:
+            if value > upper.value or (
+                    value == upper.value
+                    and upper.compare == CompareTypes.LESS_THAN):
+                return False
+        return True
+
+    @staticmethod
+    def _is_null_supplying(tables, index):
+        """
+        Check whether a table in a table list could be extended with NULL
+        records by outer joins.
+        """
+        for table in tables[index + 1:]:
+            if table.join in (JoinTypes.RIGHT_JOIN, JoinTypes.FULL_JOIN):
+                return True
+        if index > 0 and tables[index].join in (JoinTypes.LEFT_JOIN,
+                                                JoinTypes.FULL_JOIN):
+            return True
+        return False
+
+    @staticmethod
+    def _get_output_column(select, name):
+        """
+        Get the non-aggregated column of a statement providing a result column.
+        """
+        found = None
+        for col in select.get_columns():
+            output = col.alias if col.alias is not None else col.name
+            if output != name or col.get_raw_sql():
+                continue
+            if found is not None or col.func is not None:
+                return None
+            found = col
+        return found
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+from .base_optimizer import Optimizer
+
+
+class ProjectionOptimizer(Optimizer):
+    """
+    Optimizer removing the columns of sub-query result tables which are never
+    referenced by the outer statement.
+
+    References are collected from the columns, `WHERE`, `GROUP BY`,
+    `HAVING` and `ORDER BY` clauses and join conditions of the outer
+    statement. Unqualified references are considered to refer to all
+    sub-queries providing a column of that name. Nested sub-queries are pruned
+    recursively.
+
+    .. note:: This class is subclass of :class:`Optimizer`.
+    """
+
+    def optimize(self, select):
+        """
+        Prune unreferenced columns of all sub-queries in a `Select`
+        statement.
+
+        :param select: Statement to be optimized.
+        :type select: Select
+        :return: The optimized statement.
+        :rtype: Select
+        """
+        if self.is_raw(select):
+            return select
+        subqueries = self.get_subqueries(select)
+        if not subqueries:
+            return select
+        references = self.get_references(select)
+        for table in subqueries:
+            if references is not None:
+                self.prune(table, references)
+            self.optimize(table.select)
+        return select
+
+    def prune(self, table, references):
+        """
+        Remove unreferenced columns from the statement of a result table.
+
+        :param table: Result table created by a sub-query.
+        :type table: Table
+        :param references: Column references of the outer statement returned
+            by :meth:`get_references`.
+        :type references: tuple
+        """
+        inner = table.select
+        columns = inner.get_columns()
+        if inner.get_distinct() or not columns:
+            # Removing columns changes the result of DISTINCT
+            return
+        for col in columns:
+            if col.get_raw_sql():
+                return
+        qualified, unqualified = references
+        if (table.alias, self._all_columns) in qualified \
+                or self._all_columns in unqualified:
+            return
+        inner_references = self.get_clause_references(inner)
+        if inner_references is None:
+            return
+        keep = []
+        for col in columns:
+            output = col.alias if col.alias is not None else col.name
+            if (table.alias, output) in qualified or output in unqualified \
+                    or (col.alias is not None
+                        and col.alias in inner_references[1]):
+                keep.append(col)
+        if not keep:
+            # Keep at least one column for a valid statement
+            keep = columns[:1]
+        if len(keep) < len(columns):
+            inner.set_columns(keep)
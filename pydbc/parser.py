@@ -0,0 +1,476 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+SQL Parser
+==========
+Parser
+------
+.. autoclass:: pydbc.parser.Parser
+    :members:
+
+SQLParseError
+-------------
+.. autoclass:: pydbc.parser.SQLParseError
+    :members:
+"""
+
+import re
+
+from .constants import (
+    CompareTypes, ValueTypes, RelationTypes, AggregateFunctions, JoinTypes)
+from .dml import (
+    Column, JoinedConditions, JoinedTables, Where, Having, GroupBy, OrderBy,
+    Select)
+
+
+class SQLParseError(ValueError):
+    """
+    The error raised if a SQL statement could not be parsed.
+    """
+
+    def __init__(self, reason, position=None):
+        """
+        Initialize SQLParseError.
+
+        :param reason: Description of the problem.
+        :type reason: str
+        :param position: Offset of the problem in the SQL statement.
+        :type position: int
+        """
+        if position is not None:
+            msg = "Unable to parse SQL at %d: %s!" % (position, reason)
+        else:
+            msg = "Unable to parse SQL: %s!" % reason
+        super(SQLParseError, self).__init__(msg)
+
+
+class Parser(object):
+    """
+    Parse SQL `SELECT` statements into DML objects.
+
+    The supported subset matches the statements which could be created by
+    :mod:`pydbc.dml`:
+
+    * Columns with optional table names, aggregate functions and aliases.
+    * Tables and sub-queries combined by `INNER`, `LEFT`, `RIGHT` and `FULL`
+      joins with `ON` conditions.
+    * `WHERE` and `HAVING` criteria joined by `AND` and `OR`, using comparison
+      operators, `LIKE` patterns with leading or trailing wildcards, `IN`
+      lists and `IS NULL` checks.
+    * `GROUP BY` and `ORDER BY` columns.
+
+    Parentheses around criteria and expressions other than the ones listed
+    above are not supported.
+    """
+    _token_pattern = re.compile(r"""
+        (?P<space>\s+)
+        |(?P<string>'(?:[^']|'')*')
+        |(?P<number>-?\d+(?:\.\d+)?)
+        |(?P<ident>[A-Za-z_][A-Za-z0-9_$]*)
+        |(?P<quoted>"[^"]+"|`[^`]+`|\[[^\]]+\])
+        |(?P<op><>|!=|>=|<=|=|<|>)
+        |(?P<punct>[(),.*;])
+    """, re.VERBOSE)
+    _keywords = frozenset([
+        "SELECT", "DISTINCT", "FROM", "WHERE", "GROUP", "BY", "HAVING",
+        "ORDER", "ASC", "DESC", "AS", "JOIN", "INNER", "LEFT", "RIGHT", "FULL",
+        "OUTER", "ON", "AND", "OR", "NOT", "LIKE", "IN", "IS", "NULL",
+        # Reserved words of unsupported clauses
+        "LIMIT", "OFFSET", "UNION", "BETWEEN", "CASE"
+    ])
+    _operators = {
+        "=": CompareTypes.EQUALS,
+        "!=": CompareTypes.NOT_EQUAL,
+        "<>": CompareTypes.NOT_EQUAL,
+        ">": CompareTypes.GREATER_THAN,
+        ">=": CompareTypes.GREATER_THAN_OR_EQUAL,
+        "<": CompareTypes.LESS_THAN,
+        "<=": CompareTypes.LESS_THAN_OR_EQUAL,
+    }
+    _functions = {
+        "AVG": AggregateFunctions.AVG,
+        "COUNT": AggregateFunctions.COUNT,
+        "SUM": AggregateFunctions.SUM,
+        "MAX": AggregateFunctions.MAX,
+        "MIN": AggregateFunctions.MIN,
+    }
+    _joins = {
+        "INNER": JoinTypes.INNER_JOIN,
+        "LEFT": JoinTypes.LEFT_JOIN,
+        "RIGHT": JoinTypes.RIGHT_JOIN,
+        "FULL": JoinTypes.FULL_JOIN,
+    }
+
+    def __init__(self):
+        """
+        Initialize a `Parser` object.
+        """
+        self._tokens = []
+        self._pos = 0
+
+    @classmethod
+    def parse_raw(cls, select):
+        """
+        Parse the RAW SQL statement of a `Select` object.
+
+        :param select: Select object with a RAW SQL statement.
+        :type select: Select
+        :return: A new select object built from the RAW SQL statement, or the
+            given object if no RAW SQL statement is set.
+        :rtype: Select
+        :raises SQLParseError: If the statement could not be parsed.
+        """
+        if not select.get_raw_sql():
+            return select
+        return cls().parse(select.create_keyword() + select.get_raw_sql())
+
+    def parse(self, sql):
+        """
+        Parse a SQL `SELECT` statement.
+
+        :param sql: SQL statement to be parsed.
+        :type sql: str
+        :return: Select object of the statement.
+        :rtype: Select
+        :raises SQLParseError: If the statement could not be parsed.
+        """
+        self._tokens = self._tokenize(sql)
+        self._pos = 0
+        select = self._parse_select()
+        self._accept_punct(";")
+        if self._peek() is not None:
+            self._error("unexpected token '%s'" % self._peek()[1])
+        return select
+
+    def _tokenize(self, sql):
+        tokens = []
+        pos = 0
+        while pos < len(sql):
+            match = self._token_pattern.match(sql, pos)
+            if match is None:
+                raise SQLParseError("unexpected character '%s'" % sql[pos],
+                                    pos)
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "quoted":
+                tokens.append(("ident", value[1:-1], pos))
+            elif kind == "ident" and value.upper() in self._keywords:
+                tokens.append(("keyword", value.upper(), pos))
+            elif kind != "space":
+                tokens.append((kind, value, pos))
+            pos = match.end()
+        return tokens
+
+    # Token helpers
+    def _peek(self, offset=0):
+        index = self._pos + offset
+        if index < len(self._tokens):
+            return self._tokens[index]
+        return None
+
+    def _next(self):
+        token = self._peek()
+        if token is None:
+            self._error("unexpected end of statement")
+        self._pos += 1
+        return token
+
+    def _error(self, reason):
+        token = self._peek()
+        raise SQLParseError(reason, token[2] if token is not None else None)
+
+    def _is(self, kind, value=None, offset=0):
+        token = self._peek(offset)
+        return token is not None and token[0] == kind \
+            and (value is None or token[1] == value)
+
+    def _accept_keyword(self, *keywords):
+        for index, keyword in enumerate(keywords):
+            if not self._is("keyword", keyword, index):
+                return False
+        self._pos += len(keywords)
+        return True
+
+    def _expect_keyword(self, *keywords):
+        if not self._accept_keyword(*keywords):
+            self._error("expected '%s'" % " ".join(keywords))
+
+    def _accept_punct(self, punct):
+        if self._is("punct", punct):
+            self._pos += 1
+            return True
+        return False
+
+    def _expect_punct(self, punct):
+        if not self._accept_punct(punct):
+            self._error("expected '%s'" % punct)
+
+    def _expect_ident(self):
+        if not self._is("ident"):
+            self._error("expected identifier")
+        return self._next()[1]
+
+    # Statement
+    def _parse_select(self):
+        select = Select()
+        self._expect_keyword("SELECT")
+        select.set_distinct(self._accept_keyword("DISTINCT"))
+        if not self._accept_punct("*"):
+            while True:
+                name, table, func = self._parse_column_ref(True)
+                select.add_column(name, table, func, self._parse_alias())
+                if not self._accept_punct(","):
+                    break
+        self._expect_keyword("FROM")
+        select.set_tables(self._parse_tables())
+        if self._accept_keyword("WHERE"):
+            where = Where()
+            self._parse_criteria(where)
+            select.set_where(where)
+        if self._accept_keyword("GROUP", "BY"):
+            group_by = GroupBy()
+            while True:
+                name, table, func = self._parse_column_ref()
+                group_by.add_column(name, table)
+                if not self._accept_punct(","):
+                    break
+            select.set_group_by(group_by)
+        if self._accept_keyword("HAVING"):
+            having = Having()
+            self._parse_criteria(having)
+            select.set_having(having)
+        if self._accept_keyword("ORDER", "BY"):
+            order_by = OrderBy()
+            while True:
+                name, table, func = self._parse_column_ref()
+                asc = not self._accept_keyword("DESC")
+                if asc:
+                    self._accept_keyword("ASC")
+                order_by.add_column(name, asc, table)
+                if not self._accept_punct(","):
+                    break
+            select.set_order_by(order_by)
+        return select
+
+    def _parse_alias(self):
+        if self._accept_keyword("AS"):
+            return self._expect_ident()
+        if self._is("ident"):
+            return self._next()[1]
+        return None
+
+    def _parse_column_ref(self, aggregate=False):
+        """
+        Parse a column reference in form of `[FUNC(][table.]column[)]`.
+
+        :return: Tuple of column name, table name and aggregate function.
+        :rtype: tuple
+        """
+        func = None
+        if aggregate and self._is("ident") and self._is("punct", "(", 1) \
+                and self._peek()[1].upper() in self._functions:
+            func = self._functions[self._next()[1].upper()]
+            self._expect_punct("(")
+            if self._accept_punct("*"):
+                self._expect_punct(")")
+                return "*", None, func
+        name = self._expect_ident()
+        table = None
+        if self._accept_punct("."):
+            table = name
+            if self._accept_punct("*"):
+                name = "*"
+            else:
+                name = self._expect_ident()
+        if func is not None:
+            self._expect_punct(")")
+        return name, table, func
+
+    # Tables
+    def _parse_tables(self):
+        tables = JoinedTables()
+        self._parse_table(tables, JoinTypes.INNER_JOIN)
+        while True:
+            join = None
+            for keyword, join_type in self._joins.items():
+                if self._accept_keyword(keyword):
+                    self._accept_keyword("OUTER")
+                    join = join_type
+                    break
+            if join is None and not self._is("keyword", "JOIN"):
+                break
+            self._expect_keyword("JOIN")
+            if join is None:
+                join = JoinTypes.INNER_JOIN
+            self._parse_table(tables, join)
+        return tables
+
+    def _parse_table(self, tables, join):
+        select = None
+        name = None
+        if self._accept_punct("("):
+            select = self._parse_select()
+            self._expect_punct(")")
+        else:
+            name = self._expect_ident()
+        alias = self._parse_alias()
+        if select is not None and alias is None:
+            self._error("sub-query requires an alias")
+        condition = None
+        if tables.get_size() > 0:
+            self._expect_keyword("ON")
+            condition = self._parse_join_conditions()
+        tables.add_table(name, alias, select, join, condition)
+
+    def _parse_join_conditions(self):
+        condition = JoinedConditions()
+        relation = RelationTypes.AND
+        while True:
+            name, table, func = self._parse_column_ref()
+            column_1 = Column(name)
+            column_1.table = table
+            column_2 = None
+            compare = self._parse_operator()
+            if self._is("ident"):
+                name, table, func = self._parse_column_ref()
+                column_2 = Column(name)
+                column_2.table = table
+            else:
+                column_1.compare = compare
+                column_1.value, column_1.type = self._parse_literal()
+            condition.add_condition(column_1, column_2, compare, relation)
+            relation = self._parse_relation()
+            if relation is None:
+                return condition
+
+    # Criteria
+    def _parse_relation(self):
+        if self._accept_keyword("AND"):
+            return RelationTypes.AND
+        if self._accept_keyword("OR"):
+            return RelationTypes.OR
+        return None
+
+    def _parse_operator(self):
+        if not self._is("op"):
+            self._error("expected comparison operator")
+        return self._operators[self._next()[1]]
+
+    def _parse_literal(self):
+        """
+        Parse a literal value.
+
+        :return: Tuple of the value and its value type.
+        :rtype: tuple
+        """
+        kind, value, pos = self._next()
+        if kind == "string":
+            return value[1:-1].replace("''", "'"), ValueTypes.STRING
+        elif kind == "number":
+            if "." in value:
+                return float(value), ValueTypes.OTHER
+            return int(value), ValueTypes.INTEGER
+        raise SQLParseError("expected literal value", pos)
+
+    def _parse_criteria(self, clause):
+        relation = RelationTypes.AND
+        while True:
+            name, table, func = self._parse_column_ref(True)
+            value, value_type, compare = self._parse_predicate()
+            if isinstance(clause, Having):
+                clause.add_column(name, func, value, table, value_type,
+                                  compare, relation)
+            elif func is not None:
+                self._error("aggregate function is not allowed in WHERE")
+            else:
+                clause.add_column(name, value, table, value_type, compare,
+                                  relation)
+            relation = self._parse_relation()
+            if relation is None:
+                return
+
+    def _parse_predicate(self):
+        """
+        Parse the operator and value of a criterion.
+
+        :return: Tuple of value, value type and compare type.
+        :rtype: tuple
+        """
+        if self._accept_keyword("IS"):
+            if self._accept_keyword("NOT"):
+                compare = CompareTypes.NOT_NULL
+            else:
+                compare = CompareTypes.NULL
+            self._expect_keyword("NULL")
+            return "", ValueTypes.OTHER, compare
+        negative = self._accept_keyword("NOT")
+        if self._accept_keyword("LIKE"):
+            return self._parse_like(negative)
+        if self._accept_keyword("IN"):
+            compare = CompareTypes.NOT_IN if negative else CompareTypes.IN
+            values = []
+            value_types = set()
+            self._expect_punct("(")
+            while True:
+                value, value_type = self._parse_literal()
+                values.append(value)
+                value_types.add(value_type)
+                if not self._accept_punct(","):
+                    break
+            self._expect_punct(")")
+            if len(value_types) == 1:
+                value_type = value_types.pop()
+            else:
+                self._error("mixed value types in IN list")
+            return values, value_type, compare
+        if negative:
+            self._error("expected 'LIKE' or 'IN'")
+        compare = self._parse_operator()
+        if self._is("ident"):
+            # Compare with another column
+            name, table, func = self._parse_column_ref()
+            if table is not None:
+                name = ".".join([table, name])
+            return name, ValueTypes.OTHER, compare
+        value, value_type = self._parse_literal()
+        return value, value_type, compare
+
+    def _parse_like(self, negative):
+        if not self._is("string"):
+            self._error("expected pattern string")
+        pattern = self._parse_literal()[0]
+        starts = pattern.startswith("%")
+        ends = pattern.endswith("%") and len(pattern) > 1
+        value = pattern[int(starts):len(pattern) - int(ends)]
+        if not value or "%" in value or "_" in value:
+            self._pos -= 1
+            self._error("unsupported LIKE pattern")
+        if starts and ends:
+            compare = CompareTypes.NOT_CONTAIN if negative \
+                else CompareTypes.CONTAINS
+        elif starts:
+            compare = CompareTypes.NOT_END_WITH if negative \
+                else CompareTypes.ENDS_WITH
+        elif ends:
+            compare = CompareTypes.NOT_BEGIN_WITH if negative \
+                else CompareTypes.BEGINS_WITH
+        else:
+            if negative:
+                self._pos -= 1
+                self._error("unsupported LIKE pattern")
+            compare = CompareTypes.EQUALS
+        return value, ValueTypes.STRING, compare
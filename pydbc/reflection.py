@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Schema Reflection
+=================
+Reflector
+---------
+.. autoclass:: pydbc.reflection.Reflector
+    :members:
+
+TableMetadata
+-------------
+.. autoclass:: pydbc.reflection.TableMetadata
+    :members:
+
+ColumnMetadata
+--------------
+.. autoclass:: pydbc.reflection.ColumnMetadata
+    :members:
+
+IndexMetadata
+-------------
+.. autoclass:: pydbc.reflection.IndexMetadata
+    :members:
+
+NoSuchTableError
+----------------
+.. autoclass:: pydbc.reflection.NoSuchTableError
+    :members:
+"""
+
+import json
+import threading
+import time
+
+from .fileutils import FileUtils
+from .sqlutils import SQLUtils
+
+
+class NoSuchTableError(ValueError):
+    """
+    The error raised if a table to be reflected does not exist.
+    """
+
+    def __init__(self, table_name):
+        """
+        Initialize NoSuchTableError.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        """
+        msg = "Table '%s' does not exist!" % table_name
+        super(NoSuchTableError, self).__init__(msg)
+
+
+class ColumnMetadata(object):
+    """
+    Metadata of a table column.
+
+    :ivar str name: Name of the column.
+    :ivar str type_name: Type name of the column in the database.
+    :ivar SQLTypes sql_type: Generic SQL type of the column, or `None` if the
+        type is not known by the dialect.
+    :ivar bool nullable: A boolean indicating whether the column accepts
+        `NULL` values.
+    """
+
+    def __init__(self, name, type_name, sql_type=None, nullable=True):
+        """
+        Initialize a `ColumnMetadata` object.
+
+        :param name: Name of the column.
+        :type name: str
+        :param type_name: Type name of the column in the database.
+        :type type_name: str
+        :param sql_type: Generic SQL type of the column.
+        :type sql_type: SQLTypes
+        :param nullable: A boolean indicating whether the column accepts
+            `NULL` values.
+        :type nullable: bool
+        """
+        self.name = name
+        self.type_name = type_name
+        self.sql_type = sql_type
+        self.nullable = nullable
+
+    def get_value_type(self):
+        """
+        Get the type of values to be bound for the column.
+
+        :return: Value type of the column.
+        :rtype: ValueTypes
+        """
+        return SQLUtils.get_value_type(self.sql_type)
+
+
+class IndexMetadata(object):
+    """
+    Metadata of a table index.
+
+    :ivar str name: Name of the index.
+    :ivar list columns: Names of the indexed columns.
+    :ivar bool unique: A boolean indicating whether the index is unique.
+    """
+
+    def __init__(self, name, columns, unique=False):
+        """
+        Initialize an `IndexMetadata` object.
+
+        :param name: Name of the index.
+        :type name: str
+        :param columns: Names of the indexed columns.
+        :type columns: list
+        :param unique: A boolean indicating whether the index is unique.
+        :type unique: bool
+        """
+        self.name = name
+        self.columns = list(columns)
+        self.unique = unique
+
+
+class TableMetadata(object):
+    """
+    Metadata of a table.
+
+    :ivar str name: Name of the table.
+    :ivar list columns: Column metadata in the order of the table columns.
+    :ivar list primary_key: Column names of the primary key.
+    :ivar list indexes: Index metadata of the table.
+    """
+
+    def __init__(self, name, columns, primary_key=None, indexes=None):
+        """
+        Initialize a `TableMetadata` object.
+
+        :param name: Name of the table.
+        :type name: str
+        :param columns: Column metadata of the table.
+        :type columns: list
+        :param primary_key: Column names of the primary key.
+        :type primary_key: list
+        :param indexes: Index metadata of the table.
+        :type indexes: list
+        """
+        self.name = name
+        self.columns = list(columns)
+        self.primary_key = list(primary_key or [])
+        self.indexes = list(indexes or [])
+
+    def get_column(self, column_name):
+        """
+        Get metadata of a column by name.
+
+        :param column_name: Name of the column.
+        :type column_name: str
+        :return: Column metadata, or `None` if the column does not exist.
+        :rtype: ColumnMetadata
+        """
+        for column in self.columns:
+            if column.name == column_name:
+                return column
+        return None
+
+    def get_unique_keys(self):
+        """
+        Get the unique keys of the table, which are the primary key and the
+        columns of unique indexes. The keys could be declared on joined
+        tables by :meth:`~.dml.JoinedTables.add_table`.
+
+        :return: List of unique keys. Each key is a list of column names.
+        :rtype: list
+        """
+        keys = []
+        if self.primary_key:
+            keys.append(list(self.primary_key))
+        for index in self.indexes:
+            if index.unique and index.columns not in keys:
+                keys.append(list(index.columns))
+        return keys
+
+    def to_dict(self):
+        """
+        Convert the metadata into a dict of basic types, which could be
+        stored as JSON.
+
+        :return: Dict of the metadata.
+        :rtype: dict
+        """
+        return {
+            "name": self.name,
+            "columns": [[col.name, col.type_name, col.sql_type, col.nullable]
+                        for col in self.columns],
+            "primary_key": self.primary_key,
+            "indexes": [[index.name, index.columns, index.unique]
+                        for index in self.indexes],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create table metadata from a dict created by :meth:`to_dict`.
+
+        :param data: Dict of the metadata.
+        :type data: dict
+        :return: Table metadata.
+        :rtype: TableMetadata
+        """
+        return cls(data["name"],
+                   [ColumnMetadata(*col) for col in data["columns"]],
+                   data["primary_key"],
+                   [IndexMetadata(*index) for index in data["indexes"]])
+
+
+class Reflector(object):
+    """
+    Read table metadata through the dialect of an executor, and cache the
+    results.
+
+    Metadata are cached in memory for a limited time. If a cache file is set,
+    the cache is also stored in the file, so that processes started later
+    could skip querying the catalog of the database::
+
+        reflector = Reflector(executor, cache_file="schema.json")
+        table = reflector.get_table("foo")
+
+    .. note:: A cache file should only be shared by connections to the same
+        database.
+
+    :ivar Executor _executor: Executor providing the connection and dialect.
+    :ivar float _ttl: Seconds to keep the metadata of a table.
+    :ivar str _cache_file: Path of the file to store the cache in.
+    :ivar dict _tables: Tuples of reflecting time and metadata by table name.
+    """
+    DEFAULT_TTL = 300
+    CACHE_VERSION = 1
+
+    def __init__(self, executor, ttl=DEFAULT_TTL, cache_file=None):
+        """
+        Initialize a `Reflector` object.
+
+        :param executor: Executor providing the connection and dialect.
+        :type executor: Executor
+        :param ttl: Seconds to keep the metadata of a table. Metadata are
+            always read from the database if `0`, and never expire if `None`.
+        :type ttl: float
+        :param cache_file: Path of the file to store the cache in. Default by
+            no file.
+        :type cache_file: str
+        """
+        self._executor = executor
+        self._ttl = ttl
+        self._cache_file = cache_file
+        self._tables = {}
+        self._lock = threading.Lock()
+        if cache_file is not None:
+            self._load()
+
+    def get_table(self, table_name):
+        """
+        Get metadata of a table, reading it from the database if it is not
+        cached or expired.
+
+        :param table_name: Name of the table.
+        :type table_name: str
+        :return: Table metadata.
+        :rtype: TableMetadata
+        :raises NoSuchTableError: If the table does not exist.
+        """
+        with self._lock:
+            cached = self._tables.get(table_name)
+        if cached is not None and not self._is_expired(cached[0]):
+            return cached[1]
+        metadata = self._executor.get_dialect().reflect_table(
+            self._executor.get_connection(), table_name)
+        if metadata is None:
+            raise NoSuchTableError(table_name)
+        with self._lock:
+            self._tables[table_name] = (time.time(), metadata)
+        if self._cache_file is not None:
+            self._save()
+        return metadata
+
+    def invalidate(self, table_name=None):
+        """
+        Remove metadata from the cache, for example after altering a table.
+
+        :param table_name: Name of the table. Metadata of all tables are
+            removed if not specified.
+        :type table_name: str
+        """
+        with self._lock:
+            if table_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_name, None)
+        if self._cache_file is not None:
+            self._save()
+
+    def _is_expired(self, reflected):
+        if self._ttl is None:
+            return False
+        return time.time() - reflected >= self._ttl
+
+    def _load(self):
+        try:
+            with open(self._cache_file, "rb") as cache_file:
+                data = json.load(cache_file)
+            if data.get("version") != self.CACHE_VERSION:
+                return
+            tables = dict([
+                (name, (reflected, TableMetadata.from_dict(metadata)))
+                for name, (reflected, metadata) in data["tables"].items()])
+        except (IOError, ValueError, KeyError, TypeError):
+            # Missing or broken cache files are rebuilt
+            return
+        with self._lock:
+            self._tables.update(tables)
+
+    def _save(self):
+        with self._lock:
+            tables = dict([
+                (name, [reflected, metadata.to_dict()])
+                for name, (reflected, metadata) in self._tables.items()])
+        data = {"version": self.CACHE_VERSION, "tables": tables}
+        # Replace the file at once, so readers never see a partial file
+        FileUtils.write_atomic(self._cache_file, json.dumps(data))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Streaming Render
+================
+SQLWriter
+---------
+.. autoclass:: pydbc.render.SQLWriter
+    :members:
+"""
+
+
+class SQLWriter(object):
+    """
+    Buffered writer collecting the pieces of a SQL statement written by
+    :meth:`~.dml.DMLBase.write_sql` into chunks for a file-like or
+    socket-like target, so that the target is not called for each piece.
+    The memory used is bounded by the buffer size, whatever the size of the
+    statement is.
+
+    Statements are rendered into a file by::
+
+        with SQLWriter(open("insert.sql", "wb")) as writer:
+            insert.write_sql(writer, dialect)
+
+    Unicode pieces are encoded before they are written.
+
+    :ivar int buffer_size: Number of bytes collected before writing a chunk.
+    :ivar int size: Number of bytes written.
+    :cvar int DEFAULT_BUFFER_SIZE: Default buffer size, 64 KiB.
+    """
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, target, buffer_size=DEFAULT_BUFFER_SIZE,
+                 encoding="utf-8"):
+        """
+        Initialize a `SQLWriter` object.
+
+        :param target: File-like object with a `write` method, socket-like
+            object with a `sendall` method, or a function called with each
+            chunk.
+        :type target: object
+        :param buffer_size: Number of bytes collected before writing a chunk.
+        :type buffer_size: int
+        :param encoding: Encoding of unicode pieces.
+        :type encoding: str
+        """
+        if hasattr(target, "write"):
+            self._write = target.write
+        elif hasattr(target, "sendall"):
+            self._write = target.sendall
+        else:
+            self._write = target
+        self.buffer_size = buffer_size
+        self.size = 0
+        self._encoding = encoding
+        self._pieces = []
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def write(self, piece):
+        """
+        Write a piece of a SQL statement.
+
+        :param piece: Piece of the statement.
+        :type piece: str
+        """
+        if isinstance(piece, unicode):
+            piece = piece.encode(self._encoding)
+        self._pieces.append(piece)
+        self._buffered += len(piece)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the pieces collected into the target.
+        """
+        if self._pieces:
+            chunk = "".join(self._pieces)
+            self._pieces = []
+            self._buffered = 0
+            self._write(chunk)
+            self.size += len(chunk)
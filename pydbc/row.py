@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Result Rows
+===========
+Row
+---
+.. autoclass:: pydbc.row.Row
+    :members:
+"""
+
+
+def _create_row(names, values):
+    # Rebuild rows from pickles, since row types are created dynamically
+    return Row.create_type(names)(values)
+
+
+class Row(tuple):
+    """
+    Record of a result, which could be accessed by index, by column name as a
+    key, or by column name as an attribute::
+
+        row[0], row["name"], row.name
+
+    Rows are tuples without per-row dicts. Each result has a row type created
+    by :meth:`create_type`, which holds the column names and the map from
+    column names to indexes shared by all rows of the result.
+
+    .. note:: Columns named like tuple methods, such as `count`, could only
+        be accessed by key or index. For duplicate column names, the first
+        column is used.
+
+    :cvar tuple _fields: Column names of the result.
+    :cvar dict _index: Indexes of the columns by column name.
+    """
+    __slots__ = ()
+
+    _fields = ()
+    _index = {}
+
+    # Row types by column names, shared by results of the same columns
+    _types = {}
+    _max_types = 256
+
+    @classmethod
+    def create_type(cls, names):
+        """
+        Get the row type of a result.
+
+        :param names: Column names of the result.
+        :type names: tuple
+        :return: Row type for the records of the result.
+        :rtype: type
+        """
+        names = tuple(names)
+        row_type = cls._types.get(names)
+        if row_type is None:
+            index = {}
+            for position in range(len(names) - 1, -1, -1):
+                index[names[position]] = position
+            row_type = type("Row", (Row, ), {
+                "__slots__": (), "_fields": names, "_index": index})
+            if len(cls._types) >= cls._max_types:
+                cls._types.clear()
+            cls._types[names] = row_type
+        return row_type
+
+    @staticmethod
+    def get_names(statement, description):
+        """
+        Get the column names of the result of a statement. Aliases and names
+        of the columns of a select are used if they are listed explicitly,
+        otherwise names are taken from the cursor.
+
+        :param statement: The executed statement.
+        :type statement: DMLBase
+        :param description: Description of the result from the cursor.
+        :type description: list
+        :return: Column names of the result.
+        :rtype: tuple
+        """
+        get_columns = getattr(statement, "get_columns", None)
+        columns = get_columns() if get_columns is not None else None
+        if columns and len(columns) == len(description) and \
+                not statement.get_raw_sql():
+            names = []
+            for column in columns:
+                if column.alias is not None:
+                    names.append(column.alias)
+                elif column.name == "*" or column.get_raw_sql():
+                    break
+                else:
+                    names.append(column.name)
+            else:
+                return tuple(names)
+        return tuple([column[0] for column in description])
+
+    def __getitem__(self, key):
+        if isinstance(key, basestring):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name):
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(name)
+
+    def __reduce__(self):
+        return _create_row, (self._fields, tuple(self))
+
+    def __repr__(self):
+        return "Row(%s)" % ", ".join([
+            "%s=%r" % (name, value)
+            for name, value in zip(self._fields, self)])
+
+    def keys(self):
+        """
+        Get the column names of the row.
+
+        :return: List of column names.
+        :rtype: list
+        """
+        return list(self._fields)
+
+    def get(self, key, default=None):
+        """
+        Get the value of a column by name.
+
+        :param key: Name of the column.
+        :type key: str
+        :param default: Value returned if the column does not exist.
+        :type default: object
+        :return: Value of the column.
+        :rtype: object
+        """
+        position = self._index.get(key)
+        if position is None:
+            return default
+        return tuple.__getitem__(self, position)
+
+    def as_dict(self):
+        """
+        Convert the row into a dict.
+
+        :return: Dict of values by column name.
+        :rtype: dict
+        """
+        return dict(zip(self._fields, self))
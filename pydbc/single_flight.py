@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Single-Flight Queries
+=====================
+SingleFlight
+------------
+.. autoclass:: pydbc.single_flight.SingleFlight
+    :members:
+"""
+
+import sys
+import threading
+
+
+class _Call(object):
+    """
+    A query in flight, waited for by concurrent callers.
+    """
+    __slots__ = ("event", "result", "error", "interrupted")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.interrupted = False
+
+
+class SingleFlight(object):
+    """
+    Share the results of identical selects executed concurrently.
+
+    While a select is in flight, other threads executing the same select,
+    with the same SQL statement and parameters, wait for it and share its
+    records instead of sending the select again. Errors of the select are
+    raised in all of the waiting threads, while interrupts of the executing
+    thread, like `KeyboardInterrupt`, are only raised in that thread, and
+    the waiting threads execute the select again. Results are not kept after
+    the select completes.
+
+    Single-flight is enabled by passing the same `SingleFlight` object to the
+    executors of the threads::
+
+        flight = SingleFlight()
+        executor = Executor(connection, dialect, single_flight=flight)
+
+    .. note:: A `SingleFlight` object should only be shared by connections to
+        the same database.
+
+    :ivar dict _calls: Queries in flight by key.
+    """
+
+    def __init__(self):
+        """
+        Initialize a `SingleFlight` object.
+        """
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._executed = 0
+        self._shared = 0
+
+    @staticmethod
+    def get_key(sql, params):
+        """
+        Get the key identifying a query.
+
+        :param sql: SQL statement of the query.
+        :type sql: str
+        :param params: Parameters of the query.
+        :type params: list or dict
+        :return: The key, or `None` if the parameters are not hashable.
+        :rtype: tuple
+        """
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        key = (sql, tuple(params))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def do(self, key, func):
+        """
+        Call a function unless a call of the same key is in flight, in which
+        case the result of that call is returned.
+
+        :param key: Key of the call.
+        :type key: object
+        :param func: Function to be called without arguments.
+        :type func: callable
+        :return: Result of the function.
+        :rtype: object
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self._executed += 1
+            else:
+                leader = False
+                self._shared += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error[0], call.error[1], call.error[2]
+            if call.interrupted:
+                return self.do(key, func)
+            return call.result
+        try:
+            call.result = func()
+        except Exception:
+            call.error = sys.exc_info()
+            raise
+        except BaseException:
+            # Interrupts only stop the leader, so waiters call it again
+            call.interrupted = True
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def fetchall(self, executor, statement):
+        """
+        Execute a select and fetch all records, sharing the records with
+        identical selects in flight.
+
+        :param executor: Executor of the select.
+        :type executor: Executor
+        :param statement: Select to be executed.
+        :type statement: Select
+        :return: List of records. Each caller gets its own list.
+        :rtype: list
+        """
+        compiled = executor.compile(statement, prepared=True)
+        key = self.get_key(*compiled)
+        if key is None:
+            return executor.fetch_statement(statement, compiled)
+        return list(self.do(
+            key, lambda: executor.fetch_statement(statement, compiled)))
+
+    def get_statistics(self):
+        """
+        Get statistics of the queries.
+
+        :return: Dict of number of queries `executed`, and number of queries
+            `shared` with queries in flight.
+        :rtype: dict
+        """
+        return {"executed": self._executed, "shared": self._shared}
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Slow Query Log
+==============
+SlowQueryLog
+------------
+.. autoclass:: pydbc.slow_query.SlowQueryLog
+    :members:
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+from .sqlutils import SQLUtils
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class SlowQueryLog(object):
+    """
+    Record the queries executed longer than a threshold.
+
+    The records are dicts of:
+
+    * `fingerprint` and normalized `sql` of the statement, see
+      :meth:`~.sqlutils.SQLUtils.normalize_sql`.
+    * `parameters` of the statement, redacted to their types by default, and
+      `parameter_count`.
+    * `seconds` spent on compiling, executing and fetching the rows, and
+      number of `rows` fetched.
+    * `call_site` in the application, as `file:line in function`.
+    * `plan` of the query if `explain` is set, or `None`.
+    * `time` the query finished, and number of records `suppressed` by the
+      rate limit since the previous record.
+
+    Records are written to the `pydbc.slow_query` logger by :meth:`emit`,
+    with the record in the `slow_query` attribute of the log record.
+    Subclasses could override :meth:`emit` to send them elsewhere.
+
+    Queries are recorded by passing the object to executors::
+
+        log = SlowQueryLog(threshold=0.5, explain=True)
+        executor = Executor(connection, dialect, slow_query_log=log)
+
+    :ivar float threshold: Seconds for a query to be recorded.
+    :ivar bool explain: Whether query plans are captured.
+    :ivar str parameters: How parameters are recorded, `redact`, `full` or
+        `none`.
+    :ivar int max_parameters: Maximum number of parameters recorded.
+    :ivar int max_records: Maximum number of records in a period.
+    :ivar float period: Seconds of the period for the rate limit.
+    :cvar int MAX_VALUE_LENGTH: Maximum length of string parameters recorded
+        in full.
+    """
+    REDACT = "redact"
+    FULL = "full"
+    NONE = "none"
+    MAX_VALUE_LENGTH = 100
+
+    def __init__(self, threshold=1.0, explain=False, parameters=REDACT,
+                 max_parameters=20, max_records=10, period=60.0,
+                 logger=None):
+        """
+        Initialize a `SlowQueryLog` object.
+
+        :param threshold: Seconds for a query to be recorded.
+        :type threshold: float
+        :param explain: Whether the query plans of slow queries are captured
+            right after the queries.
+        :type explain: bool
+        :param parameters: How parameters are recorded. Parameters are
+            replaced by their types if `redact`, kept if `full`, or left out
+            if `none`.
+        :type parameters: str
+        :param max_parameters: Maximum number of parameters recorded.
+        :type max_parameters: int
+        :param max_records: Maximum number of records in a period. Slow
+            queries beyond the limit are counted but not recorded.
+        :type max_records: int
+        :param period: Seconds of the period for the rate limit.
+        :type period: float
+        :param logger: Logger of the records.
+        :type logger: logging.Logger
+        """
+        self.threshold = threshold
+        self.explain = explain
+        self.parameters = parameters
+        self.max_parameters = max_parameters
+        self.max_records = max_records
+        self.period = period
+        self._logger = logger if logger is not None else \
+            logging.getLogger("pydbc.slow_query")
+        self._lock = threading.Lock()
+        self._period_start = 0.0
+        self._period_records = 0
+        self._suppressed = 0
+
+    def record(self, executor, statement, sql, params, seconds, rows):
+        """
+        Record a query if it is slow and the rate limit is not exceeded.
+
+        :param executor: Executor of the query.
+        :type executor: Executor
+        :param statement: Statement of the query, or `None` if the SQL
+            statement is built by the caller.
+        :type statement: DMLBase
+        :param sql: SQL statement executed.
+        :type sql: str
+        :param params: Parameters of the statement.
+        :type params: list or dict
+        :param seconds: Seconds spent on the query.
+        :type seconds: float
+        :param rows: Number of rows fetched.
+        :type rows: int
+        :return: The record, or `None` if the query is not recorded.
+        :rtype: dict
+        """
+        if seconds < self.threshold:
+            return None
+        now = time.time()
+        with self._lock:
+            if now - self._period_start >= self.period:
+                self._period_start = now
+                self._period_records = 0
+            if self._period_records >= self.max_records:
+                self._suppressed += 1
+                return None
+            self._period_records += 1
+            suppressed, self._suppressed = self._suppressed, 0
+        record = {
+            "fingerprint": SQLUtils.get_fingerprint(sql),
+            "sql": SQLUtils.normalize_sql(sql),
+            "parameters": self.format_parameters(params),
+            "parameter_count": len(params),
+            "seconds": seconds,
+            "rows": rows,
+            "call_site": self.get_call_site(),
+            "plan": self._explain(executor, statement, sql, params)
+            if self.explain else None,
+            "time": now,
+            "suppressed": suppressed,
+        }
+        self.emit(record)
+        return record
+
+    def emit(self, record):
+        """
+        Write a record of a slow query.
+
+        :param record: Record of the slow query.
+        :type record: dict
+        """
+        self._logger.warning(
+            "Slow query %s: %.3f seconds, %d rows, at %s", record["sql"],
+            record["seconds"], record["rows"], record["call_site"],
+            extra={"slow_query": record})
+
+    def format_parameters(self, params):
+        """
+        Format the parameters of a query to be recorded.
+
+        :param params: Parameters of the query.
+        :type params: list or dict
+        :return: List or dict of formatted parameters, or `None` if
+            parameters are not recorded.
+        :rtype: list or dict
+        """
+        if self.parameters == self.NONE:
+            return None
+        if isinstance(params, dict):
+            names = sorted(params)[:self.max_parameters]
+            return dict([(name, self._format_value(params[name]))
+                         for name in names])
+        return [self._format_value(value)
+                for value in params[:self.max_parameters]]
+
+    def _format_value(self, value):
+        if value is None or isinstance(value, (bool, int, long, float)):
+            if self.parameters == self.FULL:
+                return value
+            return None if value is None else "<%s>" % type(value).__name__
+        if self.parameters == self.FULL and \
+                isinstance(value, basestring):
+            return value[:self.MAX_VALUE_LENGTH]
+        try:
+            return "<%s:%d>" % (type(value).__name__, len(value))
+        except TypeError:
+            return "<%s>" % type(value).__name__
+
+    @staticmethod
+    def get_call_site():
+        """
+        Get the first caller outside of PyDBC in the current stack.
+
+        :return: Call site as `file:line in function`, or `None` if not found.
+        :rtype: str
+        """
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if not filename.startswith(_PACKAGE_DIR + os.sep):
+                return "%s:%d in %s" % (
+                    filename, frame.f_lineno, frame.f_code.co_name)
+            frame = frame.f_back
+        return None
+
+    @staticmethod
+    def _explain(executor, statement, sql, params):
+        if statement is not None:
+            # Prepared statements are executed with other placeholders
+            sql, params = executor.compile(statement)
+        try:
+            return executor.get_dialect().explain(
+                executor.get_connection(), sql, params)
+        except Exception:
+            # Plans are best effort, like statements not supported by EXPLAIN
+            return None
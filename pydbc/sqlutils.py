@@ -14,8 +14,21 @@
 
 __author__ = "huhamhire <me@huhamhire.com>"
 
+import hashlib
+import re
+
 from .constants import (
-    CompareTypes, RelationTypes, AggregateFunctions, JoinTypes)
+    SQLTypes, CompareTypes, RelationTypes, AggregateFunctions, JoinTypes,
+    ValueTypes)
+
+
+# Literals and bind parameters of all paramstyles
+_SQL_VALUE = re.compile(
+    r"'(?:[^']|'')*'|(?<![\w$.\"])\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b|"
+    r"\?|%s|%\(\w+\)s|(?<!:):\w+|\$\d+")
+_SQL_VALUE_LIST = re.compile(
+    r"\(\s*(?:\?|NULL)(?:\s*,\s*(?:\?|NULL))*\s*\)", re.IGNORECASE)
+_SQL_ROW_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
 
 
 class SQLUtils(object):
@@ -119,3 +132,43 @@ class SQLUtils(object):
         else:
             function = None
         return function
+
+    @staticmethod
+    def get_value_type(sql_type):
+        if sql_type == SQLTypes.BIT:
+            return ValueTypes.BOOLEAN
+        elif sql_type in (SQLTypes.SMALLINT, SQLTypes.INTEGER):
+            return ValueTypes.INTEGER
+        elif sql_type == SQLTypes.BIGINT:
+            return ValueTypes.LONG
+        elif sql_type == SQLTypes.REAL:
+            return ValueTypes.FLOAT
+        elif sql_type in (SQLTypes.NUMERIC, SQLTypes.DECIMAL):
+            return ValueTypes.DECIMAL
+        elif sql_type in (SQLTypes.CHAR, SQLTypes.VARCHAR,
+                          SQLTypes.LONG_VARCHAR, SQLTypes.CLOB):
+            return ValueTypes.STRING
+        elif sql_type in (SQLTypes.BINARY, SQLTypes.VARBINARY,
+                          SQLTypes.LONG_VARBINARY, SQLTypes.BLOB):
+            return ValueTypes.BINARY
+        elif sql_type == SQLTypes.DATE:
+            return ValueTypes.DATE
+        elif sql_type == SQLTypes.TIMESTAMP:
+            return ValueTypes.DATETIME
+        else:
+            return ValueTypes.OTHER
+
+    @staticmethod
+    def normalize_sql(sql):
+        # Replace values by "?" and lists of values by "(?)", so that
+        # statements only differing in values or list lengths are the same
+        sql = _SQL_VALUE.sub("?", " ".join(sql.split()))
+        sql = _SQL_VALUE_LIST.sub("(?)", sql)
+        return _SQL_ROW_LIST.sub("(?)", sql)
+
+    @staticmethod
+    def get_fingerprint(sql):
+        normalized = SQLUtils.normalize_sql(sql)
+        if isinstance(normalized, unicode):
+            normalized = normalized.encode("utf-8")
+        return hashlib.md5(normalized).hexdigest()[:16]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Prepared Statement Cache
+========================
+StatementCache
+--------------
+.. autoclass:: pydbc.statement_cache.StatementCache
+    :members:
+"""
+
+from collections import OrderedDict
+
+
+class StatementCache(object):
+    """
+    Least recently used cache of the prepared statements of a connection,
+    keyed by SQL statement.
+
+    Statements are prepared by :meth:`Dialect.prepare` on the first use, and
+    removed from the server by :meth:`Dialect.deallocate` when they are
+    evicted from the cache.
+
+    :ivar Dialect _dialect: SQL dialect of the database.
+    :ivar object _connection: DB-API 2.0 connection of the statements.
+    :ivar int _size: Maximum number of prepared statements.
+    :ivar OrderedDict _statements: Names of the prepared statements by SQL
+        statement, from the least recently used one.
+    """
+    DEFAULT_SIZE = 100
+
+    _name_prefix = "pydbc_"
+
+    def __init__(self, dialect, connection, size=DEFAULT_SIZE):
+        """
+        Initialize a `StatementCache` object.
+
+        :param dialect: SQL dialect of the database.
+        :type dialect: Dialect
+        :param connection: DB-API 2.0 connection of the statements.
+        :type connection: object
+        :param size: Maximum number of prepared statements.
+        :type size: int
+        """
+        self._dialect = dialect
+        self._connection = connection
+        self._size = size
+        self._statements = OrderedDict()
+        self._counter = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._statements)
+
+    def get(self, sql):
+        """
+        Get the prepared statement of a SQL statement, preparing it if it is
+        not cached.
+
+        :param sql: SQL statement with placeholders in
+            :attr:`Dialect.prepared_paramstyle`.
+        :type sql: str
+        :return: Name of the prepared statement.
+        :rtype: str
+        """
+        name = self._statements.pop(sql, None)
+        if name is not None:
+            self._hits += 1
+            self._statements[sql] = name
+            return name
+        self._misses += 1
+        while self._statements and len(self._statements) >= self._size:
+            _, evicted = self._statements.popitem(last=False)
+            self._evictions += 1
+            self._deallocate(evicted)
+        self._counter += 1
+        name = "%s%d" % (self._name_prefix, self._counter)
+        cursor = self._connection.cursor()
+        try:
+            self._dialect.prepare(cursor, name, sql)
+        finally:
+            cursor.close()
+        self._statements[sql] = name
+        return name
+
+    def clear(self, deallocate=True):
+        """
+        Remove all prepared statements from the cache.
+
+        :param deallocate: A boolean indicating whether to remove the
+            statements from the server. Statements should not be deallocated
+            if the connection was reset.
+        :type deallocate: bool
+        """
+        statements = self._statements
+        self._statements = OrderedDict()
+        if deallocate:
+            for name in statements.values():
+                self._deallocate(name)
+
+    def get_statistics(self):
+        """
+        Get statistics of the cache.
+
+        :return: Dict of number of `hits`, `misses` and `evictions`, and the
+            current `size` of the cache.
+        :rtype: dict
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._statements),
+        }
+
+    def _deallocate(self, name):
+        cursor = self._connection.cursor()
+        try:
+            self._dialect.deallocate(cursor, name)
+        finally:
+            cursor.close()
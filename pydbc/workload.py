@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+__doc__ = """
+Workload Recording and Replay
+=============================
+WorkloadRecorder
+----------------
+.. autoclass:: pydbc.workload.WorkloadRecorder
+    :members:
+
+WorkloadReplayer
+----------------
+.. autoclass:: pydbc.workload.WorkloadReplayer
+    :members:
+
+File format
+-----------
+A workload file holds one JSON object per line, compressed by gzip if the
+name ends with `.gz`. Each object has the offset `t` in seconds since the
+recording started, and either the statement tree `s`, serialized by
+:class:`~.serializer.Serializer` and encoded by Base64, or the SQL statement
+`q` and its parameters `p`, for statements which could not be serialized
+and SQL statements built by batches and write buffers. SQL statements
+executed by `executemany` are marked by `m`, with a list of parameter sets
+in `p`. Parameters of types not supported by JSON are tagged, like
+`{"$b": ...}` for binary strings.
+"""
+
+import base64
+import datetime
+import decimal
+import gzip
+import json
+import math
+import Queue
+import threading
+import time
+
+from .executor import Executor
+from .serializer import Serializer, SerializationError
+from .sqlutils import SQLUtils
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class WorkloadRecorder(object):
+    """
+    Record the statements executed by executors into a workload file, to be
+    replayed by :class:`WorkloadReplayer`.
+
+    Statements are recorded by passing the object to executors::
+
+        with WorkloadRecorder("workload.jsonl.gz") as recorder:
+            executor = Executor(connection, dialect, recorder=recorder)
+            ...
+
+    Statement trees are recorded where possible, so that they are compiled
+    by the dialect of the replay target.
+    """
+
+    def __init__(self, target):
+        """
+        Initialize a `WorkloadRecorder` object.
+
+        :param target: Path of the workload file, or a writable file-like
+            object.
+        :type target: str or file
+        """
+        if isinstance(target, basestring):
+            self._file = _open(target, "wb")
+            self._close_file = True
+        else:
+            self._file = target
+            self._close_file = False
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, executor, statement, compiled=None):
+        """
+        Record a statement to be executed.
+
+        :param executor: Executor of the statement.
+        :type executor: Executor
+        :param statement: Statement to be executed.
+        :type statement: DMLBase
+        :param compiled: SQL statement and parameters of the statement
+            compiled by the executor with the placeholders of the dialect,
+            recorded if the statement could not be serialized. The statement
+            is compiled again if it is `None`, which consumes the streams of
+            large objects in it.
+        :type compiled: tuple
+        """
+        try:
+            data = Serializer.dumps(statement)
+        except SerializationError:
+            if compiled is None:
+                compiled = executor.compile(statement)
+            self.record_sql(*compiled)
+            return
+        self._write({"t": self._get_offset(), "s": base64.b64encode(data)})
+
+    def record_sql(self, sql, params, many=False):
+        """
+        Record a SQL statement to be executed, which is built by the caller
+        or could not be serialized.
+
+        :param sql: SQL statement with placeholders of the recording dialect.
+        :type sql: str
+        :param params: Parameters of the statement, or a list of parameter
+            sets if `many` is `True`.
+        :type params: list or dict
+        :param many: A boolean indicating whether the statement is executed
+            once for each parameter set by `executemany`.
+        :type many: bool
+        """
+        entry = {"t": self._get_offset(), "q": sql}
+        if many:
+            entry["m"] = 1
+            entry["p"] = [self.encode_params(item) for item in params]
+        else:
+            entry["p"] = self.encode_params(params)
+        self._write(entry)
+
+    def _get_offset(self):
+        return round(time.time() - self._start, 6)
+
+    def _write(self, entry):
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._count += 1
+
+    def get_count(self):
+        """
+        Get the number of statements recorded.
+
+        :return: Number of statements.
+        :rtype: int
+        """
+        return self._count
+
+    def close(self):
+        """
+        Close the workload file, or flush it if it is not opened by the
+        recorder.
+        """
+        with self._lock:
+            if self._close_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+    @classmethod
+    def encode_params(cls, params):
+        """
+        Encode bind parameters into values supported by JSON.
+
+        :param params: Parameters of a statement.
+        :type params: list or dict
+        :return: Encoded parameters.
+        :rtype: list or dict
+        """
+        if isinstance(params, dict):
+            return dict([(name, cls._encode_value(value))
+                         for name, value in params.items()])
+        return [cls._encode_value(value) for value in params]
+
+    @staticmethod
+    def _encode_value(value):
+        if value is None or isinstance(value, (bool, int, long, float,
+                                               unicode)):
+            return value
+        if isinstance(value, str):
+            try:
+                return value.decode("utf-8")
+            except UnicodeDecodeError:
+                return {"$b": base64.b64encode(value)}
+        if isinstance(value, (buffer, bytearray, memoryview)):
+            return {"$b": base64.b64encode(bytes(value))}
+        if isinstance(value, decimal.Decimal):
+            return {"$d": str(value)}
+        if isinstance(value, datetime.datetime):
+            return {"$t": value.strftime("%Y-%m-%dT%H:%M:%S.%f")}
+        if isinstance(value, datetime.date):
+            return {"$D": value.isoformat()}
+        return unicode(value)
+
+    @classmethod
+    def decode_params(cls, params):
+        """
+        Decode bind parameters encoded by :meth:`encode_params`.
+
+        :param params: Encoded parameters.
+        :type params: list or dict
+        :return: Parameters of a statement.
+        :rtype: list or dict
+        """
+        if isinstance(params, dict):
+            return dict([(name, cls._decode_value(value))
+                         for name, value in params.items()])
+        return [cls._decode_value(value) for value in params]
+
+    @staticmethod
+    def _decode_value(value):
+        if not isinstance(value, dict):
+            return value
+        tag, data = value.items()[0]
+        if tag == "$b":
+            return buffer(base64.b64decode(data))
+        if tag == "$d":
+            return decimal.Decimal(data)
+        if tag == "$t":
+            return datetime.datetime.strptime(data, "%Y-%m-%dT%H:%M:%S.%f")
+        return datetime.datetime.strptime(data, "%Y-%m-%d").date()
+
+    @classmethod
+    def read(cls, source):
+        """
+        Read the statements of a workload file.
+
+        :param source: Path of the workload file, or a file-like object.
+        :type source: str or file
+        :return: Iterator of tuples of offset in seconds, and the statement
+            tree or a tuple of SQL statement and parameters. Statements
+            executed by `executemany` are tuples of SQL statement, list of
+            parameter sets and `True`.
+        :rtype: iterator
+        """
+        workload_file = _open(source, "rb") \
+            if isinstance(source, basestring) else source
+        try:
+            for line in workload_file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "s" in entry:
+                    statement = Serializer.loads(base64.b64decode(entry["s"]))
+                elif entry.get("m"):
+                    statement = (entry["q"], [cls.decode_params(item)
+                                              for item in entry["p"]], True)
+                else:
+                    statement = (entry["q"], cls.decode_params(entry["p"]))
+                yield entry["t"], statement
+        finally:
+            if workload_file is not source:
+                workload_file.close()
+
+
+class WorkloadReplayer(object):
+    """
+    Replay a recorded workload against a database, and report throughput,
+    latency and errors by statement fingerprint.
+
+    Each worker thread replays statements on its own connection. Statements
+    are started at their recorded offsets divided by `speed`, or as fast as
+    possible if `speed` is `0`. Statement trees are compiled by the dialect
+    given, while recorded SQL statements are executed as is, so they have to
+    use the parameter style of the target driver.
+
+    Failed statements are rolled back and counted as errors. If a worker
+    could not connect, all statements it takes are counted as errors.
+
+    :ivar float speed: Speed of the replay relative to the recording.
+    :ivar int concurrency: Number of worker threads.
+    """
+
+    def __init__(self, connect, dialect=None, speed=1.0, concurrency=1,
+                 commit=True):
+        """
+        Initialize a `WorkloadReplayer` object.
+
+        :param connect: Function creating a DB-API 2.0 connection to the
+            target database, called once by each worker thread.
+        :type connect: callable
+        :param dialect: SQL dialect of the target database.
+        :type dialect: Dialect
+        :param speed: Speed of the replay relative to the recording, or `0`
+            to replay as fast as possible.
+        :type speed: float
+        :param concurrency: Number of worker threads.
+        :type concurrency: int
+        :param commit: Whether statements without results are committed.
+        :type commit: bool
+        """
+        self._connect = connect
+        self._dialect = dialect
+        self.speed = speed
+        self.concurrency = concurrency
+        self._commit = commit
+
+    def replay(self, source):
+        """
+        Replay a workload.
+
+        :param source: Path of the workload file, a file-like object, or an
+            iterable of entries as returned by :meth:`WorkloadRecorder.read`.
+        :type source: str or file or iterable
+        :return: Dict of number of `statements` and `errors`, `seconds`
+            spent, `statements_per_second`, and `fingerprints`, a dict of
+            dicts by fingerprint of normalized `sql`, `count`, `errors`, and
+            latency percentiles `p50`, `p95`, `p99` and `max` in seconds.
+        :rtype: dict
+        """
+        if isinstance(source, basestring) or hasattr(source, "read"):
+            source = WorkloadRecorder.read(source)
+        tasks = Queue.Queue()
+        results = []
+        lock = threading.Lock()
+        workers = [threading.Thread(target=self._work,
+                                    args=(tasks, results, lock))
+                   for i in range(self.concurrency)]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        start = time.time()
+        try:
+            for offset, statement in source:
+                if self.speed > 0:
+                    delay = start + offset / self.speed - time.time()
+                    if delay > 0:
+                        time.sleep(delay)
+                tasks.put(statement)
+        finally:
+            for worker in workers:
+                tasks.put(None)
+            for worker in workers:
+                worker.join()
+        return self._report(results, time.time() - start)
+
+    def _work(self, tasks, results, lock):
+        samples = []
+        try:
+            connection = self._connect()
+        except Exception:
+            # Keep taking statements, so that they are counted as errors
+            # instead of being left in the queue
+            connection = None
+        executor = Executor(connection, self._dialect)
+        try:
+            while True:
+                statement = tasks.get()
+                if statement is None:
+                    break
+                if connection is None:
+                    samples.append(
+                        (self._get_sql(executor, statement), 0.0, True))
+                else:
+                    samples.append(self._execute(executor, statement))
+        finally:
+            if connection is not None:
+                connection.close()
+            with lock:
+                results.extend(samples)
+
+    @staticmethod
+    def _get_sql(executor, statement):
+        if isinstance(statement, tuple):
+            return statement[0]
+        try:
+            return executor.compile(statement)[0]
+        except Exception:
+            # Group statements which could not be compiled by their type
+            return type(statement).__name__
+
+    def _execute(self, executor, statement):
+        sql = self._get_sql(executor, statement)
+        connection = executor.get_connection()
+        start = time.time()
+        cursor = None
+        error = False
+        try:
+            if isinstance(statement, tuple):
+                cursor = executor.execute_sql(*statement)
+            else:
+                cursor = executor.execute(statement)
+            if cursor.description is not None:
+                cursor.fetchall()
+            elif self._commit:
+                connection.commit()
+        except Exception:
+            error = True
+            try:
+                # Failed statements abort the transaction on some databases,
+                # like PostgreSQL, which would fail the following statements
+                connection.rollback()
+            except Exception:
+                pass
+        finally:
+            if cursor is not None:
+                cursor.close()
+        return sql, time.time() - start, error
+
+    @staticmethod
+    def _percentile(durations, percent):
+        # Nearest-rank percentile of sorted durations
+        index = int(math.ceil(percent / 100.0 * len(durations))) - 1
+        return durations[max(index, 0)]
+
+    def _report(self, results, seconds):
+        groups = {}
+        for sql, duration, error in results:
+            group = groups.setdefault(SQLUtils.get_fingerprint(sql),
+                                      [sql, [], 0])
+            group[1].append(duration)
+            group[2] += error
+        fingerprints = {}
+        for fingerprint, (sql, durations, errors) in groups.items():
+            durations.sort()
+            fingerprints[fingerprint] = {
+                "sql": SQLUtils.normalize_sql(sql),
+                "count": len(durations),
+                "errors": errors,
+                "p50": self._percentile(durations, 50),
+                "p95": self._percentile(durations, 95),
+                "p99": self._percentile(durations, 99),
+                "max": durations[-1],
+            }
+        return {
+            "statements": len(results),
+            "errors": sum([item["errors"]
+                           for item in fingerprints.values()]),
+            "seconds": seconds,
+            "statements_per_second": len(results) / seconds
+            if seconds > 0 else 0.0,
+            "fingerprints": fingerprints,
+        }
@@ -17,7 +17,17 @@ setup(
     keywords="database SQL DDL DML management",
     url="https://github.com/huhamhire/PyDBC",
     packages=["pydbc",
-              'pydbc.dialect'],
+              'pydbc.dialect',
+              'pydbc.optimizer'],
+    extras_require={
+        "numpy": ["numpy"],
+    },
+    entry_points={
+        "pydbc.dialects": [
+            "generic = pydbc.dialect.base_dialect:Dialect",
+            "sqlite = pydbc.dialect.sqlite_dialect:SQLiteDialect",
+        ],
+    },
     long_description=read('README.rst'),
     classifiers=[
         "Development Status :: 1 - Planning",
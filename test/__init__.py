@@ -14,8 +14,42 @@
 
 __author__ = "huhamhire <me@huhamhire.com>"
 
-__all__ = ["run_tests", "base_test_suite", "dml_test_suite"]
+__all__ = ["run_tests", "base_test_suite", "dml_test_suite",
+           "optimizer_test_suite", "serializer_test_suite",
+           "parser_test_suite", "dialect_test_suite",
+           "executor_test_suite", "lob_test_suite",
+           "ddl_test_suite", "reflection_test_suite", "batch_test_suite",
+           "loader_test_suite", "buffer_test_suite",
+           "statement_cache_test_suite", "columnar_test_suite",
+           "row_test_suite", "export_test_suite",
+           "single_flight_test_suite", "metrics_test_suite",
+           "slow_query_test_suite", "workload_test_suite",
+           "render_test_suite", "literal_test_suite",
+           "update_test_suite", "fileutils_test_suite"]
 
 from .run_tests import run_tests
 from .base_test import base_test_suite
 from .dml_test import dml_test_suite
+from .optimizer_test import optimizer_test_suite
+from .serializer_test import serializer_test_suite
+from .parser_test import parser_test_suite
+from .dialect_test import dialect_test_suite
+from .executor_test import executor_test_suite
+from .lob_test import lob_test_suite
+from .ddl_test import ddl_test_suite
+from .reflection_test import reflection_test_suite
+from .batch_test import batch_test_suite
+from .loader_test import loader_test_suite
+from .buffer_test import buffer_test_suite
+from .statement_cache_test import statement_cache_test_suite
+from .columnar_test import columnar_test_suite
+from .row_test import row_test_suite
+from .export_test import export_test_suite
+from .single_flight_test import single_flight_test_suite
+from .metrics_test import metrics_test_suite
+from .slow_query_test import slow_query_test_suite
+from .workload_test import workload_test_suite
+from .render_test import render_test_suite
+from .literal_test import literal_test_suite
+from .update_test import update_test_suite
+from .fileutils_test import fileutils_test_suite
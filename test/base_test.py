@@ -18,7 +18,8 @@ import unittest
 
 from pydbc import SQLUtils
 from pydbc import (
-    CompareTypes, RelationTypes, AggregateFunctions, JoinTypes)
+    SQLTypes, CompareTypes, RelationTypes, AggregateFunctions, JoinTypes,
+    ValueTypes)
 
 
 class SQLUtilityTest(unittest.TestCase):
@@ -181,6 +182,21 @@ class SQLUtilityTest(unittest.TestCase):
         # FROM
         self.assertEqual(SQLUtils.get_sql_from_keyword(), " FROM ")
 
+    def test_value_type(self):
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.VARCHAR),
+                         ValueTypes.STRING)
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.BLOB),
+                         ValueTypes.BINARY)
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.VARBINARY),
+                         ValueTypes.BINARY)
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.DECIMAL),
+                         ValueTypes.DECIMAL)
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.BIT),
+                         ValueTypes.BOOLEAN)
+        self.assertEqual(SQLUtils.get_value_type(SQLTypes.TIMESTAMP),
+                         ValueTypes.DATETIME)
+        self.assertEqual(SQLUtils.get_value_type(-100), ValueTypes.OTHER)
+
 
 def base_test_suite():
     util_test = unittest.makeSuite(SQLUtilityTest, "test")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import unittest
+
+from pydbc.batch import StatementBatch
+from pydbc.dml import Insert, OrderBy
+from pydbc.dialect import SQLiteDialect
+from pydbc import Executor
+from pydbc import ValueTypes
+from test.fixtures import create_select
+
+
+class MultiResultDialect(SQLiteDialect):
+    multi_statements = True
+
+
+class CountingDialect(SQLiteDialect):
+    bound = 0
+
+    def bind_value(self, value, value_type):
+        self.bound += 1
+        return super(CountingDialect, self).bind_value(value, value_type)
+
+
+class MultiResultCursor(object):
+    """
+    Cursor returning one result set per statement, like drivers supporting
+    multiple statements in one call.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.results = []
+        self.description = None
+
+    def execute(self, sql, params):
+        self.connection.calls += 1
+        params = list(params)
+        for statement in sql.split("; "):
+            count = statement.count("?")
+            cursor = self.connection.connection.execute(
+                statement, params[:count])
+            del params[:count]
+            self.results.append((cursor.description, cursor.fetchall()))
+        self.description = self.results[0][0]
+
+    def fetchall(self):
+        return self.results[0][1]
+
+    def nextset(self):
+        self.results.pop(0)
+        self.description = self.results[0][0]
+        return True
+
+    def close(self):
+        pass
+
+
+class CountingConnection(object):
+    def __init__(self, connection, cursor_class=None):
+        self.connection = connection
+        self.cursor_class = cursor_class
+        self.calls = 0
+
+    def cursor(self):
+        if self.cursor_class is not None:
+            return self.cursor_class(self)
+        self.calls += 1
+        return self.connection.cursor()
+
+
+class StatementBatchTest(unittest.TestCase):
+    """
+    Unittest for executing statements in batches.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, name TEXT, data BLOB)")
+        self.connection.execute(
+            "CREATE TABLE bar (id INTEGER, foo_id INTEGER)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?, ?)",
+            [(i, "name%d" % i, buffer("data%d" % i)) for i in range(10)])
+        self.connection.executemany(
+            "INSERT INTO bar VALUES (?, ?)", [(i, i % 3) for i in range(10)])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, table_name, columns, where_column=None,
+                      value=None):
+        criteria = None
+        if where_column is not None:
+            criteria = [(where_column, value, None, ValueTypes.INTEGER)]
+        return create_select(columns, table_name, criteria)
+
+    def test_union(self):
+        counting = CountingConnection(self.connection)
+        batch = StatementBatch(Executor(counting, SQLiteDialect()))
+        batch.add(self.create_select("foo", ["id", "name"], "id", 1))
+        batch.add(self.create_select("bar", ["id"], "foo_id", 2))
+        batch.add(self.create_select("foo", ["name"], "id", 100))
+        batch.add(self.create_select("foo", ["data"], "id", 3))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 1)
+        self.assertEqual(results[0], [(1, "name1")])
+        self.assertEqual(sorted(results[1]), [(2, ), (5, ), (8, )])
+        self.assertEqual(results[2], [])
+        self.assertEqual(results[3], [(buffer("data3"), )])
+        self.assertEqual(batch.get_statements(), [])
+
+    def test_incompatible(self):
+        counting = CountingConnection(self.connection)
+        batch = StatementBatch(Executor(counting, SQLiteDialect()))
+        ordered = self.create_select("foo", ["id"])
+        order_by = OrderBy()
+        order_by.add_column("id", asc=False)
+        ordered.set_order_by(order_by)
+        batch.add(ordered)
+        batch.add(self.create_select("foo", ["*"], "id", 2))
+        insert = Insert()
+        insert.set_table("bar")
+        insert.add_column("id", ValueTypes.INTEGER)
+        insert.add_row([10])
+        batch.add(insert)
+        results = batch.execute()
+        self.assertEqual(counting.calls, 3)
+        self.assertEqual(results[0], [(i, ) for i in range(9, -1, -1)])
+        self.assertEqual(results[1], [(2, "name2", buffer("data2"))])
+        self.assertEqual(results[2], None)
+
+    def test_union_limits(self):
+        counting = CountingConnection(self.connection)
+        dialect = SQLiteDialect()
+        dialect.max_union_selects = 2
+        batch = StatementBatch(Executor(counting, dialect))
+        for i in range(5):
+            batch.add(self.create_select("foo", ["name"], "id", i))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 3)
+        self.assertEqual(results, [[("name%d" % i, )] for i in range(5)])
+
+    def test_union_parameters(self):
+        counting = CountingConnection(self.connection)
+        dialect = CountingDialect()
+        dialect.max_parameters = 2
+        dialect.paramstyle = "numeric"
+        batch = StatementBatch(Executor(counting, dialect))
+        for i in range(4):
+            batch.add(self.create_select("foo", ["name"], "id", i))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 2)
+        self.assertEqual(results, [[("name%d" % i, )] for i in range(4)])
+        # Selects are rendered once, but again if they start a new union
+        self.assertEqual(dialect.bound, 5)
+
+    def test_duplicate_names(self):
+        counting = CountingConnection(self.connection)
+        batch = StatementBatch(Executor(counting, SQLiteDialect()))
+        for i in range(2):
+            batch.add(self.create_select("foo", ["id", "ID"], "id", i))
+        batch.add(self.create_select(
+            "foo", ["id", ("id", None, None, "key")], "id", 2))
+        batch.add(self.create_select(
+            "foo", ["id", ("id", None, None, "key")], "id", 3))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 3)
+        self.assertEqual(results, [[(i, i)] for i in range(4)])
+
+    def test_union_typed(self):
+        counting = CountingConnection(self.connection)
+        dialect = SQLiteDialect()
+        dialect.dynamic_union_types = False
+        batch = StatementBatch(Executor(counting, dialect))
+        batch.add(self.create_select("foo", ["name"], "id", 1))
+        batch.add(self.create_select("foo", ["name"], "id", 2))
+        batch.add(self.create_select("foo", ["id"], "id", 3))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 2)
+        self.assertEqual(results, [[("name1", )], [("name2", )], [(3, )]])
+
+    def test_multiple_statements(self):
+        counting = CountingConnection(self.connection, MultiResultCursor)
+        batch = StatementBatch(Executor(counting, MultiResultDialect()))
+        batch.add(self.create_select("foo", ["name"], "id", 1))
+        batch.add(self.create_select("bar", ["*"], "id", 2))
+        results = batch.execute()
+        self.assertEqual(counting.calls, 1)
+        self.assertEqual(results, [[("name1", )], [(2, 2)]])
+        self.assertEqual(batch.execute(), [])
+
+
+def batch_test_suite():
+    batch_test = unittest.makeSuite(StatementBatchTest, "test")
+    return unittest.TestSuite((batch_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(batch_test_suite())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import time
+import unittest
+
+from pydbc.buffer import WriteBuffer, BufferFullError, BufferClosedError
+from pydbc.dml import Insert, UnsupportedValueError
+from pydbc.dialect import SQLiteDialect
+from pydbc import Executor
+from pydbc import ValueTypes
+
+
+class FlakyConnection(object):
+    """
+    Connection failing to execute statements while it is down.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.down = False
+        self.fail_at = None
+        self.writes = 0
+
+    def cursor(self):
+        if self.down or self.writes == self.fail_at:
+            self.fail_at = None
+            raise sqlite3.OperationalError("connection is down")
+        self.writes += 1
+        return self.connection.cursor()
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.connection.rollback()
+
+
+class WriteBufferTest(unittest.TestCase):
+    """
+    Unittest for buffering records to be inserted.
+    """
+    columns = (("id", ValueTypes.INTEGER), ("name", ValueTypes.STRING))
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE foo (id INTEGER, name TEXT)")
+        self.flaky = FlakyConnection(self.connection)
+        self.executor = Executor(self.flaky, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def count(self):
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM foo").fetchone()[0]
+
+    def test_max_rows(self):
+        writer = WriteBuffer(self.executor, max_rows=10, max_latency=None)
+        for i in range(25):
+            writer.insert("foo", self.columns, (i, "name%d" % i))
+        self.assertEqual(self.count(), 20)
+        self.assertEqual(self.flaky.writes, 2)
+        self.assertEqual(writer.get_row_count(), 5)
+        writer.close()
+        self.assertEqual(self.count(), 25)
+        self.assertRaises(BufferClosedError, writer.insert, "foo",
+                          self.columns, (1, "a"))
+        self.assertRaises(UnsupportedValueError, WriteBuffer(
+            self.executor).insert, "foo", self.columns, (1, ))
+
+    def test_max_bytes(self):
+        writer = WriteBuffer(self.executor, max_bytes=100, max_latency=None)
+        writer.insert("foo", self.columns, (1, "x" * 50))
+        self.assertEqual(self.count(), 0)
+        writer.insert("foo", self.columns, (2, "x" * 50))
+        self.assertEqual(self.count(), 2)
+
+    def test_max_latency(self):
+        writer = WriteBuffer(self.executor, max_latency=0.01)
+        writer.insert("foo", self.columns, (1, "a"))
+        writer.poll()
+        self.assertEqual(self.count(), 0)
+        time.sleep(0.02)
+        writer.poll()
+        self.assertEqual(self.count(), 1)
+
+    def test_statements(self):
+        with WriteBuffer(self.executor, executemany=False) as writer:
+            for i in range(600):
+                writer.insert("foo", self.columns, (i, None))
+            insert = Insert()
+            insert.set_table("foo")
+            insert.add_column("id", ValueTypes.INTEGER)
+            insert.add_row([600])
+            writer.add(insert)
+        self.assertEqual(self.count(), 601)
+        # Statements are limited by the parameters accepted by SQLite, and
+        # records of different columns are written separately
+        self.assertEqual(self.flaky.writes, 4)
+
+    def test_retry(self):
+        writer = WriteBuffer(self.executor, max_rows=5, capacity=10,
+                             max_latency=None, commit=True)
+        self.flaky.down = True
+        for i in range(4):
+            writer.insert("foo", self.columns, (i, "a"))
+        self.assertRaises(sqlite3.OperationalError, writer.insert, "foo",
+                          self.columns, (4, "a"))
+        for i in range(5, 10):
+            try:
+                writer.insert("foo", self.columns, (i, "a"))
+            except sqlite3.OperationalError:
+                pass
+        self.assertEqual(writer.get_row_count(), 10)
+        self.assertRaises(sqlite3.OperationalError, writer.insert, "foo",
+                          self.columns, (10, "a"))
+        self.flaky.down = False
+        writer.close()
+        self.assertEqual(self.count(), 10)
+        self.assertEqual(writer.get_row_count(), 0)
+
+    def test_retry_chunks(self):
+        writer = WriteBuffer(self.executor, max_rows=1000, max_latency=None,
+                             executemany=False, commit=True)
+        for i in range(600):
+            writer.insert("foo", self.columns, (i, "a"))
+        # The second chunk fails after the first one has been executed
+        self.flaky.fail_at = 1
+        self.assertRaises(sqlite3.OperationalError, writer.flush)
+        self.assertEqual(self.count(), 0)
+        self.assertEqual(writer.get_row_count(), 600)
+        writer.close()
+        self.assertEqual(self.count(), 600)
+        self.assertEqual(writer.get_row_count(), 0)
+
+    def test_full(self):
+        writer = WriteBuffer(self.executor, max_rows=5, capacity=5,
+                             max_latency=None)
+        self.flaky.down = True
+        for i in range(4):
+            writer.insert("foo", self.columns, (i, "a"))
+        self.assertRaises(sqlite3.OperationalError, writer.insert, "foo",
+                          self.columns, (4, "a"))
+        writer.flush = lambda: None
+        self.assertRaises(BufferFullError, writer.insert, "foo",
+                          self.columns, (5, "a"))
+
+
+def buffer_test_suite():
+    buffer_test = unittest.makeSuite(WriteBufferTest, "test")
+    return unittest.TestSuite((buffer_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(buffer_test_suite())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import array
+import sqlite3
+import unittest
+
+from pydbc.columnar import ColumnarFetcher, _import_numpy, _INT64_CODE
+from pydbc.dml import JoinedTables, Select
+from pydbc.dialect import SQLiteDialect
+from pydbc.reflection import Reflector
+from pydbc import Executor
+from pydbc import SQLTypes
+
+numpy = _import_numpy()
+
+
+class ColumnarFetcherTest(unittest.TestCase):
+    """
+    Unittest for fetching records by column.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, price REAL, flag BIT, name TEXT)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?, ?, ?)",
+            [(i, i * 0.5 if i != 5 else None, i % 2, "name%d" % i)
+             for i in range(10)])
+        self.executor = Executor(self.connection, SQLiteDialect())
+        self.select = Select()
+        tables = JoinedTables()
+        tables.add_table("foo")
+        self.select.set_tables(tables)
+        self.select.add_column("*")
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_arrays(self):
+        fetcher = ColumnarFetcher(self.executor, batch_size=3,
+                                  use_numpy=False)
+        result = fetcher.fetch(self.select, {
+            "id": SQLTypes.INTEGER, "price": SQLTypes.REAL,
+            "flag": SQLTypes.BIT})
+        self.assertEqual(result.names, ["id", "price", "flag", "name"])
+        self.assertEqual(list(result["id"]), range(10))
+        if _INT64_CODE is not None:
+            self.assertEqual(result["id"].itemsize, 8)
+        self.assertEqual(result["flag"].typecode, "b")
+        self.assertEqual(result["price"][4:7], array.array("d", [2, 0, 3]))
+        self.assertEqual(result.masks.keys(), ["price"])
+        self.assertEqual(list(result.masks["price"]),
+                         [0, 0, 0, 0, 0, 1, 0, 0, 0, 0])
+        self.assertEqual(result["name"][:2], ["name0", "name1"])
+
+    def test_reflected_types(self):
+        table = Reflector(self.executor).get_table("foo")
+        fetcher = ColumnarFetcher(self.executor, use_numpy=False)
+        result = fetcher.fetch(self.select, table)
+        self.assertEqual(result["id"].typecode, _INT64_CODE)
+        self.assertEqual(result["price"].typecode, "d")
+        self.assertTrue(isinstance(result["name"], list))
+        result = fetcher.fetch(self.select)
+        self.assertEqual(result["id"], range(10))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        fetcher = ColumnarFetcher(self.executor, batch_size=4,
+                                  use_numpy=True)
+        result = fetcher.fetch(self.select, {
+            "id": SQLTypes.INTEGER, "price": SQLTypes.REAL,
+            "flag": SQLTypes.BIT})
+        self.assertEqual(result["id"].sum(), 45)
+        self.assertEqual(result["flag"].dtype, numpy.bool_)
+        self.assertTrue(isinstance(result["price"], numpy.ma.MaskedArray))
+        self.assertEqual(result["price"].count(), 9)
+        self.assertEqual(result["name"].dtype, object)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_types(self):
+        self.connection.execute("UPDATE foo SET id = id + ? WHERE id < 5",
+                                (2 ** 40, ))
+        self.connection.execute("UPDATE foo SET id = NULL WHERE id = 9")
+        fetcher = ColumnarFetcher(self.executor, use_numpy=True)
+        result = fetcher.fetch(self.select, {
+            "id": SQLTypes.BIGINT, "price": SQLTypes.DECIMAL,
+            "flag": SQLTypes.SMALLINT})
+        self.assertEqual(result["id"].dtype, numpy.dtype(numpy.int64))
+        self.assertEqual(result["id"][0], 2 ** 40)
+        self.assertEqual(list(result["id"].mask), [False] * 9 + [True])
+        self.assertEqual(result["price"].dtype, numpy.dtype(numpy.float64))
+        self.assertEqual(result["flag"].dtype, numpy.dtype(numpy.int16))
+
+    @unittest.skipIf(numpy is not None, "NumPy is installed")
+    def test_numpy_required(self):
+        self.assertRaises(ImportError, ColumnarFetcher, self.executor,
+                          use_numpy=True)
+        fetcher = ColumnarFetcher(self.executor)
+        result = fetcher.fetch(self.select, {"id": SQLTypes.INTEGER})
+        self.assertTrue(isinstance(result["id"], array.array))
+
+
+def columnar_test_suite():
+    columnar_test = unittest.makeSuite(ColumnarFetcherTest, "test")
+    return unittest.TestSuite((columnar_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(columnar_test_suite())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import unittest
+
+from pydbc.ddl import (
+    CreateTable, CreateIndex, DropIndex, AlterTable, BulkLoad,
+    IncompleteStatementError, UnsupportedSQLTypeError, IndexReflectionError,
+    IndexRebuildError)
+from pydbc.dml import NoneTableNameError
+from pydbc.dialect import Dialect, SQLiteDialect
+from pydbc import Executor
+from pydbc import SQLTypes, ValueTypes
+
+
+class DDLTest(unittest.TestCase):
+    """
+    Unittest for generating DDL statements.
+    """
+    def setUp(self):
+        self.dialect = Dialect()
+        self.sqlite = SQLiteDialect()
+
+    def test_create_table(self):
+        create = CreateTable("foo")
+        create.add_column("id", SQLTypes.INTEGER, nullable=False)
+        create.add_column("name", SQLTypes.VARCHAR, 32)
+        create.add_column("price", SQLTypes.DECIMAL, 10, 2)
+        create.add_column("data", SQLTypes.BLOB)
+        create.set_primary_key(["id"])
+        self.assertEqual(
+            create.to_sql(self.dialect),
+            "CREATE TABLE foo (id INTEGER NOT NULL, name VARCHAR(32), "
+            "price DECIMAL(10, 2), data BLOB, PRIMARY KEY (id))")
+        create.set_if_not_exists()
+        self.assertEqual(
+            create.to_sql(self.sqlite),
+            'CREATE TABLE IF NOT EXISTS "foo" ("id" INTEGER NOT NULL, '
+            '"name" TEXT, "price" NUMERIC, "data" BLOB, PRIMARY KEY ("id"))')
+
+    def test_create_table_errors(self):
+        self.assertRaises(NoneTableNameError, CreateTable().to_sql,
+                          self.dialect)
+        create = CreateTable("foo")
+        self.assertRaises(IncompleteStatementError, create.to_sql,
+                          self.dialect)
+        create.add_column("id", 12345)
+        self.assertRaises(UnsupportedSQLTypeError, create.to_sql,
+                          self.dialect)
+
+    def test_create_index(self):
+        index = CreateIndex("idx_foo", "foo")
+        index.add_column("name")
+        index.add_column("day", asc=False)
+        self.assertEqual(
+            index.to_sql(self.dialect),
+            "CREATE INDEX idx_foo ON foo (name ASC, day DESC)")
+        index.set_unique()
+        index.set_if_not_exists()
+        self.assertEqual(
+            index.to_sql(self.sqlite),
+            'CREATE UNIQUE INDEX IF NOT EXISTS "idx_foo" ON "foo" '
+            '("name" ASC, "day" DESC)')
+        self.assertRaises(IncompleteStatementError,
+                          CreateIndex("idx_foo", "foo").to_sql, self.dialect)
+
+    def test_index_from_sql(self):
+        index = CreateIndex.from_sql(
+            "idx_foo", "create unique index idx_foo ON foo (name)")
+        self.assertTrue(index.is_unique())
+        self.assertEqual(index.get_name(), "idx_foo")
+        self.assertEqual(index.to_sql(self.dialect),
+                         "CREATE UNIQUE INDEX idx_foo ON foo (name)")
+        self.assertRaises(IncompleteStatementError, CreateIndex.from_sql,
+                          "foo", "CREATE TABLE foo (id)")
+
+    def test_drop_index(self):
+        drop = DropIndex("idx_foo")
+        self.assertEqual(drop.to_sql(self.dialect), "DROP INDEX idx_foo")
+        drop.set_if_exists()
+        self.assertEqual(drop.to_sql(self.sqlite),
+                         'DROP INDEX IF EXISTS "idx_foo"')
+        self.assertRaises(IncompleteStatementError, DropIndex().to_sql,
+                          self.dialect)
+
+    def test_alter_table(self):
+        alter = AlterTable("foo")
+        self.assertRaises(IncompleteStatementError, alter.to_sql,
+                          self.dialect)
+        alter.add_column("name", SQLTypes.CHAR, 8, nullable=False)
+        self.assertEqual(alter.to_sql(self.dialect),
+                         "ALTER TABLE foo ADD COLUMN name CHAR(8) NOT NULL")
+        alter.drop_column("name")
+        self.assertEqual(alter.to_sql(self.sqlite),
+                         'ALTER TABLE "foo" DROP COLUMN "name"')
+        alter.rename_to("bar")
+        self.assertEqual(alter.to_sql(self.dialect),
+                         "ALTER TABLE foo RENAME TO bar")
+
+
+class BulkLoadTest(unittest.TestCase):
+    """
+    Unittest for loading records with deferred index builds.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.executor = Executor(self.connection, SQLiteDialect())
+        create = CreateTable("foo")
+        create.add_column("id", SQLTypes.INTEGER)
+        create.add_column("name", SQLTypes.VARCHAR, 32)
+        create.set_primary_key(["id"])
+        self.executor.execute(create).close()
+        index = CreateIndex("idx_name", "foo")
+        index.add_column("name")
+        self.executor.execute(index).close()
+
+    def tearDown(self):
+        self.connection.close()
+
+    def get_index_sql(self):
+        return self.executor.get_dialect().get_index_sql(
+            self.connection, "foo")
+
+    def create_load(self, **kwargs):
+        load = BulkLoad(self.executor, "foo", **kwargs)
+        load.add_column("id", ValueTypes.INTEGER)
+        load.add_column("name")
+        return load
+
+    def test_load(self):
+        indexes = self.get_index_sql()
+        self.assertEqual(len(indexes), 1)
+        load = self.create_load()
+        # Batches are limited by the parameters accepted by SQLite
+        self.assertEqual(load.get_rows_per_statement(), 499)
+        with load:
+            self.assertEqual(self.get_index_sql(), [])
+            load.add_rows([(i, "name%d" % i) for i in range(1200)])
+        self.assertEqual(self.get_index_sql(), indexes)
+        count = self.connection.execute(
+            "SELECT COUNT(*) FROM foo").fetchone()[0]
+        self.assertEqual(count, 1200)
+
+    def test_rebuild_on_error(self):
+        indexes = self.get_index_sql()
+        try:
+            with self.create_load(batch_size=2) as load:
+                load.add_rows([(1, "a"), (2, "b"), (3, "c")])
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertEqual(self.get_index_sql(), indexes)
+        count = self.connection.execute(
+            "SELECT COUNT(*) FROM foo").fetchone()[0]
+        self.assertEqual(count, 2)
+
+    def test_drop_error(self):
+        indexes = self.get_index_sql()
+        missing = CreateIndex("idx_missing", "foo")
+        missing.add_column("id")
+        load = self.create_load(indexes=[
+            CreateIndex.from_sql(name, sql) for name, sql in indexes] +
+            [missing])
+        self.assertRaises(sqlite3.OperationalError, load.start)
+        self.assertEqual(self.get_index_sql(), indexes)
+        load.finish()
+        self.assertEqual(self.get_index_sql(), indexes)
+
+    def test_rebuild_error(self):
+        index = CreateIndex("idx_a_unique", "foo", unique=True)
+        index.add_column("name")
+        self.executor.execute(index).close()
+        load = self.create_load()
+        load.start()
+        load.add_rows([(1, "a"), (2, "a")])
+        try:
+            load.finish()
+        except IndexRebuildError as e:
+            self.assertEqual([name for name, _ in e.errors],
+                             ["idx_a_unique"])
+        else:
+            self.fail("IndexRebuildError not raised")
+        # Indexes after the failed one are rebuilt as well
+        self.assertEqual([name for name, _ in self.get_index_sql()],
+                         ["idx_name"])
+
+    def test_reflection_error(self):
+        load = BulkLoad(Executor(self.connection, Dialect()), "foo")
+        self.assertRaises(IndexReflectionError, load.start)
+        index = CreateIndex("idx_name", "foo")
+        index.add_column("name")
+        with BulkLoad(Executor(self.connection, Dialect()), "foo",
+                      indexes=[index]) as load:
+            load.add_column("id", ValueTypes.INTEGER)
+            load.add_row([1])
+        self.assertEqual(len(self.get_index_sql()), 1)
+
+
+def ddl_test_suite():
+    ddl_test = unittest.makeSuite(DDLTest, "test")
+    bulk_load_test = unittest.makeSuite(BulkLoadTest, "test")
+    return unittest.TestSuite((ddl_test, bulk_load_test))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(ddl_test_suite())
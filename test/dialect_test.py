@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import datetime
+import decimal
+import subprocess
+import sys
+import unittest
+import uuid
+
+from pydbc.dml import Where
+from pydbc import Dialect, DialectRegistry, ValueTypes, CompareTypes
+from pydbc.dialect import BindingDialect, UnsupportedDialectError
+
+
+class DialectTest(unittest.TestCase):
+    """
+    Unittest for converting values with SQL dialects.
+    """
+    def setUp(self):
+        self.dialect = Dialect()
+
+    def test_literal_values(self):
+        cases = (
+            ("foo", ValueTypes.STRING, "'foo'"),
+            ("it's", ValueTypes.STRING, "'it''s'"),
+            (10, ValueTypes.INTEGER, "10"),
+            ("\x01\xab", ValueTypes.BINARY, "X'01ab'"),
+            (memoryview("\x01"), ValueTypes.BINARY, "X'01'"),
+            (decimal.Decimal("1.10"), ValueTypes.DECIMAL, "1.10"),
+            (0.5, ValueTypes.FLOAT, "0.5"),
+            (True, ValueTypes.BOOLEAN, "TRUE"),
+            (datetime.date(2014, 1, 2), ValueTypes.DATE, "'2014-01-02'"),
+            (datetime.datetime(2014, 1, 2, 3, 4, 5), ValueTypes.DATETIME,
+             "'2014-01-02 03:04:05'"),
+            (uuid.UUID(int=1), ValueTypes.UUID,
+             "'00000000-0000-0000-0000-000000000001'"),
+            ("foo.bar", ValueTypes.OTHER, "foo.bar"),
+        )
+        for value, value_type, expected in cases:
+            self.assertEqual(self.dialect.value2sql(value, value_type),
+                             expected)
+
+    def test_param_styles(self):
+        where = Where()
+        where.add_column("alpha", 1, column_type=ValueTypes.INTEGER)
+        where.add_column("beta", "gamma.delta", column_type=ValueTypes.OTHER)
+        where.add_column("gamma", "it's")
+        where.add_column("delta", "", compare_type=CompareTypes.NULL)
+        cases = (
+            ("qmark", " WHERE alpha=? AND beta=gamma.delta AND gamma=? "
+                      "AND delta IS NULL", [1, "it's"]),
+            ("numeric", " WHERE alpha=:1 AND beta=gamma.delta AND gamma=:2 "
+                        "AND delta IS NULL", [1, "it's"]),
+            ("pyformat", " WHERE alpha=%(p1)s AND beta=gamma.delta "
+                         "AND gamma=%(p2)s AND delta IS NULL",
+             {"p1": 1, "p2": "it's"}),
+        )
+        for style, expected_sql, expected_params in cases:
+            self.dialect.paramstyle = style
+            binding = BindingDialect(self.dialect)
+            self.assertEqual(where.to_sql(binding), expected_sql)
+            self.assertEqual(binding.get_params(), expected_params)
+
+
+class DialectRegistryTest(unittest.TestCase):
+    """
+    Unittest for resolving SQL dialects by name.
+    """
+    class TestDialect(Dialect):
+        _table_quote = "\""
+
+    def tearDown(self):
+        DialectRegistry._dialects.pop("test", None)
+        DialectRegistry._loaded.pop("test", None)
+
+    def test_builtin_dialect(self):
+        self.assertTrue(DialectRegistry.load("generic") is Dialect)
+        self.assertTrue(isinstance(DialectRegistry.create("generic"), Dialect))
+
+    def test_register_dialect(self):
+        DialectRegistry.register("test", self.TestDialect)
+        self.assertTrue(DialectRegistry.load("test") is self.TestDialect)
+        self.assertTrue("test" in DialectRegistry.get_names())
+        DialectRegistry.register("test", "pydbc.dialect.base_dialect:Dialect")
+        self.assertTrue(DialectRegistry.load("test") is Dialect)
+
+    def test_unknown_dialect(self):
+        self.assertRaises(UnsupportedDialectError, DialectRegistry.load,
+                          "unknown")
+
+    def test_lazy_import(self):
+        code = "import sys, pydbc; " \
+               "print sorted(m for m in sys.modules if m.startswith('pydbc')" \
+               " and sys.modules[m] is not None)"
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), "['pydbc']")
+
+    def test_public_names(self):
+        # Names of the package before attributes were imported lazily
+        names = ["AggregateFunctions", "CompareTypes", "Dialect", "JoinTypes",
+                 "RelationTypes", "SQLTypes", "SQLUtils", "ValueTypes",
+                 "constants", "dialect", "dml", "sqlutils"]
+        code = "import sys, pydbc; names = %r; " \
+               "print [n for n in names if n not in dir(pydbc)]; " \
+               "print [n for n in names if getattr(pydbc, n, None) is None]; " \
+               "print [n for n in names if n.islower() and " \
+               "getattr(pydbc, n) is not sys.modules['pydbc.' + n]]" % names
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.split(), ["[]", "[]", "[]"])
+
+
+def dialect_test_suite():
+    dialect_test = unittest.makeSuite(DialectTest, "test")
+    registry_test = unittest.makeSuite(DialectRegistryTest, "test")
+    return unittest.TestSuite((dialect_test, registry_test))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(dialect_test_suite())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import datetime
+import decimal
+import sqlite3
+import unittest
+import uuid
+
+from pydbc.dialect import SQLiteDialect
+from pydbc import Executor
+from pydbc import ValueTypes, CompareTypes
+from test.fixtures import create_select
+
+
+class ExecutorTest(unittest.TestCase):
+    """
+    Unittest for executing statements with bind parameters.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, name TEXT, data BLOB, "
+            "price TEXT, flag INTEGER, day DATE, uid TEXT)")
+        self.executor = Executor(self.connection, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, column_name, value, column_type,
+                      compare_type=CompareTypes.EQUALS):
+        return create_select(("id", ), criteria=[
+            (column_name, value, None, column_type, compare_type)])
+
+    def test_compile(self):
+        select = self.create_select("name", ["a'b", "c"], ValueTypes.STRING,
+                                    CompareTypes.IN)
+        sql, params = self.executor.compile(select)
+        self.assertEqual(
+            sql, 'SELECT "id" FROM "foo" WHERE "name" IN (?, ?)')
+        self.assertEqual(params, ["a'b", "c"])
+
+    def test_bind_values(self):
+        data = bytearray("\x00\x01binary\xff")
+        price = decimal.Decimal("12345678901234567890.123456789")
+        day = datetime.date(2014, 10, 1)
+        uid = uuid.uuid4()
+        self.connection.execute(
+            "INSERT INTO foo VALUES (1, 'it''s', ?, ?, 1, ?, ?)",
+            (buffer(data), str(price), day, str(uid)))
+        cases = (
+            ("name", "it's", ValueTypes.STRING),
+            ("data", data, ValueTypes.BINARY),
+            ("data", memoryview(data), ValueTypes.BINARY),
+            ("data", str(data), ValueTypes.BINARY),
+            ("price", price, ValueTypes.DECIMAL),
+            ("flag", True, ValueTypes.BOOLEAN),
+            ("day", day, ValueTypes.DATE),
+            ("uid", uid, ValueTypes.UUID),
+        )
+        for column_name, value, column_type in cases:
+            select = self.create_select(column_name, value, column_type)
+            self.assertEqual(self.executor.fetchall(select), [(1, )])
+
+    def test_zero_copy_binary(self):
+        data = bytearray("binary")
+        dialect = SQLiteDialect()
+        param = dialect.bind_value(data, ValueTypes.BINARY)
+        data[0] = "B"
+        self.assertEqual(str(param), "Binary")
+
+
+def executor_test_suite():
+    executor_test = unittest.makeSuite(ExecutorTest, "test")
+    return unittest.TestSuite((executor_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(executor_test_suite())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from pydbc.dml import JoinedTables, Select
+from pydbc.dialect import SQLiteDialect
+from pydbc.export import CSVSink, JSONLinesSink
+from pydbc import Executor
+
+
+class ExportTest(unittest.TestCase):
+    """
+    Unittest for exporting results into files.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, name TEXT, data BLOB)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?, ?)",
+            [(i, u"n\xe4me,%d" % i, buffer("\x00%d" % i) if i else None)
+             for i in range(25)])
+        self.executor = Executor(self.connection, SQLiteDialect())
+        self.select = Select()
+        tables = JoinedTables()
+        tables.add_table("foo")
+        self.select.set_tables(tables)
+        self.select.add_column("*")
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.connection.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_csv(self):
+        output = StringIO()
+        with CSVSink(output) as sink:
+            statistics = self.executor.export(self.select, sink,
+                                              batch_size=10)
+        self.assertEqual(statistics["rows"], 25)
+        self.assertTrue(statistics["rows_per_second"] >= 0)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 26)
+        self.assertEqual(lines[0], "id,name,data")
+        self.assertEqual(lines[1], "0,\"n\xc3\xa4me,0\",")
+        self.assertEqual(lines[2], "1,\"n\xc3\xa4me,1\",ADE=")
+        self.assertFalse(output.closed)
+
+    def test_jsonl_gzip(self):
+        path = os.path.join(self.temp_dir, "foo.jsonl.gz")
+        with JSONLinesSink(path, compress=True, buffer_size=4096) as sink:
+            self.executor.export(self.select, sink, batch_size=7)
+        records = [json.loads(line) for line in gzip.open(path, "rb")]
+        self.assertEqual(len(records), 25)
+        self.assertEqual(records[0], {"id": 0, "name": u"n\xe4me,0",
+                                      "data": None})
+        self.assertEqual(records[24]["data"], "ADI0")
+
+    def test_csv_file(self):
+        path = os.path.join(self.temp_dir, "foo.csv")
+        with CSVSink(path, delimiter="\t") as sink:
+            self.executor.export(self.select, sink)
+        with open(path, "rb") as csv_file:
+            self.assertEqual(csv_file.readline(), "id\tname\tdata\r\n")
+
+
+def export_test_suite():
+    export_test = unittest.makeSuite(ExportTest, "test")
+    return unittest.TestSuite((export_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(export_test_suite())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from pydbc.fileutils import FileUtils
+
+
+class FileUtilsTest(unittest.TestCase):
+    """
+    Unittest for writing files replaced at once.
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "data.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read(self):
+        with open(self.path, "rb") as data_file:
+            return data_file.read()
+
+    def test_write(self):
+        FileUtils.write_atomic(self.path, "first")
+        FileUtils.write_atomic(self.path, "second")
+        self.assertEqual(self.read(), "second")
+        self.assertEqual(os.listdir(self.temp_dir), ["data.txt"])
+        if os.name != "nt":
+            self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+    def test_concurrent(self):
+        contents = ["%d" % i * 10000 for i in range(8)]
+        errors = []
+
+        def write(data):
+            try:
+                for i in range(20):
+                    FileUtils.write_atomic(self.path, data)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(data, ))
+                   for data in contents]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertTrue(self.read() in contents)
+        self.assertEqual(os.listdir(self.temp_dir), ["data.txt"])
+
+    def test_error(self):
+        self.assertRaises(TypeError, FileUtils.write_atomic, self.path, None)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+def fileutils_test_suite():
+    fileutils_test = unittest.makeSuite(FileUtilsTest, "test")
+    return unittest.TestSuite((fileutils_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(fileutils_test_suite())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+from pydbc.dml import JoinedTables, Where, Select
+
+
+def create_select(columns=("name", ), tables="foo", criteria=None):
+    """
+    Create a select used as fixture of the tests.
+
+    :param columns: Columns to select, as column names or tuples of the
+        arguments of :meth:`Select.add_column`.
+    :type columns: iterable
+    :param tables: Name of the table to select from, or the joined tables.
+    :type tables: str or JoinedTables
+    :param criteria: Conditions of the `WHERE` clause, as tuples of the
+        arguments of :meth:`Where.add_column`. The select is not filtered if
+        `None`.
+    :type criteria: iterable
+    :return: The select.
+    :rtype: Select
+    """
+    select = Select()
+    if not isinstance(tables, JoinedTables):
+        table_name, tables = tables, JoinedTables()
+        tables.add_table(table_name)
+    select.set_tables(tables)
+    for column in columns:
+        if isinstance(column, tuple):
+            select.add_column(*column)
+        else:
+            select.add_column(column)
+    if criteria is not None:
+        where = Where()
+        for criterion in criteria:
+            where.add_column(*criterion)
+        select.set_where(where)
+    return select
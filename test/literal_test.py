@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import datetime
+import decimal
+import unittest
+import uuid
+
+from pydbc.dml import Where
+from pydbc.dialect import Dialect, LiteralRenderer
+from pydbc import ValueTypes, CompareTypes
+
+
+class LiteralRendererTest(unittest.TestCase):
+    """
+    Unittest for rendering values as SQL literals.
+    """
+    def test_strings(self):
+        renderer = LiteralRenderer()
+        cases = (
+            ("it's", "'it''s'"),
+            ("a\\'b", "'a\\''b'"),
+            ("\"", "'\"'"),
+            (u"é", u"'é'"),
+            ("nul\x00", None),
+            (12, "'12'"),
+        )
+        for value, expected in cases:
+            self.assertEqual(renderer.render(value, ValueTypes.STRING),
+                             expected)
+
+    def test_escaping_rules(self):
+        mysql = LiteralRenderer(backslash_escapes=True)
+        self.assertEqual(mysql.render_string("a\\'b"), "'a\\\\''b'")
+        postgresql = LiteralRenderer(escape_prefix=True)
+        self.assertEqual(postgresql.render_string("a\\'b"), "E'a\\\\''b'")
+        self.assertEqual(postgresql.render_string("it's"), "'it''s'")
+        mssql = LiteralRenderer(national_prefix=True)
+        self.assertEqual(mssql.render_string(u"it's"), u"N'it''s'")
+        self.assertEqual(mssql.render_string("ab"), "'ab'")
+
+    def test_numbers(self):
+        renderer = LiteralRenderer()
+        cases = (
+            (10, ValueTypes.INTEGER, "10"),
+            (10L, ValueTypes.LONG, "10"),
+            (True, ValueTypes.INTEGER, "1"),
+            ("1; DROP TABLE foo", ValueTypes.INTEGER, None),
+            (1.9, ValueTypes.INTEGER, None),
+            (2.0, ValueTypes.INTEGER, None),
+            (" -12 ", ValueTypes.INTEGER, "-12"),
+            ("1.9", ValueTypes.INTEGER, None),
+            (decimal.Decimal("12.00"), ValueTypes.LONG, "12"),
+            (decimal.Decimal("1.9"), ValueTypes.INTEGER, None),
+            (decimal.Decimal("NaN"), ValueTypes.INTEGER, None),
+            ("1; DROP TABLE foo", ValueTypes.FLOAT, None),
+            (float("nan"), ValueTypes.FLOAT, None),
+            (decimal.Decimal("1.10"), ValueTypes.DECIMAL, "1.10"),
+            ("2.5", ValueTypes.DECIMAL, "2.5"),
+            ("1 OR 1=1", ValueTypes.DECIMAL, None),
+            (decimal.Decimal("Infinity"), ValueTypes.DECIMAL, None),
+            (True, ValueTypes.BOOLEAN, "TRUE"),
+        )
+        for value, value_type, expected in cases:
+            self.assertEqual(renderer.render(value, value_type), expected)
+        self.assertEqual(
+            LiteralRenderer(booleans=("0", "1")).render_boolean(False), "0")
+
+    def test_mistyped_values(self):
+        renderer = LiteralRenderer()
+        uid = "12345678-1234-5678-1234-567812345678"
+        cases = (
+            (uuid.UUID(uid), ValueTypes.UUID, "'%s'" % uid),
+            (uid.upper(), ValueTypes.UUID, "'%s'" % uid),
+            ("{%s}" % uid.replace("-", ""), ValueTypes.UUID, "'%s'" % uid),
+            ("x' OR '1'='1", ValueTypes.UUID, None),
+            (uid + "'--", ValueTypes.UUID, None),
+            (1, ValueTypes.UUID, None),
+            (datetime.date(2020, 1, 2), ValueTypes.DATE, "'2020-01-02'"),
+            ("2020-01-01", ValueTypes.DATE, None),
+            ("2020-01-01' OR '1'='1", ValueTypes.DATE, None),
+            (datetime.datetime(2020, 1, 2, 3, 4), ValueTypes.DATETIME,
+             "'2020-01-02 03:04:00'"),
+            (datetime.date(2020, 1, 2), ValueTypes.DATETIME, None),
+            ("2020-01-01 00:00:00", ValueTypes.DATETIME, None),
+            (False, ValueTypes.BOOLEAN, "FALSE"),
+            (1, ValueTypes.BOOLEAN, "TRUE"),
+            (0L, ValueTypes.BOOLEAN, "FALSE"),
+            ("false", ValueTypes.BOOLEAN, None),
+            (2, ValueTypes.BOOLEAN, None),
+            (None, ValueTypes.BOOLEAN, None),
+            ("\x00'", ValueTypes.BINARY, "X'0027'"),
+            (bytearray("ab"), ValueTypes.BINARY, "X'6162'"),
+            (u"é", ValueTypes.BINARY, None),
+            (12, ValueTypes.BINARY, None),
+        )
+        for value, value_type, expected in cases:
+            self.assertEqual(renderer.render(value, value_type), expected)
+        self.assertEqual(renderer.render_list(
+            [uid, "x' OR '1'='1"], ValueTypes.UUID), None)
+
+    def test_hostile_values(self):
+        for values, value_type in (
+                ("x' OR '1'='1", ValueTypes.UUID),
+                (["x' OR '1'='1"], ValueTypes.UUID),
+                ("2020-01-01' OR '1'='1", ValueTypes.DATE),
+                ("1 OR 1=1", ValueTypes.BOOLEAN)):
+            where = Where()
+            compare_type = CompareTypes.IN if isinstance(values, list) \
+                else CompareTypes.EQUALS
+            where.add_column("u", values, column_type=value_type,
+                             compare_type=compare_type)
+            # Columns with values which could not be used are left out
+            self.assertFalse("OR" in where.to_sql(Dialect()))
+
+    def test_lists(self):
+        renderers = (
+            LiteralRenderer(), LiteralRenderer(backslash_escapes=True),
+            LiteralRenderer(escape_prefix=True),
+            LiteralRenderer(national_prefix=True))
+        cases = (
+            ([1, 2L, 3], ValueTypes.INTEGER),
+            ([1, "2", True], ValueTypes.INTEGER),
+            (["a", "it's", "b\\c", ""], ValueTypes.STRING),
+            ([u"a", u"it's", u"é"], ValueTypes.STRING),
+            (["a", u"b", 1], ValueTypes.STRING),
+            ([1.5, decimal.Decimal("2")], ValueTypes.DECIMAL),
+        )
+        for renderer in renderers:
+            for values, value_type in cases:
+                self.assertEqual(
+                    renderer.render_list(values, value_type),
+                    ", ".join([renderer.render(value, value_type)
+                               for value in values]))
+            self.assertEqual(
+                renderer.render_list(["a", "b\x00"], ValueTypes.STRING), None)
+            self.assertEqual(
+                renderer.render_list([1, "x"], ValueTypes.INTEGER), None)
+            self.assertEqual(renderer.render_list([], ValueTypes.STRING), "")
+
+    def test_dialect(self):
+        where = Where()
+        where.add_column("name", ["a", "it's"], compare_type=CompareTypes.IN)
+        where.add_column("note", "it's")
+        self.assertEqual(where.to_sql(Dialect()),
+                         " WHERE name IN ('a', 'it''s') AND note='it''s'")
+        sql, params = Dialect().compile(where)
+        self.assertEqual(sql, " WHERE name IN (?, ?) AND note=?")
+        self.assertEqual(params, ["a", "it's", "it's"])
+
+
+def literal_test_suite():
+    literal_test = unittest.makeSuite(LiteralRendererTest, "test")
+    return unittest.TestSuite((literal_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(literal_test_suite())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import unittest
+
+from pydbc.dml import Where
+from pydbc.dialect import SQLiteDialect
+from pydbc.loader import KeyLoader, UnsupportedTemplateError
+from pydbc import Executor
+from pydbc import RelationTypes, ValueTypes
+from test.fixtures import create_select
+
+
+class CountingConnection(object):
+    def __init__(self, connection):
+        self.connection = connection
+        self.calls = 0
+
+    def cursor(self):
+        self.calls += 1
+        return self.connection.cursor()
+
+
+class KeyLoaderTest(unittest.TestCase):
+    """
+    Unittest for coalescing lookups of single keys.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, name TEXT, flag INTEGER)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?, ?)",
+            [(i, "name%d" % i, i % 2) for i in range(2000)])
+        self.counting = CountingConnection(self.connection)
+        self.executor = Executor(self.counting, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, where=None):
+        select = create_select()
+        select.set_where(where)
+        return select
+
+    def test_load(self):
+        loader = KeyLoader(self.executor, self.create_select(), "id")
+        with loader:
+            results = loader.load_many([3, 1, 3, 5000])
+            self.assertEqual(self.counting.calls, 0)
+        self.assertEqual(self.counting.calls, 1)
+        self.assertEqual([result.get() for result in results],
+                         [("name3", ), ("name1", ), ("name3", ), None])
+        # Cached results are not loaded again
+        self.assertEqual(loader.load(1).get(), ("name1", ))
+        self.assertEqual(self.counting.calls, 1)
+        loader.clear()
+        self.assertEqual(loader.load(1).get(), ("name1", ))
+        self.assertEqual(self.counting.calls, 2)
+
+    def test_chunks(self):
+        where = Where()
+        where.add_column("flag", 1, column_type=ValueTypes.INTEGER)
+        loader = KeyLoader(self.executor, self.create_select(where), "id")
+        self.assertEqual(loader.get_keys_per_select(), 500)
+        results = loader.load_many(range(1500))
+        self.assertEqual(results[7].get(), ("name7", ))
+        self.assertEqual(self.counting.calls, 3)
+        self.assertEqual(results[8].get(), None)
+
+    def test_many(self):
+        select = create_select(("id", ))
+        loader = KeyLoader(self.executor, select, "flag", unique=False)
+        even, missing = loader.load(0), loader.load(2)
+        self.assertEqual(len(even.get()), 1000)
+        self.assertEqual(even.get()[:2], [(0, ), (2, )])
+        self.assertEqual(missing.get(), [])
+
+    def test_template(self):
+        where = Where()
+        where.add_column("flag", 1, column_type=ValueTypes.INTEGER)
+        where.add_column("name", "x", relation_type=RelationTypes.OR)
+        self.assertRaises(UnsupportedTemplateError, KeyLoader, self.executor,
+                          self.create_select(where), "id")
+        select = self.create_select()
+        loader = KeyLoader(self.executor, select, "id", key_table="foo")
+        sql, params = self.executor.compile(loader.create_select([1, 2]))
+        self.assertEqual(
+            sql, 'SELECT "name", "foo"."id" FROM "foo" '
+                 'WHERE "foo"."id" IN (?, ?)')
+        self.assertEqual(params, [1, 2])
+        self.assertEqual(len(select.get_columns()), 1)
+        self.assertEqual(select.get_where(), None)
+
+    def test_all_columns(self):
+        select = self.create_select()
+        select.set_columns([])
+        loader = KeyLoader(self.executor, select, "id")
+        sql, _ = self.executor.compile(loader.create_select([1]))
+        self.assertEqual(sql, 'SELECT *, "id" FROM "foo" WHERE "id" IN (?)')
+        self.assertEqual(loader.load(1).get(), (1, "name1", 1))
+        self.assertEqual(select.get_columns(), [])
+
+    def test_shared_columns(self):
+        where = Where()
+        where.add_column("flag", 1, column_type=ValueTypes.INTEGER)
+        select = self.create_select(where)
+        columns = select.get_columns() + where.get_columns()
+        flags = [col.is_first for col in columns]
+        loader = KeyLoader(self.executor, select, "id")
+        created = loader.create_select([1])
+        self.assertEqual([col.is_first for col in columns], flags)
+        for col in created.get_columns() + created.get_where().get_columns():
+            self.assertFalse(any(col is shared for shared in columns))
+
+
+def loader_test_suite():
+    loader_test = unittest.makeSuite(KeyLoaderTest, "test")
+    return unittest.TestSuite((loader_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(loader_test_suite())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import io
+import sqlite3
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from pydbc.dml import Insert, UnsupportedValueError
+from pydbc.dialect import Dialect, SQLiteDialect
+from pydbc.lob import LOBStream, LOBTooLargeError
+from pydbc import Executor
+from pydbc import ValueTypes
+
+
+class StreamingDialect(Dialect):
+    stream_parameters = True
+
+
+class LOBStreamTest(unittest.TestCase):
+    """
+    Unittest for large object streams.
+    """
+    def test_read_chunks(self):
+        stream = LOBStream(iter(["abc", "de", "", "fghij"]))
+        self.assertEqual(stream.read(4), "abcd")
+        self.assertEqual(stream.read(2), "ef")
+        self.assertEqual(list(stream.iter_chunks()), ["ghij"])
+        self.assertEqual(stream.read(), "")
+
+    def test_read_all_file(self):
+        data = "\x00\xffbinary" * 1000
+        source = tempfile.TemporaryFile()
+        source.write(data)
+        source.seek(0)
+        stream = LOBStream(io.open(source.fileno(), "rb", closefd=False),
+                           chunk_size=1024)
+        self.assertEqual(stream.get_size(), len(data))
+        result = stream.read_all()
+        self.assertTrue(isinstance(result, bytearray))
+        self.assertEqual(str(result), data)
+        source.close()
+
+    def test_read_all_unknown_size(self):
+        stream = LOBStream(StringIO("binary"), chunk_size=4)
+        self.assertEqual(stream.get_size(), None)
+        self.assertEqual(stream.read_all(), bytearray("binary"))
+
+    def test_read_text(self):
+        stream = LOBStream([u"text ", u"chunks"])
+        self.assertEqual(stream.read_text(), u"text chunks")
+        self.assertEqual(LOBStream([]).read_text(), "")
+
+    def test_max_size(self):
+        stream = LOBStream(StringIO("x" * 10), chunk_size=4, max_size=8)
+        self.assertRaises(LOBTooLargeError, stream.read_all)
+        stream = LOBStream(["x" * 5, "x" * 5], max_size=8)
+        self.assertRaises(LOBTooLargeError, stream.read_text)
+
+
+class InsertTest(unittest.TestCase):
+    """
+    Unittest for insert statements with large objects.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER, name TEXT, data BLOB)")
+        self.executor = Executor(self.connection, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_insert(self):
+        insert = Insert()
+        insert.set_table("foo")
+        insert.add_column("id", ValueTypes.INTEGER)
+        insert.add_column("name")
+        insert.add_column("data", ValueTypes.BINARY)
+        return insert
+
+    def test_to_sql(self):
+        insert = self.create_insert()
+        insert.add_row([1, "foo", None])
+        insert.add_row([2, "bar", "\x01"])
+        self.assertEqual(
+            insert.to_sql(Dialect()),
+            "INSERT INTO foo (id, name, data) "
+            "VALUES (1, 'foo', NULL), (2, 'bar', X'01')")
+        self.assertRaises(UnsupportedValueError, insert.add_row, [1])
+        insert.add_row([3, "it's", None])
+        self.assertTrue(insert.to_sql(Dialect()).endswith(
+            ", (3, 'it''s', NULL)"))
+        insert.add_row([4, "nul\x00", None])
+        self.assertRaises(UnsupportedValueError, insert.to_sql, Dialect())
+        self.assertRaises(UnsupportedValueError, Insert.to_sql,
+                          self.create_insert(), Dialect())
+
+    def test_insert_streams(self):
+        data = "\x00\xffbinary" * 10000
+        insert = self.create_insert()
+        insert.add_row([1, LOBStream(StringIO("it's text")),
+                        LOBStream(StringIO(data), chunk_size=4096)])
+        insert.add_row([2, LOBStream(iter(["chunked ", "text"])),
+                        LOBStream(iter([data[:7], data[7:]]))])
+        self.executor.execute(insert).close()
+        rows = self.connection.execute(
+            "SELECT id, name, data FROM foo ORDER BY id").fetchall()
+        self.assertEqual(rows, [(1, "it's text", buffer(data)),
+                                (2, "chunked text", buffer(data))])
+
+    def test_stream_parameters(self):
+        stream = LOBStream(StringIO("binary"))
+        insert = self.create_insert()
+        insert.add_row([1, "foo", stream])
+        sql, params = StreamingDialect().compile(insert)
+        self.assertEqual(sql, "INSERT INTO foo (id, name, data) "
+                              "VALUES (?, ?, ?)")
+        self.assertTrue(params[2] is stream)
+        self.assertEqual(params[2].read(), "binary")
+
+
+def lob_test_suite():
+    stream_test = unittest.makeSuite(LOBStreamTest, "test")
+    insert_test = unittest.makeSuite(InsertTest, "test")
+    return unittest.TestSuite((stream_test, insert_test))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(lob_test_suite())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from pydbc.dialect import SQLiteDialect
+from pydbc.metrics import QueryMetrics
+from pydbc.sqlutils import SQLUtils
+from pydbc import Executor
+from pydbc import ValueTypes, CompareTypes
+from test.fixtures import create_select
+
+
+class MetricsTest(unittest.TestCase):
+    """
+    Unittest for collecting and exporting metrics of executed statements.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE foo (id INTEGER, name TEXT)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?)", [(i, "a") for i in range(5)])
+        self.metrics = QueryMetrics(buckets=(0.5, 1.0))
+        self.executor = Executor(self.connection, SQLiteDialect(),
+                                 metrics=self.metrics)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, table_name, ids):
+        return create_select(("id", ), table_name, [
+            ("id", ids, None, ValueTypes.INTEGER, CompareTypes.IN)])
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            SQLUtils.normalize_sql(
+                "SELECT a FROM t\n WHERE id IN (?, ?, ?) AND "
+                "x='it''s' AND y=12.5 AND z=:name AND w=$3"),
+            "SELECT a FROM t WHERE id IN (?) AND x=? AND y=? AND z=? "
+            "AND w=?")
+        self.assertEqual(
+            SQLUtils.normalize_sql(
+                "INSERT INTO t1 (a, b) VALUES (1, 'x'), (%s, NULL)"),
+            "INSERT INTO t1 (a, b) VALUES (?)")
+        self.assertEqual(SQLUtils.get_fingerprint("SELECT a FROM t WHERE b=1"),
+                         SQLUtils.get_fingerprint("SELECT a FROM t WHERE b=2"))
+
+    def test_executor(self):
+        self.executor.fetchall(self.create_select("foo", [1, 2]))
+        rows = list(self.executor.iterrows(self.create_select("foo", [3])))
+        self.assertEqual(len(rows), 1)
+        self.assertRaises(sqlite3.OperationalError, self.executor.fetchall,
+                          self.create_select("bar", [1]))
+        series = self.metrics.get_series()
+        self.assertEqual(len(series), 2)
+        fingerprint = SQLUtils.get_fingerprint(
+            'SELECT "id" FROM "foo" WHERE "id" IN (?)')
+        item = series[("SQLiteDialect", fingerprint)]
+        self.assertEqual(item["sql"],
+                         'SELECT "id" FROM "foo" WHERE "id" IN (?)')
+        self.assertEqual((item["queries"], item["errors"], item["rows"]),
+                         (2, 0, 3))
+        fingerprint = SQLUtils.get_fingerprint(
+            'SELECT "id" FROM "bar" WHERE "id" IN (?)')
+        item = series[("SQLiteDialect", fingerprint)]
+        self.assertEqual((item["queries"], item["errors"]), (1, 1))
+
+    def test_sql(self):
+        sql = "INSERT INTO foo VALUES (?, ?)"
+        self.executor.execute_sql(sql, [(5, "b"), (6, "c")], many=True).close()
+        self.assertEqual(self.executor.fetch_sql(
+            "SELECT id FROM foo WHERE id > ?", [4]), [(5, ), (6, )])
+        series = self.metrics.get_series()
+        item = series[("SQLiteDialect", SQLUtils.get_fingerprint(sql))]
+        self.assertEqual((item["queries"], item["errors"]), (1, 0))
+        item = series[("SQLiteDialect", SQLUtils.get_fingerprint(
+            "SELECT id FROM foo WHERE id > ?"))]
+        self.assertEqual((item["queries"], item["rows"]), (1, 2))
+
+    def test_max_series(self):
+        metrics = QueryMetrics(max_series=2)
+        for i in range(5):
+            metrics.record_execution("D", "SELECT a FROM t%d" % i, 0.0, 0.1)
+        series = metrics.get_series()
+        self.assertEqual(len(series), 3)
+        self.assertEqual(series[("D", QueryMetrics.OTHER)]["queries"], 3)
+
+    def test_prometheus(self):
+        sql = "SELECT a FROM t WHERE b=?"
+        fingerprint = SQLUtils.get_fingerprint(sql)
+        self.metrics.record_execution('a"b', sql, 0.25, 0.75)
+        self.metrics.record_execution('a"b', sql, 0.0, 2.0, error=True)
+        self.metrics.record_rows('a"b', sql, 7)
+        self.metrics.set_gauge("connections_idle", 3, "Idle connections.")
+        text = self.metrics.to_prometheus()
+        label = 'dialect="a\\"b",fingerprint="%s"' % fingerprint
+        for line in (
+                "# TYPE pydbc_queries_total counter",
+                "pydbc_queries_total{%s} 2" % label,
+                "pydbc_query_errors_total{%s} 1" % label,
+                "pydbc_query_rows_total{%s} 7" % label,
+                "# TYPE pydbc_execute_seconds histogram",
+                'pydbc_execute_seconds_bucket{%s,le="0.5"} 0' % label,
+                'pydbc_execute_seconds_bucket{%s,le="1.0"} 1' % label,
+                'pydbc_execute_seconds_bucket{%s,le="+Inf"} 2' % label,
+                "pydbc_execute_seconds_sum{%s} 2.75" % label,
+                "pydbc_execute_seconds_count{%s} 2" % label,
+                'pydbc_compile_seconds_bucket{%s,le="0.5"} 2' % label,
+                "# HELP pydbc_connections_idle Idle connections.",
+                "# TYPE pydbc_connections_idle gauge",
+                "pydbc_connections_idle 3"):
+            self.assertTrue(line in text.splitlines(), line)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "pydbc.prom")
+            self.metrics.write(path)
+            self.metrics.write(path)
+            with open(path, "rb") as metrics_file:
+                self.assertEqual(metrics_file.read(), text)
+            self.assertEqual(os.listdir(temp_dir), ["pydbc.prom"])
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+def metrics_test_suite():
+    metrics_test = unittest.makeSuite(MetricsTest, "test")
+    return unittest.TestSuite((metrics_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(metrics_test_suite())
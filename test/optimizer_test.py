@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import unittest
+
+from pydbc.dml import (
+    Column, JoinedConditions, JoinedTables, Where, Having, GroupBy, OrderBy,
+    Select)
+from pydbc.optimizer import (
+    PredicateOptimizer, ProjectionOptimizer, JoinOptimizer)
+from pydbc import Dialect
+from pydbc import (
+    ValueTypes, CompareTypes, RelationTypes, AggregateFunctions, JoinTypes)
+
+
+# ===============================
+# Unit tests for DML optimizers:
+#   1. PredicateOptimizerTest
+#   2. ProjectionOptimizerTest
+#   3. JoinOptimizerTest
+# ===============================
+class PredicateOptimizerTest(unittest.TestCase):
+    """
+    Unittest for simplifying predicates of SQL statements.
+    """
+    def setUp(self):
+        self.optimizer = PredicateOptimizer()
+        self.dialect = Dialect()
+        self.select = Select()
+        table = JoinedTables()
+        table.add_table("foo")
+        self.select.set_tables(table)
+
+    def tearDown(self):
+        self.select.clear()
+
+    def test_duplicated_predicates(self):
+        where = Where()
+        where.add_column("alpha", 1, column_type=ValueTypes.INTEGER)
+        where.add_column("beta", "bar")
+        where.add_column("alpha", 1, column_type=ValueTypes.INTEGER)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo WHERE alpha=1 AND beta='bar'"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_fold_equality_chain(self):
+        where = Where()
+        for value in ["a", "b", "it's", "b"]:
+            where.add_column("alpha", value,
+                             relation_type=RelationTypes.OR)
+        where.add_column("beta", 1, column_type=ValueTypes.INTEGER,
+                         relation_type=RelationTypes.OR)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        # Quotes are escaped by the dialect, so such values are folded too
+        expected = "SELECT * FROM foo WHERE alpha IN ('a', 'b', 'it''s') " \
+                   "OR beta=1"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_merge_ranges(self):
+        where = Where()
+        where.add_column("alpha", 1, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.GREATER_THAN)
+        where.add_column("alpha", 5, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.GREATER_THAN_OR_EQUAL)
+        where.add_column("alpha", 9, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.LESS_THAN)
+        where.add_column("alpha", 20, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.LESS_THAN_OR_EQUAL)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo WHERE alpha>=5 AND alpha<9"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_contradictory_ranges(self):
+        where = Where()
+        where.add_column("alpha", 5, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.GREATER_THAN)
+        where.add_column("alpha", 3, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.LESS_THAN)
+        where.add_column("beta", 1, column_type=ValueTypes.INTEGER,
+                         relation_type=RelationTypes.OR)
+        where.add_column("beta", 0, column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.GREATER_THAN)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo WHERE beta=1"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_move_having_predicates(self):
+        self.select.add_column("gamma")
+        self.select.add_column("delta", aggr_func=AggregateFunctions.SUM)
+        group_by = GroupBy()
+        group_by.add_column("gamma")
+        having = Having()
+        having.add_column("delta", AggregateFunctions.SUM, 1,
+                          column_type=ValueTypes.INTEGER)
+        having.add_column("gamma", None, "bar")
+        self.select.set_group_by(group_by)
+        self.select.set_having(having)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT gamma, SUM(delta) FROM foo WHERE gamma='bar' " \
+                   "GROUP BY gamma HAVING SUM(delta)=1"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_keep_having_expressions(self):
+        self.select.add_column("gamma")
+        group_by = GroupBy()
+        group_by.add_column("gamma")
+        having = Having()
+        having.add_column("gamma", None, "MAX(delta)",
+                          column_type=ValueTypes.OTHER,
+                          compare_type=CompareTypes.LESS_THAN)
+        self.select.set_group_by(group_by)
+        self.select.set_having(having)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT gamma FROM foo GROUP BY gamma " \
+                   "HAVING gamma<MAX(delta)"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_duplicated_join_conditions(self):
+        condition = JoinedConditions()
+        for i in range(2):
+            column_1 = Column("alpha")
+            column_1.table = "foo"
+            column_2 = Column("alpha")
+            column_2.table = "bar"
+            condition.add_condition(column_1, column_2)
+        self.select.get_tables().add_table("bar", condition=condition)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo INNER JOIN bar ON foo.alpha=bar.alpha"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_push_down_predicates(self):
+        inner = Select()
+        inner_table = JoinedTables()
+        inner_table.add_table("bar")
+        inner.set_tables(inner_table)
+        inner.add_column("alpha")
+        inner.add_column("beta", alias="b")
+        condition = JoinedConditions()
+        column_1 = Column("alpha")
+        column_1.table = "foo"
+        column_2 = Column("alpha")
+        column_2.table = "s"
+        condition.add_condition(column_1, column_2)
+        self.select.get_tables().add_table(
+            select=inner, alias="s", condition=condition)
+        where = Where()
+        where.add_column("b", 1, table_name="s",
+                         column_type=ValueTypes.INTEGER)
+        where.add_column("gamma", 2, table_name="foo",
+                         column_type=ValueTypes.INTEGER)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo INNER JOIN " \
+                   "(SELECT alpha, beta AS b FROM bar WHERE beta=1) AS s " \
+                   "ON foo.alpha=s.alpha WHERE foo.gamma=2"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_keep_outer_join_predicates(self):
+        inner = Select()
+        inner_table = JoinedTables()
+        inner_table.add_table("bar")
+        inner.set_tables(inner_table)
+        inner.add_column("alpha")
+        condition = JoinedConditions()
+        column_1 = Column("alpha")
+        column_1.table = "foo"
+        column_2 = Column("alpha")
+        column_2.table = "s"
+        condition.add_condition(column_1, column_2)
+        self.select.get_tables().add_table(
+            select=inner, alias="s", join=JoinTypes.LEFT_JOIN,
+            condition=condition)
+        where = Where()
+        where.add_column("alpha", 1, table_name="s",
+                         column_type=ValueTypes.INTEGER)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT * FROM foo LEFT JOIN (SELECT alpha FROM bar) AS s " \
+                   "ON foo.alpha=s.alpha WHERE s.alpha=1"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+
+class ProjectionOptimizerTest(unittest.TestCase):
+    """
+    Unittest for pruning columns of sub-queries.
+    """
+    def setUp(self):
+        self.optimizer = ProjectionOptimizer()
+        self.dialect = Dialect()
+
+    @staticmethod
+    def create_subquery(table_name, columns):
+        select = Select()
+        table = JoinedTables()
+        table.add_table(table_name)
+        select.set_tables(table)
+        for column in columns:
+            select.add_column(column)
+        return select
+
+    def test_prune_subquery(self):
+        inner = self.create_subquery("bar", ["alpha", "beta", "gamma"])
+        inner.add_column("delta", aggr_func=AggregateFunctions.SUM,
+                         alias="total")
+        group_by = GroupBy()
+        group_by.add_column("alpha")
+        inner.set_group_by(group_by)
+        order_by = OrderBy()
+        order_by.add_column("total")
+        inner.set_order_by(order_by)
+        select = self.create_subquery("foo", [])
+        select.add_column("beta", "s")
+        condition = JoinedConditions()
+        column_1 = Column("alpha")
+        column_1.table = "foo"
+        column_2 = Column("alpha")
+        column_2.table = "s"
+        condition.add_condition(column_1, column_2)
+        select.get_tables().add_table(
+            select=inner, alias="s", condition=condition)
+        self.optimizer.optimize(select)
+        expected = "SELECT s.beta FROM foo INNER JOIN " \
+                   "(SELECT alpha, beta, SUM(delta) AS total FROM bar " \
+                   "GROUP BY alpha ORDER BY total) AS s ON foo.alpha=s.alpha"
+        result = select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_prune_nested_subqueries(self):
+        innermost = self.create_subquery("baz", ["alpha", "beta", "gamma"])
+        inner = Select()
+        inner_table = JoinedTables()
+        inner_table.add_table(select=innermost, alias="i")
+        inner.set_tables(inner_table)
+        inner.add_column("alpha", "i")
+        inner.add_column("beta", "i")
+        select = Select()
+        table = JoinedTables()
+        table.add_table(select=inner, alias="s")
+        select.set_tables(table)
+        select.add_column("alpha", "s")
+        where = Where()
+        where.add_column("alpha", 1, table_name="s",
+                         column_type=ValueTypes.INTEGER)
+        select.set_where(where)
+        self.optimizer.optimize(select)
+        expected = "SELECT s.alpha FROM (SELECT i.alpha FROM " \
+                   "(SELECT alpha FROM baz) AS i) AS s WHERE s.alpha=1"
+        result = select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_keep_select_all(self):
+        inner = self.create_subquery("bar", ["alpha", "beta"])
+        select = Select()
+        table = JoinedTables()
+        table.add_table(select=inner, alias="s")
+        select.set_tables(table)
+        self.optimizer.optimize(select)
+        expected = "SELECT * FROM (SELECT alpha, beta FROM bar) AS s"
+        result = select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+
+class JoinOptimizerTest(unittest.TestCase):
+    """
+    Unittest for removing redundant joined tables.
+    """
+    def setUp(self):
+        self.optimizer = JoinOptimizer()
+        self.dialect = Dialect()
+        self.select = Select()
+        self.tables = JoinedTables()
+        self.tables.add_table("foo")
+        self.select.set_tables(self.tables)
+        self.select.add_column("alpha", "foo")
+
+    def tearDown(self):
+        self.select.clear()
+
+    def add_join(self, name, unique_keys=None, join=JoinTypes.LEFT_JOIN):
+        condition = JoinedConditions()
+        column_1 = Column("alpha")
+        column_1.table = "foo"
+        column_2 = Column("id")
+        column_2.table = name
+        condition.add_condition(column_1, column_2)
+        self.tables.add_table(name, join=join, condition=condition,
+                              unique_keys=unique_keys)
+
+    def test_remove_unreferenced_join(self):
+        self.add_join("bar", [["id"]])
+        self.add_join("baz", [["id"]])
+        self.select.add_column("beta", "baz")
+        self.optimizer.optimize(self.select)
+        expected = "SELECT foo.alpha, baz.beta FROM foo " \
+                   "LEFT JOIN baz ON foo.alpha=baz.id"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_keep_referenced_join(self):
+        self.add_join("bar", [["id"]])
+        where = Where()
+        where.add_column("beta", 1, table_name="bar",
+                         column_type=ValueTypes.INTEGER)
+        self.select.set_where(where)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT foo.alpha FROM foo " \
+                   "LEFT JOIN bar ON foo.alpha=bar.id WHERE bar.beta=1"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+    def test_keep_join_without_unique_key(self):
+        self.add_join("bar")
+        self.add_join("baz", [["id", "beta"]])
+        self.add_join("qux", [["id"]], JoinTypes.INNER_JOIN)
+        self.optimizer.optimize(self.select)
+        expected = "SELECT foo.alpha FROM foo " \
+                   "LEFT JOIN bar ON foo.alpha=bar.id " \
+                   "LEFT JOIN baz ON foo.alpha=baz.id " \
+                   "INNER JOIN qux ON foo.alpha=qux.id"
+        result = self.select.to_sql(self.dialect)
+        self.assertEqual(result, expected)
+
+
+def optimizer_test_suite():
+    predicate_test = unittest.makeSuite(PredicateOptimizerTest, "test")
+    projection_test = unittest.makeSuite(ProjectionOptimizerTest, "test")
+    join_test = unittest.makeSuite(JoinOptimizerTest, "test")
+    optimizer_test = unittest.TestSuite((
+        predicate_test, projection_test, join_test))
+    return optimizer_test
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(optimizer_test_suite())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import unittest
+
+from pydbc.dml import Select
+from pydbc.parser import Parser, SQLParseError
+from pydbc import Dialect
+from pydbc import ValueTypes, CompareTypes, AggregateFunctions, JoinTypes
+
+
+class ParserTest(unittest.TestCase):
+    """
+    Unittest for parsing SQL statements into DML objects.
+    """
+    def setUp(self):
+        self.parser = Parser()
+        self.dialect = Dialect()
+
+    def assertRoundTrip(self, sql):
+        select = self.parser.parse(sql)
+        self.assertTrue(isinstance(select, Select))
+        self.assertEqual(select.to_sql(self.dialect), sql)
+        return select
+
+    def test_simple_select(self):
+        self.assertRoundTrip("SELECT * FROM foo")
+        select = self.assertRoundTrip(
+            "SELECT DISTINCT foo.alpha, SUM(foo.beta) AS sum_b FROM foo")
+        column = select.get_columns()[1]
+        self.assertEqual(column.func, AggregateFunctions.SUM)
+        self.assertEqual(column.alias, "sum_b")
+
+    def test_select_with_clauses(self):
+        select = self.assertRoundTrip(
+            "SELECT alpha, beta, gamma, delta FROM foo "
+            "WHERE alpha<=1 AND beta='bar' OR gamma IS NOT NULL "
+            "GROUP BY gamma HAVING AVG(delta)=1 OR COUNT(*)>10 "
+            "ORDER BY gamma DESC, alpha")
+        columns = select.get_where().get_columns()
+        self.assertEqual(columns[0].type, ValueTypes.INTEGER)
+        self.assertEqual(columns[0].compare, CompareTypes.LESS_THAN_OR_EQUAL)
+        self.assertEqual(columns[1].type, ValueTypes.STRING)
+        self.assertEqual(columns[2].compare, CompareTypes.NOT_NULL)
+
+    def test_like_and_in(self):
+        select = self.assertRoundTrip(
+            "SELECT * FROM foo WHERE alpha LIKE 'bar%' "
+            "AND beta NOT LIKE '%baz%' AND gamma IN (1, 2, 3) "
+            "AND delta NOT IN ('x', 'y')")
+        columns = select.get_where().get_columns()
+        self.assertEqual(columns[0].compare, CompareTypes.BEGINS_WITH)
+        self.assertEqual(columns[0].value, "bar")
+        self.assertEqual(columns[1].compare, CompareTypes.NOT_CONTAIN)
+        self.assertEqual(columns[2].value, [1, 2, 3])
+        self.assertEqual(columns[3].type, ValueTypes.STRING)
+
+    def test_joined_tables(self):
+        select = self.assertRoundTrip(
+            "SELECT f.alpha, b.beta FROM foo AS f "
+            "LEFT JOIN bar AS b ON f.alpha=b.alpha AND b.gamma>1 "
+            "INNER JOIN (SELECT alpha FROM baz WHERE beta=f.beta) AS s "
+            "ON s.alpha=f.alpha")
+        tables = select.get_tables().get_tables()
+        self.assertEqual(tables[1].join, JoinTypes.LEFT_JOIN)
+        self.assertEqual(tables[2].alias, "s")
+        self.assertTrue(isinstance(tables[2].select, Select))
+
+    def test_keywords_and_quotes(self):
+        select = self.parser.parse(
+            'select "alpha" from `foo` f left outer join [bar] b '
+            'on f.alpha = b.alpha where alpha <> 1;')
+        self.assertEqual(
+            select.to_sql(self.dialect),
+            "SELECT alpha FROM foo AS f LEFT JOIN bar AS b "
+            "ON f.alpha=b.alpha WHERE alpha!=1")
+
+    def test_parse_raw(self):
+        select = Select()
+        select.set_raw_sql("alpha FROM foo WHERE alpha=1")
+        result = Parser.parse_raw(select)
+        self.assertEqual(result.get_raw_sql(), None)
+        self.assertEqual(result.get_where().get_columns()[0].value, 1)
+
+    def test_errors(self):
+        for sql in ("SELECT FROM foo", "SELECT * FROM (SELECT * FROM foo)",
+                    "SELECT * FROM foo WHERE a LIKE 'b%c'",
+                    "SELECT * FROM foo WHERE SUM(a)=1",
+                    "SELECT * FROM foo LIMIT 1", "SELECT * FROM foo WHERE"):
+            self.assertRaises(SQLParseError, self.parser.parse, sql)
+
+
+def parser_test_suite():
+    parser_test = unittest.makeSuite(ParserTest, "test")
+    return unittest.TestSuite((parser_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(parser_test_suite())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from pydbc.dialect import Dialect, SQLiteDialect
+from pydbc.reflection import Reflector, TableMetadata, NoSuchTableError
+from pydbc import Executor
+from pydbc import SQLTypes, ValueTypes
+
+
+class CatalogCursor(object):
+    """
+    Cursor returning records of `information_schema` views.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+
+    def execute(self, sql, params):
+        self.connection.queries.append((sql, params))
+        if "information_schema.columns" in sql:
+            self.rows = [("id", "integer", "NO"),
+                         ("name", "character varying", "YES")]
+        else:
+            self.rows = [("foo_pkey", "PRIMARY KEY", "id"),
+                         ("foo_name_key", "UNIQUE", "name")]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class CatalogConnection(object):
+    def __init__(self):
+        self.queries = []
+
+    def cursor(self):
+        return CatalogCursor(self)
+
+
+class CountingConnection(object):
+    """
+    Connection counting the statements executed on a SQLite connection.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.count = 0
+
+    def cursor(self):
+        self.count += 1
+        return self.connection.cursor()
+
+
+class ReflectionTest(unittest.TestCase):
+    """
+    Unittest for reading and caching table metadata.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE foo (id INTEGER NOT NULL, name VARCHAR(32), "
+            "price DECIMAL(10, 2), data BLOB, PRIMARY KEY (id))")
+        self.connection.execute("CREATE UNIQUE INDEX idx_name ON foo (name)")
+        self.counting = CountingConnection(self.connection)
+        self.executor = Executor(self.counting, SQLiteDialect())
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.connection.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_reflect_sqlite(self):
+        table = SQLiteDialect().reflect_table(self.connection, "foo")
+        self.assertEqual([col.name for col in table.columns],
+                         ["id", "name", "price", "data"])
+        self.assertEqual([col.sql_type for col in table.columns],
+                         [SQLTypes.INTEGER, SQLTypes.VARCHAR,
+                          SQLTypes.NUMERIC, SQLTypes.BLOB])
+        self.assertEqual([col.nullable for col in table.columns],
+                         [False, True, True, True])
+        self.assertEqual(table.get_column("data").get_value_type(),
+                         ValueTypes.BINARY)
+        self.assertEqual(table.primary_key, ["id"])
+        self.assertEqual([(index.name, index.columns, index.unique)
+                          for index in table.indexes],
+                         [("idx_name", ["name"], True)])
+        self.assertEqual(table.get_unique_keys(), [["id"], ["name"]])
+        self.assertEqual(
+            SQLiteDialect().reflect_table(self.connection, "bar"), None)
+
+    def test_reflect_information_schema(self):
+        connection = CatalogConnection()
+        table = Dialect().reflect_table(connection, "foo")
+        self.assertEqual(connection.queries[0][1], ["foo"])
+        self.assertTrue(connection.queries[0][0].endswith(
+            "WHERE table_name = ? ORDER BY ordinal_position"))
+        self.assertEqual([col.sql_type for col in table.columns],
+                         [SQLTypes.INTEGER, SQLTypes.VARCHAR])
+        self.assertEqual([col.nullable for col in table.columns],
+                         [False, True])
+        self.assertEqual(table.get_unique_keys(), [["id"], ["name"]])
+
+    def test_name2type(self):
+        dialect = Dialect()
+        self.assertEqual(dialect.name2type("varchar(32)"), SQLTypes.VARCHAR)
+        self.assertEqual(dialect.name2type("Long  Varchar"),
+                         SQLTypes.LONG_VARCHAR)
+        self.assertEqual(dialect.name2type("INT"), SQLTypes.INTEGER)
+        self.assertEqual(dialect.name2type("GEOMETRY"), None)
+        sqlite = SQLiteDialect()
+        self.assertEqual(sqlite.name2type("BIGINT"), SQLTypes.INTEGER)
+        self.assertEqual(sqlite.name2type("NVARCHAR(8)"), SQLTypes.VARCHAR)
+        self.assertEqual(sqlite.name2type(""), SQLTypes.BLOB)
+        self.assertEqual(sqlite.name2type("DOUBLE"), SQLTypes.REAL)
+        self.assertEqual(sqlite.name2type("BOOLEAN"), SQLTypes.NUMERIC)
+        self.assertEqual(sqlite.name2type("DATE"), SQLTypes.DATE)
+        self.assertEqual(sqlite.name2type("datetime"), SQLTypes.TIMESTAMP)
+        self.assertEqual(dialect.name2type("DATETIME"), SQLTypes.TIMESTAMP)
+
+    def test_reflect_dates(self):
+        self.connection.execute(
+            "CREATE TABLE events (day DATE, created DATETIME, "
+            "updated TIMESTAMP)")
+        table = SQLiteDialect().reflect_table(self.connection, "events")
+        self.assertEqual([col.sql_type for col in table.columns],
+                         [SQLTypes.DATE, SQLTypes.TIMESTAMP,
+                          SQLTypes.TIMESTAMP])
+        self.assertEqual(table.get_column("created").get_value_type(),
+                         ValueTypes.DATETIME)
+
+    def test_memory_cache(self):
+        reflector = Reflector(self.executor)
+        table = reflector.get_table("foo")
+        count = self.counting.count
+        self.assertTrue(reflector.get_table("foo") is table)
+        self.assertEqual(self.counting.count, count)
+        reflector.invalidate("foo")
+        self.assertFalse(reflector.get_table("foo") is table)
+        self.assertRaises(NoSuchTableError, reflector.get_table, "bar")
+
+    def test_ttl(self):
+        reflector = Reflector(self.executor, ttl=0)
+        table = reflector.get_table("foo")
+        self.assertFalse(reflector.get_table("foo") is table)
+
+    def test_cache_file(self):
+        cache_file = os.path.join(self.temp_dir, "schema.json")
+        table = Reflector(self.executor, cache_file=cache_file).get_table(
+            "foo")
+        count = self.counting.count
+        cached = Reflector(self.executor, cache_file=cache_file).get_table(
+            "foo")
+        self.assertEqual(self.counting.count, count)
+        self.assertEqual(cached.to_dict(), table.to_dict())
+        self.assertEqual(cached.get_column("id").get_value_type(),
+                         ValueTypes.INTEGER)
+        # Broken cache files are ignored
+        with open(cache_file, "wb") as broken_file:
+            broken_file.write("{")
+        Reflector(self.executor, cache_file=cache_file).get_table("foo")
+        self.assertTrue(self.counting.count > count)
+
+    def test_concurrent_saves(self):
+        cache_file = os.path.join(self.temp_dir, "schema.json")
+        reflector = Reflector(self.executor, cache_file=cache_file)
+        reflector.get_table("foo")
+        errors = []
+
+        def invalidate():
+            try:
+                for i in range(20):
+                    reflector.invalidate("bar")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=invalidate) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(self.temp_dir), ["schema.json"])
+        count = self.counting.count
+        Reflector(self.executor, cache_file=cache_file).get_table("foo")
+        self.assertEqual(self.counting.count, count)
+
+    def test_metadata_dict(self):
+        table = SQLiteDialect().reflect_table(self.connection, "foo")
+        copied = TableMetadata.from_dict(table.to_dict())
+        self.assertEqual(copied.to_dict(), table.to_dict())
+
+
+def reflection_test_suite():
+    reflection_test = unittest.makeSuite(ReflectionTest, "test")
+    return unittest.TestSuite((reflection_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(reflection_test_suite())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import socket
+import unittest
+from cStringIO import StringIO
+
+from pydbc.dml import (
+    Column, Insert, JoinedConditions, JoinedTables, Where, OrderBy,
+    UnsupportedValueError)
+from pydbc.dialect import Dialect, SQLiteDialect
+from pydbc.render import SQLWriter
+from pydbc import ValueTypes, CompareTypes, JoinTypes
+from test.fixtures import create_select
+
+
+class CountingWriter(object):
+    def __init__(self):
+        self.pieces = []
+
+    def write(self, piece):
+        self.pieces.append(piece)
+
+
+class RenderTest(unittest.TestCase):
+    """
+    Unittest for writing SQL statements in pieces.
+    """
+    def setUp(self):
+        self.dialect = SQLiteDialect()
+
+    def create_select(self, count):
+        tables = JoinedTables()
+        tables.add_table("orders", "o")
+        condition = JoinedConditions()
+        column_1 = Column("customer_id")
+        column_1.table = "o"
+        column_2 = Column("id")
+        column_2.table = "c"
+        condition.add_condition(column_1, column_2)
+        tables.add_table("customers", "c", join=JoinTypes.LEFT_JOIN,
+                         condition=condition)
+        select = create_select(
+            [("id", "o"), ("name", "c", None, "customer")], tables, [
+                ("id", range(count), "o", ValueTypes.INTEGER,
+                 CompareTypes.IN),
+                ("status", "open", "o"), ("note", "it's", "o")])
+        order_by = OrderBy()
+        order_by.add_column("id", False, "o")
+        select.set_order_by(order_by)
+        return select
+
+    def create_insert(self, count):
+        insert = Insert()
+        insert.set_table("event")
+        insert.add_column("id", ValueTypes.INTEGER)
+        insert.add_column("name")
+        for i in range(count):
+            insert.add_row([i, None if i % 2 else u"event%d" % i])
+        return insert
+
+    def test_same_as_to_sql(self):
+        for statement in (self.create_select(2500), self.create_insert(100)):
+            for dialect in (Dialect(), self.dialect):
+                output = StringIO()
+                with SQLWriter(output, buffer_size=100) as writer:
+                    statement.write_sql(writer, dialect)
+                self.assertEqual(output.getvalue(), statement.to_sql(dialect))
+                self.assertEqual(writer.size, len(output.getvalue()))
+
+    def test_pieces(self):
+        writer = CountingWriter()
+        self.create_select(2500).write_sql(writer, self.dialect)
+        # Value lists are written in chunks instead of at once
+        self.assertTrue(len(writer.pieces) > 3)
+        self.assertTrue(max([len(piece) for piece in writer.pieces]) <
+                        Column.WRITE_CHUNK_SIZE * 6)
+        writer = CountingWriter()
+        self.create_insert(100).write_sql(writer, self.dialect)
+        self.assertEqual(len(writer.pieces), 101)
+
+    def test_buffer(self):
+        chunks = []
+        writer = SQLWriter(chunks.append, buffer_size=1000)
+        self.create_insert(1000).write_sql(writer, self.dialect)
+        writer.flush()
+        self.assertTrue(len(chunks) > 10)
+        self.assertTrue(max([len(chunk) for chunk in chunks]) < 1100)
+        self.assertEqual("".join(chunks),
+                         self.create_insert(1000).to_sql(self.dialect))
+
+    def test_socket(self):
+        sender, receiver = socket.socketpair()
+        try:
+            with SQLWriter(sender) as writer:
+                self.create_insert(3).write_sql(writer, self.dialect)
+            sender.shutdown(socket.SHUT_WR)
+            data = []
+            while True:
+                chunk = receiver.recv(4096)
+                if not chunk:
+                    break
+                data.append(chunk)
+        finally:
+            sender.close()
+            receiver.close()
+        self.assertEqual("".join(data),
+                         self.create_insert(3).to_sql(self.dialect))
+
+    def test_unsafe_value_list(self):
+        where = Where()
+        where.add_column("name", ["a", "b\x00"],
+                         compare_type=CompareTypes.IN)
+        self.assertEqual(where.to_sql(self.dialect), " WHERE ")
+        self.assertRaises(UnsupportedValueError, where.write_sql,
+                          CountingWriter(), self.dialect)
+
+    def test_compile_to(self):
+        select = self.create_select(10)
+        output = StringIO()
+        params = self.dialect.compile_to(output, select)
+        self.assertEqual((output.getvalue(), params),
+                         self.dialect.compile(select))
+
+
+def render_test_suite():
+    render_test = unittest.makeSuite(RenderTest, "test")
+    return unittest.TestSuite((render_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(render_test_suite())
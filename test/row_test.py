@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import cPickle
+import sqlite3
+import unittest
+
+from pydbc.dialect import SQLiteDialect
+from pydbc.row import Row
+from pydbc import Executor
+from test.fixtures import create_select
+
+
+class RowTest(unittest.TestCase):
+    """
+    Unittest for records accessed by column name.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE foo (id INTEGER, name TEXT)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?)",
+            [(i, "name%d" % i) for i in range(5)])
+        self.executor = Executor(self.connection, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, *columns):
+        return create_select([(column_name, None, None, alias)
+                              for column_name, alias in columns])
+
+    def test_access(self):
+        row = Row.create_type(("id", "name", "id"))((1, "a", 2))
+        self.assertEqual(row, (1, "a", 2))
+        self.assertEqual((row[0], row["name"], row.name), (1, "a", "a"))
+        self.assertEqual(row["id"], 1)
+        self.assertEqual(row[1:], ("a", 2))
+        self.assertEqual(row.get("missing", 0), 0)
+        self.assertEqual(row.keys(), ["id", "name", "id"])
+        self.assertRaises(KeyError, row.__getitem__, "missing")
+        self.assertRaises(AttributeError, getattr, row, "missing")
+        self.assertEqual(repr(row), "Row(id=1, name='a', id=2)")
+        # No dict is created for each row
+        self.assertFalse(hasattr(row, "__dict__"))
+
+    def test_shared_type(self):
+        row_type = Row.create_type(["id", "name"])
+        self.assertTrue(Row.create_type(("id", "name")) is row_type)
+        row = row_type((1, "a"))
+        self.assertEqual(row.as_dict(), {"id": 1, "name": "a"})
+        copied = cPickle.loads(cPickle.dumps(row, 2))
+        self.assertEqual(copied.name, "a")
+        self.assertTrue(type(copied) is row_type)
+
+    def test_fetchrows(self):
+        select = self.create_select(("id", "key"), ("name", None))
+        rows = self.executor.fetchrows(select)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual((rows[3].key, rows[3]["name"]), (3, "name3"))
+        self.assertTrue(type(rows[0]) is type(rows[4]))
+        rows = list(self.executor.iterrows(
+            self.create_select(("*", None)), batch_size=2))
+        self.assertEqual(rows[4].as_dict(), {"id": 4, "name": "name4"})
+
+
+def row_test_suite():
+    row_test = unittest.makeSuite(RowTest, "test")
+    return unittest.TestSuite((row_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(row_test_suite())
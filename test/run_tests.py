@@ -20,7 +20,40 @@ import unittest
 def run_tests():
     from test.base_test import base_test_suite
     from test.dml_test import dml_test_suite
-    tests = unittest.TestSuite((dml_test_suite(), base_test_suite()))
+    from test.optimizer_test import optimizer_test_suite
+    from test.serializer_test import serializer_test_suite
+    from test.parser_test import parser_test_suite
+    from test.dialect_test import dialect_test_suite
+    from test.executor_test import executor_test_suite
+    from test.lob_test import lob_test_suite
+    from test.ddl_test import ddl_test_suite
+    from test.reflection_test import reflection_test_suite
+    from test.batch_test import batch_test_suite
+    from test.loader_test import loader_test_suite
+    from test.buffer_test import buffer_test_suite
+    from test.statement_cache_test import statement_cache_test_suite
+    from test.columnar_test import columnar_test_suite
+    from test.row_test import row_test_suite
+    from test.export_test import export_test_suite
+    from test.single_flight_test import single_flight_test_suite
+    from test.metrics_test import metrics_test_suite
+    from test.slow_query_test import slow_query_test_suite
+    from test.workload_test import workload_test_suite
+    from test.render_test import render_test_suite
+    from test.literal_test import literal_test_suite
+    from test.update_test import update_test_suite
+    from test.fileutils_test import fileutils_test_suite
+    tests = unittest.TestSuite((
+        dml_test_suite(), base_test_suite(), optimizer_test_suite(),
+        serializer_test_suite(), parser_test_suite(), dialect_test_suite(),
+        executor_test_suite(), lob_test_suite(), ddl_test_suite(),
+        reflection_test_suite(), batch_test_suite(), loader_test_suite(),
+        buffer_test_suite(), statement_cache_test_suite(),
+        columnar_test_suite(), row_test_suite(), export_test_suite(),
+        single_flight_test_suite(), metrics_test_suite(),
+        slow_query_test_suite(), workload_test_suite(),
+        render_test_suite(), literal_test_suite(), update_test_suite(),
+        fileutils_test_suite()))
     unittest.TextTestRunner(verbosity=1).run(tests)
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import datetime
+import decimal
+import unittest
+import uuid
+
+from pydbc.dml import (
+    Column, JoinedConditions, JoinedTables, Where, Having, GroupBy, OrderBy,
+    Select)
+from pydbc.serializer import Serializer, SerializationError
+from pydbc import Dialect
+from pydbc import (
+    ValueTypes, CompareTypes, RelationTypes, AggregateFunctions, JoinTypes)
+
+
+class SerializerTest(unittest.TestCase):
+    """
+    Unittest for serializing DML statements.
+    """
+    def setUp(self):
+        self.dialect = Dialect()
+
+    @staticmethod
+    def create_select():
+        inner = Select()
+        inner_table = JoinedTables()
+        inner_table.add_table("bar")
+        inner.set_tables(inner_table)
+        inner.add_column("alpha")
+        inner.add_column("beta", alias="b")
+        inner.set_distinct(True)
+        tables = JoinedTables()
+        tables.add_table("foo", "f")
+        condition = JoinedConditions()
+        column_1 = Column("alpha")
+        column_1.table = "f"
+        column_2 = Column("alpha")
+        column_2.table = "s"
+        condition.add_condition(column_1, column_2)
+        tables.add_table(select=inner, alias="s", join=JoinTypes.LEFT_JOIN,
+                         condition=condition, unique_keys=[["alpha"]])
+        select = Select()
+        select.set_tables(tables)
+        select.add_column("alpha", "f")
+        select.add_column("b", "s", AggregateFunctions.COUNT, "cnt")
+        where = Where()
+        where.add_column("alpha", -10, "f", ValueTypes.INTEGER,
+                         CompareTypes.GREATER_THAN)
+        where.add_column(u"gamma", u"été", "f",
+                         relation_type=RelationTypes.OR)
+        where.add_column("delta", [1, 2, 3], "f", ValueTypes.OTHER,
+                         CompareTypes.IN)
+        select.set_where(where)
+        group_by = GroupBy()
+        group_by.add_column("alpha", "f")
+        select.set_group_by(group_by)
+        having = Having()
+        having.add_column("b", AggregateFunctions.COUNT, 1.5, "s",
+                          ValueTypes.OTHER)
+        select.set_having(having)
+        order_by = OrderBy()
+        order_by.add_column("alpha", False, "f")
+        select.set_order_by(order_by)
+        return select
+
+    def test_round_trip(self):
+        select = self.create_select()
+        data = Serializer.dumps(select)
+        self.assertTrue(data.startswith(Serializer.MAGIC))
+        result = Serializer.loads(data)
+        self.assertTrue(isinstance(result, Select))
+        self.assertEqual(result.to_sql(self.dialect),
+                         select.to_sql(self.dialect))
+        table = result.get_tables().get_tables()[1]
+        self.assertEqual(table.unique_keys, [["alpha"]])
+        self.assertEqual(table.join, JoinTypes.LEFT_JOIN)
+        self.assertEqual(result.get_where().get_columns()[1].value,
+                         u"été")
+
+    def test_round_trip_raw_sql(self):
+        where = Where()
+        where.set_raw_sql("alpha=1")
+        result = Serializer.loads(Serializer.dumps(where))
+        self.assertEqual(result.to_sql(self.dialect), " WHERE alpha=1")
+
+    def test_rich_values(self):
+        values = [
+            bytearray("\x00\xff"), memoryview("abc"),
+            decimal.Decimal("1.000000000000000000001"),
+            datetime.date(2014, 1, 2),
+            datetime.datetime(2014, 1, 2, 3, 4, 5, 678),
+            uuid.UUID(int=12345),
+        ]
+        where = Where()
+        for value in values:
+            where.add_column("alpha", value, column_type=ValueTypes.OTHER)
+        result = Serializer.loads(Serializer.dumps(where))
+        result_values = [col.value for col in result.get_columns()]
+        values[1] = "abc"
+        self.assertEqual(result_values, values)
+
+    def test_string_table(self):
+        where = Where()
+        for i in range(10):
+            where.add_column("alpha", "foo")
+        data = Serializer.dumps(where)
+        self.assertEqual(data.count("alpha"), 1)
+
+    def test_invalid_data(self):
+        data = Serializer.dumps(self.create_select())
+        self.assertRaises(SerializationError, Serializer.loads, "FOO")
+        self.assertRaises(SerializationError, Serializer.loads,
+                          data[:4] + "\xff" + data[5:])
+        self.assertRaises(SerializationError, Serializer.loads, data[:-1])
+        where = Where()
+        where.add_column("alpha", object(), column_type=ValueTypes.OTHER)
+        self.assertRaises(SerializationError, Serializer.dumps, where)
+
+
+def serializer_test_suite():
+    serializer_test = unittest.makeSuite(SerializerTest, "test")
+    return unittest.TestSuite((serializer_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(serializer_test_suite())
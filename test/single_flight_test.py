@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import threading
+import unittest
+
+from pydbc.dialect import Dialect
+from pydbc.single_flight import SingleFlight
+from pydbc import Executor
+from pydbc import ValueTypes
+from test.fixtures import create_select
+
+
+class Interrupt(BaseException):
+    pass
+
+
+class CountingDialect(Dialect):
+    compiled = 0
+
+    def compile(self, statement, paramstyle=None):
+        self.compiled += 1
+        return super(CountingDialect, self).compile(statement, paramstyle)
+
+
+class BlockingCursor(object):
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = (("name", None, None, None, None, None, None), )
+
+    def execute(self, sql, params=None):
+        with self.connection.lock:
+            self.connection.statements.append((sql, params))
+        self.connection.started.set()
+        self.connection.release.wait()
+        if self.connection.error is not None:
+            error = self.connection.error
+            if self.connection.error_once:
+                self.connection.error = None
+            raise error
+
+    def fetchall(self):
+        return [("a", ), ("b", )]
+
+    def close(self):
+        pass
+
+
+class BlockingConnection(object):
+    """
+    Connection blocking the executed statements until released.
+    """
+    def __init__(self, error=None, error_once=False):
+        self.lock = threading.Lock()
+        self.statements = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+        self.error_once = error_once
+
+    def cursor(self):
+        return BlockingCursor(self)
+
+
+class SingleFlightTest(unittest.TestCase):
+    """
+    Unittest for sharing results of identical selects in flight.
+    """
+    def create_select(self, value):
+        return create_select(
+            criteria=[("id", value, None, ValueTypes.INTEGER)])
+
+    def run_threads(self, connection, flight, values):
+        results = [None] * len(values)
+
+        def fetch(index):
+            executor = Executor(connection, single_flight=flight)
+            try:
+                results[index] = executor.fetchall(
+                    self.create_select(values[index]))
+            except BaseException as e:
+                results[index] = e
+
+        leader = threading.Thread(target=fetch, args=(0, ))
+        leader.start()
+        connection.started.wait()
+        threads = [threading.Thread(target=fetch, args=(i, ))
+                   for i in range(1, len(values))]
+        for thread in threads:
+            thread.start()
+        while True:
+            statistics = flight.get_statistics()
+            if sum(statistics.values()) == len(values):
+                break
+            leader.join(0.01)
+        connection.release.set()
+        for thread in [leader] + threads:
+            thread.join()
+        return results
+
+    def test_shared(self):
+        connection = BlockingConnection()
+        flight = SingleFlight()
+        results = self.run_threads(connection, flight, [1, 1, 1, 2])
+        self.assertEqual(len(connection.statements), 2)
+        self.assertEqual(flight.get_statistics(),
+                         {"executed": 2, "shared": 2})
+        for result in results:
+            self.assertEqual(result, [("a", ), ("b", )])
+        self.assertFalse(results[0] is results[1])
+
+    def test_error(self):
+        connection = BlockingConnection(error=ValueError("failed"))
+        flight = SingleFlight()
+        results = self.run_threads(connection, flight, [1, 1])
+        self.assertEqual(len(connection.statements), 1)
+        for result in results:
+            self.assertTrue(isinstance(result, ValueError))
+
+    def test_interrupt(self):
+        connection = BlockingConnection(error=Interrupt(), error_once=True)
+        flight = SingleFlight()
+        results = self.run_threads(connection, flight, [1, 1])
+        # Only the leader is interrupted, and the waiter executes it again
+        self.assertTrue(isinstance(results[0], Interrupt))
+        self.assertEqual(results[1], [("a", ), ("b", )])
+        self.assertEqual(len(connection.statements), 2)
+        self.assertEqual(flight.get_statistics(),
+                         {"executed": 2, "shared": 1})
+
+    def test_compiled_once(self):
+        connection = BlockingConnection()
+        connection.release.set()
+        dialect = CountingDialect()
+        executor = Executor(connection, dialect, single_flight=SingleFlight())
+        self.assertEqual(executor.fetchall(self.create_select(1)),
+                         [("a", ), ("b", )])
+        self.assertEqual(dialect.compiled, 1)
+
+    def test_completed(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+        self.assertEqual(flight.do("key", lambda: 2), 2)
+        self.assertEqual(flight.get_statistics(),
+                         {"executed": 2, "shared": 0})
+
+    def test_key(self):
+        self.assertEqual(SingleFlight.get_key("SELECT ?", [1]),
+                         ("SELECT ?", (1, )))
+        self.assertEqual(SingleFlight.get_key("SELECT :a", {"a": 1}),
+                         ("SELECT :a", (("a", 1), )))
+        self.assertEqual(SingleFlight.get_key("SELECT ?", [[1]]), None)
+
+
+def single_flight_test_suite():
+    single_flight_test = unittest.makeSuite(SingleFlightTest, "test")
+    return unittest.TestSuite((single_flight_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(single_flight_test_suite())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import unittest
+
+from pydbc.dialect import SQLiteDialect
+from pydbc.slow_query import SlowQueryLog
+from pydbc import Executor
+from pydbc import ValueTypes
+from test.fixtures import create_select
+
+
+class RecordingLog(SlowQueryLog):
+    def __init__(self, **kwargs):
+        super(RecordingLog, self).__init__(**kwargs)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class SlowQueryLogTest(unittest.TestCase):
+    """
+    Unittest for logging slow queries.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute("CREATE TABLE foo (id INTEGER, name TEXT)")
+        self.connection.executemany(
+            "INSERT INTO foo VALUES (?, ?)", [(i, "a") for i in range(5)])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def create_select(self, value):
+        return create_select(("id", ), criteria=[
+            ("id", value, None, ValueTypes.INTEGER), ("name", "a")])
+
+    def test_executor(self):
+        log = RecordingLog(threshold=0.0, explain=True)
+        executor = Executor(self.connection, SQLiteDialect(),
+                            slow_query_log=log)
+        executor.fetchall(self.create_select(3))
+        record = log.records[0]
+        self.assertEqual(
+            record["sql"], 'SELECT "id" FROM "foo" WHERE "id"=? AND "name"=?')
+        self.assertEqual(record["parameters"], ["<int>", "<str:1>"])
+        self.assertEqual(record["parameter_count"], 2)
+        self.assertEqual(record["rows"], 1)
+        self.assertEqual(record["suppressed"], 0)
+        self.assertTrue(record["call_site"].endswith("in test_executor"),
+                        record["call_site"])
+        self.assertTrue(record["plan"])
+        list(executor.iterrows(self.create_select(4)))
+        self.assertTrue(log.records[1]["call_site"].endswith(
+            "in test_executor"))
+
+    def test_threshold(self):
+        log = RecordingLog(threshold=10.0)
+        executor = Executor(self.connection, SQLiteDialect(),
+                            slow_query_log=log)
+        executor.fetchall(self.create_select(3))
+        self.assertEqual(log.records, [])
+
+    def test_rate_limit(self):
+        log = RecordingLog(max_records=2, period=3600.0)
+        for i in range(5):
+            log.record(None, None, "SELECT 1", [], 2.0, 1)
+        self.assertEqual(len(log.records), 2)
+        log._period_start = 0.0
+        log.record(None, None, "SELECT 1", [], 2.0, 1)
+        self.assertEqual(log.records[-1]["suppressed"], 3)
+
+    def test_parameters(self):
+        log = SlowQueryLog(max_parameters=2)
+        self.assertEqual(log.format_parameters([None, bytearray("ab"), 1]),
+                         [None, "<bytearray:2>"])
+        self.assertEqual(log.format_parameters({"b": 1.5, "a": u"x"}),
+                         {"a": "<unicode:1>", "b": "<float>"})
+        log = SlowQueryLog(parameters=SlowQueryLog.FULL)
+        self.assertEqual(log.format_parameters([1, "x" * 200])[1],
+                         "x" * SlowQueryLog.MAX_VALUE_LENGTH)
+        log = SlowQueryLog(parameters=SlowQueryLog.NONE)
+        self.assertEqual(log.format_parameters([1]), None)
+
+
+def slow_query_test_suite():
+    slow_query_test = unittest.makeSuite(SlowQueryLogTest, "test")
+    return unittest.TestSuite((slow_query_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(slow_query_test_suite())
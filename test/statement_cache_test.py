@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import unittest
+
+from pydbc.ddl import DropIndex
+from pydbc.dialect import Dialect
+from pydbc.statement_cache import StatementCache
+from pydbc import Executor
+from pydbc import ValueTypes
+from test.fixtures import create_select
+
+
+class PreparingDialect(Dialect):
+    paramstyle = "format"
+    prepare_statements = True
+
+
+class RecordingCursor(object):
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql, params=None):
+        self.connection.statements.append((sql, params))
+
+    def close(self):
+        pass
+
+
+class RecordingConnection(object):
+    """
+    Connection recording the executed statements.
+    """
+    def __init__(self):
+        self.statements = []
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+
+class StatementCacheTest(unittest.TestCase):
+    """
+    Unittest for caching prepared statements.
+    """
+    def setUp(self):
+        self.connection = RecordingConnection()
+        self.dialect = PreparingDialect()
+
+    def create_select(self, column_name, value):
+        return create_select(criteria=[
+            (column_name, value, None, ValueTypes.INTEGER), ("name", "a")])
+
+    def test_lru(self):
+        cache = StatementCache(self.dialect, self.connection, size=2)
+        self.assertEqual(cache.get("SELECT 1"), "pydbc_1")
+        self.assertEqual(cache.get("SELECT 2"), "pydbc_2")
+        self.assertEqual(cache.get("SELECT 1"), "pydbc_1")
+        self.assertEqual(cache.get("SELECT 3"), "pydbc_3")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(self.connection.statements, [
+            ("PREPARE pydbc_1 AS SELECT 1", None),
+            ("PREPARE pydbc_2 AS SELECT 2", None),
+            ("DEALLOCATE pydbc_2", None),
+            ("PREPARE pydbc_3 AS SELECT 3", None),
+        ])
+        self.assertEqual(cache.get_statistics(), {
+            "hits": 1, "misses": 3, "evictions": 1, "size": 2})
+        cache.clear(deallocate=False)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(len(self.connection.statements), 4)
+
+    def test_executor(self):
+        executor = Executor(self.connection, self.dialect)
+        executor.execute(self.create_select("id", 1))
+        executor.execute(self.create_select("id", 2))
+        self.assertEqual(self.connection.statements, [
+            ("PREPARE pydbc_1 AS SELECT name FROM foo "
+             "WHERE id=$1 AND name=$2", None),
+            ("EXECUTE pydbc_1 (%s, %s)", [1, "a"]),
+            ("EXECUTE pydbc_1 (%s, %s)", [2, "a"]),
+        ])
+        statistics = executor.get_statement_cache().get_statistics()
+        self.assertEqual((statistics["hits"], statistics["misses"]), (1, 1))
+
+    def test_ddl(self):
+        executor = Executor(self.connection, self.dialect)
+        executor.execute(DropIndex("foo_index"))
+        self.assertEqual(self.connection.statements, [
+            ("DROP INDEX foo_index", [])])
+        self.assertEqual(len(executor.get_statement_cache()), 0)
+
+    def test_disabled(self):
+        executor = Executor(self.connection, self.dialect,
+                            statement_cache_size=0)
+        self.assertEqual(executor.get_statement_cache(), None)
+        executor.execute(self.create_select("id", 1))
+        self.assertEqual(self.connection.statements, [
+            ("SELECT name FROM foo WHERE id=%s AND name=%s", [1, "a"])])
+        self.assertEqual(
+            Executor(self.connection, Dialect()).get_statement_cache(), None)
+
+
+def statement_cache_test_suite():
+    statement_cache_test = unittest.makeSuite(StatementCacheTest, "test")
+    return unittest.TestSuite((statement_cache_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(statement_cache_test_suite())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import sqlite3
+import unittest
+
+from pydbc.dml import (
+    JoinedConditions, JoinedTables, Where, Update, Delete, Column,
+    NoneTableNameError, UnsupportedValueError)
+from pydbc.dialect import Dialect, SQLiteDialect
+from pydbc import Executor
+from pydbc import ValueTypes, CompareTypes, JoinTypes
+
+
+class FromDialect(Dialect):
+    multi_table_update = "from"
+    multi_table_delete = "using"
+
+
+class JoinDialect(Dialect):
+    multi_table_update = "join"
+    multi_table_delete = "join"
+
+
+def create_tables():
+    tables = JoinedTables()
+    tables.add_table("customers", "c")
+    condition = JoinedConditions()
+    column_1 = Column("region_id")
+    column_1.table = "c"
+    column_2 = Column("id")
+    column_2.table = "r"
+    condition.add_condition(column_1, column_2)
+    tables.add_table("regions", "r", join=JoinTypes.INNER_JOIN,
+                     condition=condition)
+    return tables
+
+
+def create_where(region):
+    where = Where()
+    where.add_column("customer_id", "c.id", "o", ValueTypes.OTHER)
+    where.add_column("name", region, "r")
+    return where
+
+
+def create_update():
+    update = Update()
+    update.set_table("orders", "o")
+    update.add_column("status", "closed")
+    update.add_column("total", 0, ValueTypes.INTEGER)
+    update.add_column("note", None)
+    update.set_tables(create_tables())
+    update.set_where(create_where("north"))
+    return update
+
+
+class UpdateTest(unittest.TestCase):
+    """
+    Unittest for generating SQL update statements.
+    """
+    def test_single_table(self):
+        update = Update()
+        update.set_table("orders")
+        update.add_column("status", "it's")
+        where = Where()
+        where.add_column("id", [1, 2], column_type=ValueTypes.INTEGER,
+                         compare_type=CompareTypes.IN)
+        update.set_where(where)
+        self.assertEqual(
+            update.to_sql(Dialect()),
+            "UPDATE orders SET status='it''s' WHERE id IN (1, 2)")
+        self.assertEqual(
+            update.to_sql(JoinDialect()),
+            "UPDATE orders SET status='it''s' WHERE id IN (1, 2)")
+
+    def test_forms(self):
+        update = create_update()
+        joined = ("customers AS c INNER JOIN regions AS r "
+                  "ON c.region_id=r.id")
+        where = "o.customer_id=c.id AND r.name='north'"
+        cases = (
+            (Dialect(),
+             "UPDATE orders AS o SET status='closed', total=0, note=NULL "
+             "WHERE EXISTS (SELECT 1 FROM %s WHERE %s)" % (joined, where)),
+            (FromDialect(),
+             "UPDATE orders AS o SET status='closed', total=0, note=NULL "
+             "FROM %s WHERE %s" % (joined, where)),
+            (JoinDialect(),
+             "UPDATE orders AS o JOIN %s SET o.status='closed', o.total=0, "
+             "o.note=NULL WHERE %s" % (joined, where)),
+        )
+        for dialect, expected in cases:
+            self.assertEqual(update.to_sql(dialect), expected)
+        sql, params = JoinDialect().compile(update)
+        self.assertEqual(params, ["closed", 0, "north"])
+
+    def test_joined_columns(self):
+        update = Update()
+        update.set_table("orders", "o")
+        update.add_column("note", "c.name", ValueTypes.OTHER)
+        update.add_column("status", "closed")
+        update.set_tables(create_tables())
+        update.set_where(create_where("north"))
+        joined = ("customers AS c INNER JOIN regions AS r "
+                  "ON c.region_id=r.id")
+        where = "o.customer_id=c.id AND r.name=?"
+        sql, params = Dialect().compile(update)
+        self.assertEqual(
+            sql, "UPDATE orders AS o SET note=(SELECT c.name FROM %s WHERE "
+                 "%s), status=? WHERE EXISTS (SELECT 1 FROM %s WHERE %s)"
+                 % (joined, where, joined, where))
+        self.assertEqual(params, ["north", "closed", "north"])
+        self.assertEqual(
+            update.to_sql(FromDialect()),
+            "UPDATE orders AS o SET note=c.name, status='closed' FROM %s "
+            "WHERE %s" % (joined, where.replace("?", "'north'")))
+
+    def test_errors(self):
+        update = Update()
+        self.assertRaises(NoneTableNameError, update.to_sql, Dialect())
+        update.set_table("orders")
+        self.assertRaises(UnsupportedValueError, update.to_sql, Dialect())
+        update.add_column("status", "nul\x00")
+        self.assertRaises(UnsupportedValueError, update.to_sql, Dialect())
+
+
+class DeleteTest(unittest.TestCase):
+    """
+    Unittest for generating SQL delete statements.
+    """
+    def test_forms(self):
+        delete = Delete()
+        delete.set_table("orders")
+        self.assertEqual(delete.to_sql(Dialect()), "DELETE FROM orders")
+        self.assertRaises(NoneTableNameError, Delete().to_sql, Dialect())
+        delete.set_table("orders", "o")
+        delete.set_tables(create_tables())
+        delete.set_where(create_where("north"))
+        joined = ("customers AS c INNER JOIN regions AS r "
+                  "ON c.region_id=r.id")
+        where = "o.customer_id=c.id AND r.name='north'"
+        cases = (
+            (Dialect(),
+             "DELETE FROM orders AS o WHERE EXISTS "
+             "(SELECT 1 FROM %s WHERE %s)" % (joined, where)),
+            (FromDialect(),
+             "DELETE FROM orders AS o USING %s WHERE %s" % (joined, where)),
+            (JoinDialect(),
+             "DELETE o FROM orders AS o JOIN %s WHERE %s" % (joined, where)),
+        )
+        for dialect, expected in cases:
+            self.assertEqual(delete.to_sql(dialect), expected)
+
+
+class SQLiteWriteTest(unittest.TestCase):
+    """
+    Unittest for executing set-based updates and deletes on SQLite.
+    """
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.executescript("""
+            CREATE TABLE regions (id INTEGER, name TEXT);
+            CREATE TABLE customers (id INTEGER, region_id INTEGER,
+                                    name TEXT);
+            CREATE TABLE orders (id INTEGER, customer_id INTEGER,
+                                 status TEXT, total INTEGER, note TEXT);
+            INSERT INTO regions VALUES (1, 'north'), (2, 'south');
+            INSERT INTO customers VALUES (1, 1, 'x'), (2, 2, 'y'), (3, 1, 'z');
+            INSERT INTO orders VALUES (1, 1, 'open', 10, 'a'),
+                (2, 2, 'open', 20, 'b'), (3, 3, 'open', 30, 'c'),
+                (4, 2, 'open', 40, 'd');
+        """)
+        self.executor = Executor(self.connection, SQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+
+    def get_orders(self):
+        return self.connection.execute(
+            "SELECT id, status, total, note FROM orders "
+            "ORDER BY id").fetchall()
+
+    def get_dialects(self):
+        dialects = [SQLiteDialect()]
+        if SQLiteDialect.multi_table_update is not None:
+            # Check the EXISTS form as well
+            fallback = SQLiteDialect()
+            fallback.multi_table_update = None
+            dialects.append(fallback)
+        return dialects
+
+    def test_update(self):
+        for dialect in self.get_dialects():
+            self.connection.execute(
+                "UPDATE orders SET status = 'open', total = id * 10")
+            update = create_update()
+            Executor(self.connection, dialect).execute(update).close()
+            self.assertEqual(self.get_orders(), [
+                (1, "closed", 0, None), (2, "open", 20, "b"),
+                (3, "closed", 0, None), (4, "open", 40, "d")])
+
+    def test_update_joined_columns(self):
+        for dialect in self.get_dialects():
+            self.connection.execute("UPDATE orders SET note = NULL")
+            update = Update()
+            update.set_table("orders", "o")
+            update.add_column("note", "c.name", ValueTypes.OTHER)
+            update.set_tables(create_tables())
+            update.set_where(create_where("north"))
+            Executor(self.connection, dialect).execute(update).close()
+            self.assertEqual([row[3] for row in self.get_orders()],
+                             ["x", None, "z", None])
+
+    def test_delete(self):
+        delete = Delete()
+        delete.set_table("orders", "o")
+        delete.set_tables(create_tables())
+        delete.set_where(create_where("south"))
+        self.executor.execute(delete).close()
+        self.assertEqual([row[0] for row in self.get_orders()], [1, 3])
+
+
+def update_test_suite():
+    update_test = unittest.makeSuite(UpdateTest, "test")
+    delete_test = unittest.makeSuite(DeleteTest, "test")
+    sqlite_write_test = unittest.makeSuite(SQLiteWriteTest, "test")
+    return unittest.TestSuite((update_test, delete_test, sqlite_write_test))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(update_test_suite())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyleft (C) 2014 - huhamhire <me@huhamhire.com>
+# =============================================================================
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# =============================================================================
+
+__author__ = "huhamhire <me@huhamhire.com>"
+
+import datetime
+import decimal
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from cStringIO import StringIO
+
+from pydbc.batch import StatementBatch
+from pydbc.buffer import WriteBuffer
+from pydbc.dml import Insert, Select
+from pydbc.dialect import SQLiteDialect
+from pydbc.lob import LOBStream
+from pydbc.sqlutils import SQLUtils
+from pydbc.workload import WorkloadRecorder, WorkloadReplayer
+from pydbc import Executor
+from pydbc import ValueTypes
+from test.fixtures import create_select
+
+
+class RollbackCountingConnection(object):
+    """
+    Connection counting the rollbacks of another connection.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.rollbacks = 0
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.connection.rollback()
+
+
+class WorkloadTest(unittest.TestCase):
+    """
+    Unittest for recording and replaying workloads.
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.database = os.path.join(self.temp_dir, "target.db")
+        self.connection = self.connect()
+        self.connection.execute("CREATE TABLE foo (id INTEGER, name TEXT)")
+        self.connection.commit()
+
+    def tearDown(self):
+        self.connection.close()
+        shutil.rmtree(self.temp_dir)
+
+    def connect(self):
+        return sqlite3.connect(self.database)
+
+    def create_select(self, value):
+        return create_select(
+            ("id", ), criteria=[("id", value, None, ValueTypes.INTEGER)])
+
+    def create_insert(self, table_name, value):
+        insert = Insert()
+        insert.set_table(table_name)
+        insert.add_column("id", ValueTypes.INTEGER)
+        insert.add_column("name")
+        insert.add_row([value, "it's"])
+        return insert
+
+    def record(self, path):
+        with WorkloadRecorder(path) as recorder:
+            executor = Executor(self.connection, SQLiteDialect(),
+                                recorder=recorder)
+            for i in range(3):
+                executor.execute(self.create_insert("foo", i)).close()
+                executor.fetchall(self.create_select(i))
+            self.assertRaises(sqlite3.OperationalError, executor.execute,
+                              self.create_insert("bar", 1))
+            self.assertEqual(recorder.get_count(), 7)
+        self.connection.rollback()
+
+    def test_record(self):
+        path = os.path.join(self.temp_dir, "workload.jsonl.gz")
+        self.record(path)
+        entries = list(WorkloadRecorder.read(path))
+        self.assertEqual(len(entries), 7)
+        offsets = [offset for offset, statement in entries]
+        self.assertEqual(offsets, sorted(offsets))
+        self.assertEqual(
+            entries[0][1],
+            ('INSERT INTO "foo" ("id", "name") VALUES (?, ?)', [0, "it's"]))
+        self.assertTrue(isinstance(entries[1][1], Select))
+        executor = Executor(self.connection, SQLiteDialect())
+        self.assertEqual(executor.compile(entries[1][1]),
+                         executor.compile(self.create_select(0)))
+
+    def test_params(self):
+        params = [None, 1, 1.5, "text", "\xff\x00", bytearray("ab"),
+                  decimal.Decimal("1.25"), datetime.date(2014, 10, 1),
+                  datetime.datetime(2014, 10, 1, 12, 30, 0, 5)]
+        decoded = WorkloadRecorder.decode_params(
+            WorkloadRecorder.encode_params(params))
+        self.assertEqual(decoded[:4], params[:4])
+        self.assertEqual(str(decoded[4]), "\xff\x00")
+        self.assertEqual(str(decoded[5]), "ab")
+        self.assertEqual(decoded[6:], params[6:])
+        self.assertEqual(
+            WorkloadRecorder.decode_params(
+                WorkloadRecorder.encode_params({"a": 1})), {"a": 1})
+
+    def test_replay(self):
+        path = os.path.join(self.temp_dir, "workload.jsonl")
+        self.record(path)
+        replayer = WorkloadReplayer(self.connect, SQLiteDialect(), speed=0,
+                                    concurrency=2)
+        report = replayer.replay(path)
+        self.assertEqual((report["statements"], report["errors"]), (7, 1))
+        self.assertEqual(len(report["fingerprints"]), 3)
+        executor = Executor(self.connection, SQLiteDialect())
+        fingerprint = SQLUtils.get_fingerprint(
+            executor.compile(self.create_select(0))[0])
+        item = report["fingerprints"][fingerprint]
+        self.assertEqual((item["count"], item["errors"]), (3, 0))
+        self.assertTrue(item["p50"] <= item["p95"] <= item["p99"] <=
+                        item["max"])
+        count = self.connection.execute("SELECT COUNT(*) FROM foo")
+        self.assertEqual(count.fetchone()[0], 3)
+
+    def test_combined_statements(self):
+        path = os.path.join(self.temp_dir, "workload.jsonl")
+        with WorkloadRecorder(path) as recorder:
+            executor = Executor(self.connection, SQLiteDialect(),
+                                recorder=recorder)
+            with WriteBuffer(executor) as writer:
+                for i in range(3):
+                    writer.insert("foo", (("id", ValueTypes.INTEGER),
+                                          ("name", ValueTypes.STRING)),
+                                  (i, "a"))
+            batch = StatementBatch(executor)
+            batch.add(self.create_select(1))
+            batch.add(self.create_select(2))
+            self.assertEqual(batch.execute(), [[(1, )], [(2, )]])
+        self.connection.rollback()
+        entries = [statement for _, statement in WorkloadRecorder.read(path)]
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0], (
+            'INSERT INTO "foo" ("id", "name") VALUES (?, ?)',
+            [[0, "a"], [1, "a"], [2, "a"]], True))
+        self.assertTrue("UNION ALL" in entries[1][0])
+        self.assertEqual(entries[1][1], [1, 2])
+        replayer = WorkloadReplayer(self.connect, SQLiteDialect(), speed=0)
+        report = replayer.replay(path)
+        self.assertEqual((report["statements"], report["errors"]), (2, 0))
+        count = self.connection.execute("SELECT COUNT(*) FROM foo")
+        self.assertEqual(count.fetchone()[0], 3)
+
+    def test_streams(self):
+        self.connection.execute("CREATE TABLE blobs (id INTEGER, data BLOB)")
+        path = os.path.join(self.temp_dir, "workload.jsonl")
+        with WorkloadRecorder(path) as recorder:
+            executor = Executor(self.connection, SQLiteDialect(),
+                                recorder=recorder)
+            insert = Insert()
+            insert.set_table("blobs")
+            insert.add_column("id", ValueTypes.INTEGER)
+            insert.add_column("data", ValueTypes.BINARY)
+            insert.add_row([1, LOBStream(StringIO("0123456789"))])
+            executor.execute(insert).close()
+        data = self.connection.execute("SELECT data FROM blobs").fetchone()[0]
+        self.assertEqual(str(data), "0123456789")
+        entries = [statement for _, statement in WorkloadRecorder.read(path)]
+        self.assertEqual(str(entries[0][1][1]), "0123456789")
+
+    def test_many_iterator(self):
+        path = os.path.join(self.temp_dir, "workload.jsonl")
+        with WorkloadRecorder(path) as recorder:
+            executor = Executor(self.connection, SQLiteDialect(),
+                                recorder=recorder)
+            executor.execute_sql("INSERT INTO foo VALUES (?, ?)",
+                                 ((i, "a") for i in range(3)),
+                                 many=True).close()
+        count = self.connection.execute("SELECT COUNT(*) FROM foo")
+        self.assertEqual(count.fetchone()[0], 3)
+        entries = [statement for _, statement in WorkloadRecorder.read(path)]
+        self.assertEqual(entries[0][1], [[0, "a"], [1, "a"], [2, "a"]])
+
+    def test_replay_errors(self):
+        connections = []
+
+        def connect():
+            connection = RollbackCountingConnection(self.connect())
+            connections.append(connection)
+            return connection
+
+        workload = [(0.0, ("INSERT INTO bar VALUES (1)", [])),
+                    (0.0, ("INSERT INTO foo VALUES (1, 'a')", []))]
+        replayer = WorkloadReplayer(connect, SQLiteDialect(), speed=0)
+        report = replayer.replay(workload)
+        self.assertEqual((report["statements"], report["errors"]), (2, 1))
+        self.assertEqual(connections[0].rollbacks, 1)
+
+        def fail():
+            raise sqlite3.OperationalError("unable to open database file")
+
+        replayer = WorkloadReplayer(fail, SQLiteDialect(), speed=0,
+                                    concurrency=2)
+        workload.append((0.0, self.create_select(1)))
+        report = replayer.replay(workload)
+        self.assertEqual((report["statements"], report["errors"]), (3, 3))
+        self.assertEqual(len(report["fingerprints"]), 3)
+
+    def test_speed(self):
+        replayer = WorkloadReplayer(self.connect, SQLiteDialect(), speed=2.0)
+        report = replayer.replay([(0.0, ("SELECT 1", [])),
+                                  (0.2, ("SELECT 1", []))])
+        self.assertEqual(report["statements"], 2)
+        self.assertTrue(report["seconds"] >= 0.1)
+
+
+def workload_test_suite():
+    workload_test = unittest.makeSuite(WorkloadTest, "test")
+    return unittest.TestSuite((workload_test, ))
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=1).run(workload_test_suite())